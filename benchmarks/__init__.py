@@ -0,0 +1,15 @@
+"""
+Benchmarks de tiempo por frame de las utilidades de dibujo
+
+Se ejecutan contra una VirtualScreen, sin terminal:
+
+    python -m cliente.benchmarks --frames 500 --output resultados.json
+"""
+from .harness import run_benchmarks, run_scenario
+from .scenarios import SCENARIOS
+
+__all__ = [
+    "run_benchmarks",
+    "run_scenario",
+    "SCENARIOS"
+]
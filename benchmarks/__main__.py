@@ -0,0 +1,61 @@
+"""
+Ejecuta los benchmarks desde la línea de comandos
+
+    python -m cliente.benchmarks [--frames N] [--retained] [--frame-buffer] [--output archivo.json] [escenario ...]
+"""
+import argparse
+import json
+import sys
+
+from .harness import run_benchmarks
+from .scenarios import SCENARIOS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cliente.benchmarks',
+                                     description='Tiempos por frame de las utilidades print_*')
+    parser.add_argument('scenarios', nargs='*',
+                        help=f"Escenarios a ejecutar (por defecto todos): {', '.join(SCENARIOS)}")
+    parser.add_argument('--frames', type=int, default=500, help='Frames cronometrados por escenario')
+    parser.add_argument('--warmup', type=int, default=50, help='Frames de calentamiento sin medir')
+    parser.add_argument('--alloc-frames', type=int, default=100, help='Frames medidos con tracemalloc')
+    parser.add_argument('--width', type=int, default=160, help='Ancho de la pantalla virtual')
+    parser.add_argument('--height', type=int, default=50, help='Alto de la pantalla virtual')
+    parser.add_argument('--retained', action='store_true', help='Activar el modo retenido')
+    parser.add_argument('--frame-buffer', action='store_true', help='Dibujar sobre un FrameBuffer')
+    parser.add_argument('--output', default='benchmark_results.json',
+                        help="Archivo JSON de resultados ('-' para la salida estándar)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"escenarios desconocidos: {', '.join(unknown)}")
+
+    report = run_benchmarks(
+        args.scenarios,
+        frames=args.frames,
+        warmup=args.warmup,
+        alloc_frames=args.alloc_frames,
+        width=args.width,
+        height=args.height,
+        retained=args.retained,
+        frame_buffer=args.frame_buffer
+    )
+
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'escenario':<24}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'fps':>10}{'bloques netos':>15}{'pico bytes':>12}")
+    for name, result in report['results'].items():
+        frame_ms = result['frame_ms']
+        print(f"{name:<24}{frame_ms['p50']:>9.3f}{frame_ms['p95']:>9.3f}{frame_ms['p99']:>9.3f}"
+              f"{result['fps']:>10.0f}{result['net_blocks_per_frame']:>15.1f}"
+              f"{result['memory_bytes_per_frame']['peak']:>12.0f}")
+    print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == '__main__':
+    main()
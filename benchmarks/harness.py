@@ -0,0 +1,157 @@
+"""
+Medición de tiempos por frame, asignaciones de memoria y throughput de cada escenario
+"""
+import gc
+import platform
+import statistics
+import time
+import tracemalloc
+
+from ..utils.frame_buffer import FrameBuffer
+from ..utils.retained import enable_retained_mode
+from ..utils.virtual_screen import VirtualScreen
+from .scenarios import SCENARIOS
+
+
+def _percentiles(samples) -> dict:
+    """Retorna p50, p95 y p99 de una lista de muestras."""
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {'p50': value, 'p95': value, 'p99': value}
+    cuts = statistics.quantiles(samples, n=100, method='inclusive')
+    return {'p50': cuts[49], 'p95': cuts[94], 'p99': cuts[98]}
+
+
+def _snapshot():
+    """Snapshot de tracemalloc sin las asignaciones del propio tracemalloc ni del harness."""
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+
+
+def run_scenario(name: str, frames: int = 500, warmup: int = 50, alloc_frames: int = 100,
+                 width: int = 160, height: int = 50, retained: bool = False,
+                 frame_buffer: bool = False) -> dict:
+    """
+    Ejecuta un escenario y mide sus frames.
+
+    Los tiempos y la memoria se miden en pasadas separadas, porque tracemalloc
+    hace mucho más lento cada frame. La pasada de memoria repite el
+    calentamiento con tracemalloc activo: las celdas de la pantalla y las
+    cachés llenadas antes de activarlo se reemplazan por objetos rastreados en
+    los primeros frames, y eso se vería como un crecimiento por frame que no
+    existe.
+
+    tracemalloc solo ve los bloques vivos: los temporales que se crean y se
+    liberan dentro del frame no aparecen en los snapshots. Por eso los bloques
+    son netos (lo que queda al terminar el frame, cerca de 0 en régimen
+    estable) y el costo de las asignaciones temporales se mide con el pico de
+    bytes dentro del frame.
+
+    Args:
+        name (str): Nombre del escenario (ver SCENARIOS).
+        frames (int): Frames cronometrados.
+        warmup (int): Frames previos sin medir (cachés, fuentes).
+        alloc_frames (int): Frames medidos con tracemalloc (tras su propio calentamiento).
+        width (int): Ancho de la pantalla virtual.
+        height (int): Alto de la pantalla virtual.
+        retained (bool): Si es True, activa el modo retenido en la pantalla.
+        frame_buffer (bool): Si es True, los widgets dibujan sobre un FrameBuffer.
+
+    Returns:
+        dict: Tiempos por frame en milisegundos (p50, p95, p99, media), bloques
+        de memoria que quedan asignados por frame ('net_blocks_per_frame'),
+        bytes por frame (pico dentro del frame y neto), llamadas a print_at por
+        frame y frames por segundo.
+    """
+    # Las llamadas a print_at se cuentan siempre en la pantalla virtual (la "terminal")
+    virtual = VirtualScreen(width, height)
+    screen = FrameBuffer(virtual) if frame_buffer else virtual
+    renderer = enable_retained_mode(screen) if retained else None
+    render = SCENARIOS[name](screen)
+    frame_index = 0
+
+    def frame():
+        nonlocal frame_index
+        render(frame_index)
+        if renderer is not None:
+            renderer.end_frame(screen)
+        screen.refresh()
+        frame_index += 1
+
+    for _ in range(warmup):
+        frame()
+
+    # Pasada de tiempos
+    gc.collect()
+    calls_before = virtual.print_calls
+    samples = []
+    clock = time.perf_counter
+    started = clock()
+    for _ in range(frames):
+        start = clock()
+        frame()
+        samples.append(clock() - start)
+    total = clock() - started
+    print_calls = virtual.print_calls - calls_before
+
+    # Pasada de memoria: bloques que deja cada frame (diferencia entre snapshots)
+    # y pico de bytes dentro del frame
+    peak_bytes = []
+    net_bytes = []
+    net_blocks = []
+    tracemalloc.start()
+    try:
+        for _ in range(warmup):
+            frame()
+        snapshot = _snapshot()
+        for _ in range(alloc_frames):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            frame()
+            current, peak = tracemalloc.get_traced_memory()
+            peak_bytes.append(peak - before)
+            net_bytes.append(current - before)
+            following = _snapshot()
+            net_blocks.append(sum(stat.count_diff for stat in following.compare_to(snapshot, 'lineno')))
+            snapshot = following
+    finally:
+        tracemalloc.stop()
+
+    frame_ms = [sample * 1000 for sample in samples]
+    result = {
+        'frames': frames,
+        'frame_ms': dict(_percentiles(frame_ms), mean=statistics.fmean(frame_ms) if frame_ms else 0.0),
+        'net_blocks_per_frame': statistics.fmean(net_blocks) if net_blocks else 0.0,
+        'memory_bytes_per_frame': {
+            'peak': statistics.fmean(peak_bytes) if peak_bytes else 0.0,
+            'net': statistics.fmean(net_bytes) if net_bytes else 0.0
+        },
+        'print_calls_per_frame': print_calls / frames if frames else 0.0,
+        'fps': frames / total if total > 0 else 0.0
+    }
+    if renderer is not None:
+        result['retained'] = renderer.stats()
+    return result
+
+
+def run_benchmarks(names=None, **options) -> dict:
+    """
+    Ejecuta varios escenarios y arma el documento de resultados.
+
+    Args:
+        names (iterable | None): Escenarios a ejecutar; None para todos.
+        **options: Parámetros de 'run_scenario'.
+
+    Returns:
+        dict: Entorno de ejecución, opciones y resultados por escenario (serializable a JSON).
+    """
+    names = list(names) if names else list(SCENARIOS)
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'options': options,
+        'results': {name: run_scenario(name, **options) for name in names}
+    }
@@ -0,0 +1,299 @@
+"""
+Escenarios de los benchmarks
+
+Cada escenario recibe la pantalla virtual, prepara sus datos una sola vez y
+retorna la función que dibuja un frame: 'render(frame)'. Los escenarios de
+juego reproducen lo que dibujan las pantallas reales en cada frame.
+"""
+from asciimatics.event import KeyboardEvent, MouseEvent
+from asciimatics.screen import Screen
+
+from ..screens.juegos.blackjack.cartas import NUM_CARTAS, sprite_carta
+from ..screens.juegos.knucklebones.dados import atlas_dados
+from ..utils.printers import print_button, print_card, print_form, print_text
+
+
+def print_text_plano(screen):
+    data = {
+        'key': 'texto',
+        'text': 'Presiona F para salir',
+        'x-center': 0,
+        'y-center': 10,
+        'color': Screen.COLOUR_WHITE,
+    }
+
+    def render(frame):
+        print_text(screen, data)
+    return render
+
+
+def print_text_arte_ascii(screen):
+    data = {
+        'key': 'titulo',
+        'text': 'Mesa BlackJack',
+        'x-center': 0,
+        'y-center': -15,
+        'font': 'elite',
+        'justify': 'center',
+        'color': Screen.COLOUR_CYAN,
+    }
+
+    def render(frame):
+        print_text(screen, data, True)
+    return render
+
+
+def print_button_simple(screen):
+    data = {
+        'key': 'boton',
+        'text': '┌─────────────┐\n│ PEDIR CARTA │\n└─────────────┘',
+        'x-center': 0,
+        'y-center': 0,
+        'color': Screen.COLOUR_BLACK,
+        'bg': Screen.COLOUR_GREEN,
+    }
+    clicks = [MouseEvent(0, 0, 0), None]
+
+    def render(frame):
+        print_button(screen, data, clicks[frame % 2], click=lambda: True)
+    return render
+
+
+def print_card_simple(screen):
+    data = {
+        'key': 'carta',
+        'text': 'blackjack european',
+        'width': 25,
+        'height': 15,
+        'x-center': 0,
+        'y-center': 0,
+        'corner': ['╭', '╮', '╰', '╯'],
+    }
+
+    def render(frame):
+        print_card(screen, data, None, click=lambda: True)
+    return render
+
+
+def print_card_grid(screen):
+    data = {
+        'key': 'grid',
+        'width': 55,
+        'height': 27,
+        'text': '',
+        'ascii_y': '│',
+        'ascii_x': '─',
+        'grid_divider_x': 3,
+        'grid_divider_y': 3,
+        'corner': ['╭', '╮', '╰', '╯'],
+        'grid': True,
+        'x-center': 0,
+        'y-center': 0,
+        'content': {
+            str(i): {'text': f'celda {i}', 'padding-top': 1, 'padding-left': 2} for i in range(9)
+        }
+    }
+
+    def render(frame):
+        print_card(screen, data)
+    return render
+
+
+def print_form_login(screen):
+    form_config = {
+        'title': 'INICIAR SESIÓN',
+        'title_config': {
+            'font': 'slant',
+            'color': Screen.COLOUR_CYAN,
+            'x-center': 0,
+            'y': 1,
+            'justify': 'center',
+            'max-width': 75
+        },
+        'container': {
+            'width': 50,
+            'height': 18,
+            'x-center': 0,
+            'y-center': 0,
+            'corner': ['╭', '╮', '╰', '╯'],
+            'ascii_x': '─',
+            'ascii_y': '│',
+            'color': Screen.COLOUR_WHITE
+        },
+        'inputs': {
+            'usuario': {
+                'label': 'Usuario:',
+                'width': 44,
+                'height': 4,
+                'x-center': 0,
+                'y-center': -4,
+                'placeholder': 'Ingresa tu usuario',
+            },
+            'password': {
+                'label': 'Contraseña:',
+                'width': 44,
+                'height': 4,
+                'x-center': 0,
+                'y-center': 0,
+                'placeholder': 'Ingresa tu contraseña',
+                'is_password': True,
+            }
+        },
+        'buttons': {
+            'grid': True,
+            'width': 40,
+            'height': 3,
+            'x-center': 0,
+            'y-center': 5,
+            'grid_divider_x': 2,
+            'grid_divider_y': 1,
+            'content': {
+                '0': {'text': '  INICIAR SESIÓN  ', 'color': Screen.COLOUR_WHITE, 'bg': Screen.COLOUR_GREEN, 'click': lambda: None},
+                '1': {'text': '  CANCELAR  ', 'color': Screen.COLOUR_WHITE, 'bg': Screen.COLOUR_RED, 'click': lambda: None}
+            }
+        },
+        'navigation_order': ['usuario', 'password', 'btn_0', 'btn_1'],
+        'initial_focus': 'usuario'
+    }
+    # Se escribe en el campo con foco y cada 20 frames se cambia de campo con TAB
+    events = [KeyboardEvent(ord('a'))] * 19 + [KeyboardEvent(-301)]
+
+    def render(frame):
+        print_form(screen, form_config, events[frame % len(events)])
+    return render
+
+
+def mesa_blackjack(screen):
+    """Mesa de blackjack_juego: 4 manos de 3 cartas, el crupier y los botones."""
+    # Como en blackjack_juego: las manos son números de carta y el arte se busca al dibujar
+    manos = [[(i * 7 + j * 3) % NUM_CARTAS for j in range(3)] for i in range(4)]
+    crupier = [5, 11]
+    carta_oculta = (
+        '┌─────────────┐'
+        '        │ ?           │'
+        '        │             │'
+        '        │             │'
+        '        │      #      │'
+        '        │             │'
+        '        │             │'
+        '        │           ? │'
+        '        └─────────────┘'
+    )
+    posiciones = [(-65, -5), (-47, 15), (25, 15), (30, -5)]
+    posicion_crupier = (-15, -5)
+    mesa = {
+        'key': 'mesa',
+        'text': 'Mesa BlackJack',
+        'x-center': 0,
+        'y-center': -20,
+        'font': 'elite',
+        'justify': 'center',
+        'color': Screen.COLOUR_CYAN,
+    }
+    botones = [
+        {'key': 'pedir_carta', 'text': '┌─────────────┐\n│ PEDIR CARTA │\n└─────────────┘',
+         'x-center': -70, 'y-center': 18, 'color': Screen.COLOUR_BLACK, 'bg': Screen.COLOUR_GREEN},
+        {'key': 'plantarse', 'text': '┌─────────────┐\n│  PLANTARSE  │\n└─────────────┘',
+         'x-center': -70, 'y-center': 22, 'color': Screen.COLOUR_BLACK, 'bg': Screen.COLOUR_RED},
+    ]
+
+    def render(frame):
+        jugador_actual = (frame // 30) % 4
+        print_text(screen, mesa, True)
+        print_text(screen, {'key': 'sala_info', 'text': 'Sala ID: benchmark', 'x-center': 0,
+                            'y-center': -15, 'color': Screen.COLOUR_GREEN})
+        for idx, mano in enumerate(manos):
+            x_base, y_base = posiciones[idx]
+            for j, carta in enumerate(mano):
+                print_card(screen, {
+                    'key': ('carta', idx, j),
+                    'text': sprite_carta(carta),
+                    'x-center': x_base + (j * 18),
+                    'y-center': y_base,
+                    'color': Screen.COLOUR_BLACK,
+                    'bg': Screen.COLOUR_WHITE,
+                    'height': 10,
+                    'width': 15,
+                })
+            print_button(screen, {
+                'key': ('estado', idx),
+                'text': '[JUGADOR ACTIVO]' if idx == jugador_actual else '[JUGADOR ESPERANDO]',
+                'x-center': x_base,
+                'y-center': y_base - 8,
+                'color': Screen.COLOUR_BLACK,
+                'bg': Screen.COLOUR_BLUE if idx == jugador_actual else Screen.COLOUR_MAGENTA,
+            })
+        for i, carta in enumerate(crupier):
+            print_card(screen, {
+                'key': ('crupier', i),
+                'text': sprite_carta(carta) if i == 0 else carta_oculta,
+                'x-center': posicion_crupier[0] + (i * 18),
+                'y-center': posicion_crupier[1],
+                'color': Screen.COLOUR_BLACK if i == 0 else Screen.COLOUR_WHITE,
+                'bg': Screen.COLOUR_WHITE if i == 0 else Screen.COLOUR_RED,
+                'height': 10,
+                'width': 15,
+            })
+        for boton in botones:
+            print_button(screen, boton, None, click=lambda: None)
+    return render
+
+
+def tableros_knucklebones(screen):
+    """Los dos tableros 3x3 de knucklebones_juego; cada 10 frames cambia un dado."""
+    tablero = {
+        'width': 55,
+        'height': 27,
+        'text': '',
+        'ascii_y': '│',
+        'ascii_x': '─',
+        'grid_divider_x': 3,
+        'grid_divider_y': 3,
+        'corner': ['╭', '╮', '╰', '╯'],
+        'grid': True,
+        'grid_click': 'row',
+        'color': Screen.COLOUR_MAGENTA,
+    }
+    vs = {'key': 'vs', 'text': 'V.S', 'x-center': 0, 'y-center': 0, 'font': 'big_money-ne'}
+    mesas = [[0] * 9, [0] * 9]
+    tableros = []
+    for n, x_center in enumerate((-40, 40)):
+        # Como en knucklebones_juego: el tablero se crea una vez y se actualiza en su lugar
+        data = dict(tablero)
+        data['key'] = f'tablero_{n + 1}'
+        data['x-center'] = x_center
+        data['y-center'] = 0
+        data['click'] = {str(i): {'event': None, 'click': lambda i=i: str(i)} for i in range(3)}
+        data['content'] = {
+            str(i): {
+                'text': atlas_dados.cara(0),
+                'padding-top': 1,
+                'padding-left': 2,
+                'color': Screen.COLOUR_DEFAULT,
+            } for i in range(9)
+        }
+        tableros.append(data)
+
+    def render(frame):
+        if frame % 10 == 0:
+            paso = frame // 10
+            tablero, celda = paso % 2, paso % 9
+            mesas[tablero][celda] = paso % 7
+            tableros[tablero]['content'][str(celda)]['text'] = atlas_dados.cara(paso % 7)
+        print_text(screen, vs, True)
+        for data in tableros:
+            print_card(screen, data)
+    return render
+
+
+# Escenarios disponibles: nombre -> función que prepara el escenario
+SCENARIOS = {
+    'print_text': print_text_plano,
+    'print_text_ascii_art': print_text_arte_ascii,
+    'print_button': print_button_simple,
+    'print_card': print_card_simple,
+    'print_card_grid': print_card_grid,
+    'print_form': print_form_login,
+    'blackjack_mesa': mesa_blackjack,
+    'knucklebones_tableros': tableros_knucklebones,
+}
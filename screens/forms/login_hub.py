@@ -1,13 +1,16 @@
 from asciimatics.screen import Screen
 
-from ...utils.events import add_key_listener
+from ...utils.events import Keymap
+from ...utils.frame_loop import FrameLoop
 from ...utils.printers import print_card
+from ...utils.retained import enable_retained_mode
 
 
 def login_hub(screen):
     screen.mouse = True
     
     card_registro_data={
+        'key': 'card_registro',
         'text': 'registrarse',
         'x-center': -15,
         'y-center': 0,
@@ -18,6 +21,7 @@ def login_hub(screen):
     }
     
     card_iniciar_sesion_data = {
+        'key': 'card_iniciar_sesion',
         'text': 'iniciar sesion',
         'x-center': 15,
         'y-center': 0,
@@ -29,9 +33,15 @@ def login_hub(screen):
 
 
     screen.clear()
+    # Modo retenido: las cartas solo se redibujan si cambian
+    renderer = enable_retained_mode(screen)
+    loop = FrameLoop(screen)
+    keymap = Keymap()
+    keymap.bind(ord('f'), lambda: 'salir')
     while True:
+        renderer.end_frame(screen)
         screen.refresh()
-        event = screen.get_event()
+        event = loop.next_event()
         card_registro = print_card(screen, card_registro_data, event, click=lambda: True)
         card_iniciar_sesion = print_card(screen, card_iniciar_sesion_data , event, click=lambda: True)
 
@@ -41,6 +51,6 @@ def login_hub(screen):
             return 'iniciar_sesion'
 
 
-        salir = add_key_listener(ord('f'), event, lambda: 'salir')
+        salir = keymap.dispatch(event)
         if salir == 'salir':
             return 'salir'
\ No newline at end of file
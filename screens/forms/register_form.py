@@ -13,6 +13,8 @@ from asciimatics.screen import Screen
 from asciimatics.event import MouseEvent, KeyboardEvent
 
 # Importaciones locales
+from ...utils.events import Keymap
+from ...utils.frame_loop import FrameLoop
 from ...utils.printers import print_form, print_text
 from ...utils.user_session import UserSessionManager
 
@@ -268,10 +270,16 @@ async def register_form(screen):
     }
     
     # Loop principal del formulario
+    loop = FrameLoop(screen)
+    # Keymap compartido: las teclas del formulario tienen prioridad sobre las de la pantalla
+    keymap = Keymap()
+    keymap.bind(27, lambda: 'salir')
+    form_config['keymap'] = keymap
     while True:
         # Renderizar el formulario
-        event = screen.get_event()
+        event = loop.next_event()
         form_result = print_form(screen, form_config, event)
+        salida = keymap.dispatch(event)
         
         # Mostrar mensaje de estado de registro si existe
         if auth_state['message']:
@@ -305,5 +313,5 @@ async def register_form(screen):
                 return {'success': False, 'action': 'cancel'}
         
         # Manejar tecla ESC para salir
-        if event and hasattr(event, 'key_code') and event.key_code == 27:
+        if salida == 'salir':
             return {'success': False, 'action': 'exit'}
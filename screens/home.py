@@ -1,12 +1,15 @@
 from asciimatics.screen import Screen
 
-from ..utils.events import add_key_listener
+from ..utils.events import Keymap
+from ..utils.frame_loop import FrameLoop
 from ..utils.printers import print_card
+from ..utils.retained import enable_retained_mode
 
 def home(screen):
     screen.mouse = True
     
     card_poker_data={
+        'key': 'card_poker',
         'text': 'poker texas hold\'em',
         'x-center': -30,
         'y-center': 0,
@@ -17,6 +20,7 @@ def home(screen):
     }
     
     card_blackjack_data = {
+        'key': 'card_blackjack',
         'text': 'blackjack european',
         'x-center': 0,
         'y-center': 0,
@@ -27,6 +31,7 @@ def home(screen):
     }
 
     card_knucklebones_data = {
+        'key': 'card_knucklebones',
         'text': 'knucklebones',
         'x-center': 30,
         'y-center': 0,
@@ -37,9 +42,15 @@ def home(screen):
     }
 
     screen.clear()
+    # Modo retenido: las cartas solo se redibujan si cambian
+    renderer = enable_retained_mode(screen)
+    loop = FrameLoop(screen)
+    keymap = Keymap()
+    keymap.bind(ord('f'), lambda: 'salir')
     while True:
+        renderer.end_frame(screen)
         screen.refresh()
-        event = screen.get_event()
+        event = loop.next_event()
         card_poker = print_card(screen, card_poker_data, event, click=lambda: True)
         card_blackjack = print_card(screen, card_blackjack_data , event, click=lambda: True)
         card_knucklebones = print_card(screen, card_knucklebones_data, event, click=lambda: True)
@@ -51,6 +62,6 @@ def home(screen):
         if card_knucklebones['result']:
             return 'knucklebones'
         
-        salir = add_key_listener(ord('f'), event, lambda: 'salir')
+        salir = keymap.dispatch(event)
         if salir == 'salir':
             return 'salir'
\ No newline at end of file
@@ -1,11 +1,15 @@
 from asciimatics.screen import Screen
 
 
-from ..utils.events import add_key_listener
+from ..utils.ascii_art import font_pool
+from ..utils.events import Keymap
+from ..utils.frame_loop import FrameLoop
 from ..utils.printers import print_button, print_text
 
 def inicio(screen):
     screen.mouse = True
+    # Precargar las fuentes de las demás pantallas mientras se muestra la portada
+    font_pool.warm_up(background=True)
     screen.clear()
     contador = [0]
     text = {
@@ -23,10 +27,13 @@ def inicio(screen):
         'color': Screen.COLOUR_WHITE,
         'bg': Screen.COLOUR_BLUE
     }
+    loop = FrameLoop(screen)
+    keymap = Keymap()
+    keymap.bind([10, 13], lambda: (contador.__setitem__(0, contador[0] + 1)))
     while True:
         screen.refresh()
         print_text(screen, text, True)
-        event = screen.get_event()  # Solo aquí
+        event = loop.next_event()  # Solo aquí
         button_inicio = print_button(
             screen,
             boton_text,
@@ -37,5 +44,5 @@ def inicio(screen):
         if button_inicio['result']:
             return button_inicio['result']
         # Escuchar Enter como 10 y 13
-        add_key_listener([10, 13], event, lambda: (contador.__setitem__(0, contador[0] + 1)))
+        keymap.dispatch(event)
 
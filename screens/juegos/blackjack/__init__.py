@@ -7,6 +7,9 @@ Contiene todas las pantallas y utilidades relacionadas con el juego de Blackjack
 from .blackjack_inicio import blackjack_inicio
 from .blackjack_juego import blackjack_juego
 from .cartas import mostrar_cartas_en_linea, sacar_carta, cartas, mazo
+from .zapato import Zapato, obtener_zapato, mover_zapato, descartar_zapato
+from .mano import Mano
+from .probabilidad import ComposicionZapato
 from . import blackjack_shared
 
 __all__ = [
@@ -15,5 +18,11 @@ __all__ = [
     'mostrar_cartas_en_linea',    'sacar_carta',
     'cartas',
     'mazo',
+    'Zapato',
+    'obtener_zapato',
+    'mover_zapato',
+    'descartar_zapato',
+    'Mano',
+    'ComposicionZapato',
     'blackjack_shared'
 ]
\ No newline at end of file
@@ -1,9 +1,10 @@
-from ....utils.events import add_key_listener
+from ....utils.events import Keymap
+from ....utils.frame_loop import FrameLoop
 from ....utils.printers import print_text, print_button
 from asciimatics.screen import Screen
 import pyfiglet
 import random
-from ....utils.async_wrapper import AsyncScreenManager
+from ....utils.async_wrapper import network_runtime
 
 # Importar el módulo compartido para evitar importación circular
 from . import blackjack_shared
@@ -20,11 +21,13 @@ def blackjack_inicio(screen):
     screen.clear()
     screen.mouse = True 
     
-    # Usar AsyncScreenManager para manejar asyncio
-    async_manager = AsyncScreenManager()
+    # Operaciones de red de esta pantalla sobre el loop de red compartido
+    red = network_runtime.scope('blackjack_inicio')
     
     # Estado de la pantalla
     estado = {"creando_sala": False, "error": None, "sala_creada": False, "sala_id": None}
+    # Sala que se está creando en segundo plano: (futuro, blackjack, usuario)
+    creacion = None
     
     text = {
         'text': 'BlackJack',
@@ -43,18 +46,10 @@ def blackjack_inicio(screen):
         'bg': Screen.COLOUR_RED,
     }
     
-    def ejecutar_asyncio(coro):
-        """Ejecuta una corrutina de forma síncrona usando AsyncScreenManager"""
-        try:
-            return async_manager.run_async(coro)
-        except Exception as e:
-            print(f"Error en asyncio: {e}")
-            return None
-    
     async def crear_sala_firestore(blackjack_instance, usuario):
         """Crea la sala activa en Firestore"""
         try:
-            servicio = SalaDeJuegoServicio()
+            servicio = network_runtime.client('salas', SalaDeJuegoServicio)
             
             # Preparar datos de la sala
             datos_sala = {
@@ -81,7 +76,8 @@ def blackjack_inicio(screen):
             return None
 
     def crear_sala():
-        """Crear nueva sala ACTIVA usando BlackJack con Firestore"""
+        """Crear nueva sala ACTIVA usando BlackJack con Firestore (sin bloquear la pantalla)"""
+        nonlocal creacion
         estado["creando_sala"] = True
         estado["error"] = None
         
@@ -113,36 +109,65 @@ def blackjack_inicio(screen):
             # Guardar en el módulo compartido
             blackjack_shared.set_game_state(blackjack_instance, jugador_actual)
             
-            # Crear sala activa en Firestore
+            # Crear sala activa en Firestore en segundo plano; el bucle revisa el futuro.
+            # No pertenece al ámbito de la pantalla: si se sale antes, la sala se elimina al crearse
             print("🚀 Creando sala activa en Firestore...")
-            sala_id = ejecutar_asyncio(crear_sala_firestore(blackjack_instance, jugador_actual))
-            
-            if sala_id:
-                print(f"✅ Sala creada exitosamente: {sala_id}")
-                estado["sala_creada"] = True
-                estado["sala_id"] = sala_id
-                
-                # ACTUALIZAR con el sala_id
-                blackjack_shared.set_game_state(blackjack_instance, jugador_actual, sala_id)
-                
-                # Cerrar async_manager antes de pasar a otra pantalla
-                async_manager.close()
-                
-                # Importar y llamar directamente a blackjack_juego
-                from .blackjack_juego import blackjack_juego
-                return blackjack_juego(screen)
-            else:
-                estado["error"] = "❌ Error creando sala activa en Firestore"
-                return None
+            futuro = network_runtime.submit(crear_sala_firestore(blackjack_instance, jugador_actual))
+            creacion = (futuro, blackjack_instance, jugador_actual)
+            return None
                 
         except Exception as e:
             estado["error"] = f"❌ Error: {str(e)}"
+            estado["creando_sala"] = False
             print(f"Error completo: {e}")
             import traceback
             traceback.print_exc()
             return None
-        finally:
-            estado["creando_sala"] = False
+
+    def revisar_creacion():
+        """Revisa sin bloquear si terminó la creación de la sala"""
+        nonlocal creacion
+        futuro, blackjack_instance, jugador_actual = creacion
+        if not futuro.done():
+            return None
+        creacion = None
+        estado["creando_sala"] = False
+        sala_id = None if futuro.cancelled() else futuro.result()
+        
+        if sala_id:
+            print(f"✅ Sala creada exitosamente: {sala_id}")
+            estado["sala_creada"] = True
+            estado["sala_id"] = sala_id
+            
+            # ACTUALIZAR con el sala_id
+            blackjack_shared.set_game_state(blackjack_instance, jugador_actual, sala_id)
+            
+            # Cancelar lo pendiente de esta pantalla antes de pasar a otra
+            red.close()
+            
+            # Importar y llamar directamente a blackjack_juego
+            from .blackjack_juego import blackjack_juego
+            return blackjack_juego(screen)
+        estado["error"] = "❌ Error creando sala activa en Firestore"
+        return None
+
+    def eliminar_sala_huerfana(futuro):
+        """Elimina la sala que se terminó de crear después de salir de la pantalla (hilo de red)"""
+        if futuro.cancelled() or futuro.exception() is not None or not futuro.result():
+            return
+        servicio = network_runtime.client('salas', SalaDeJuegoServicio)
+        network_runtime.submit(servicio.eliminar_sala_de_juego(futuro.result()), wake=False)
+
+    def abandonar_creacion():
+        """Al salir con una sala en creación, la deja a cargo de eliminar_sala_huerfana"""
+        nonlocal creacion
+        if creacion is not None:
+            futuro, creacion = creacion[0], None
+            futuro.add_done_callback(eliminar_sala_huerfana)
+
+    loop = FrameLoop(screen)
+    keymap = Keymap()
+    keymap.bind(ord('f'), lambda: 'salir')
 
     try:
         while True:
@@ -186,7 +211,13 @@ def blackjack_inicio(screen):
             }
             print_text(screen, instrucciones)
             
-            event = screen.get_event()
+            event = loop.next_event()
+            
+            # Sala en creación: pasar al juego apenas Firestore responda
+            if creacion is not None:
+                siguiente = revisar_creacion()
+                if siguiente:
+                    return siguiente
             
             # Botón iniciar (solo si no está creando sala)
             if not estado["creando_sala"]:
@@ -202,23 +233,24 @@ def blackjack_inicio(screen):
                     return button_inicio['result']
             
             # Tecla para salir
-            salir = add_key_listener(ord('f'), event, lambda: 'salir')
+            salir = keymap.dispatch(event)
             if salir == 'salir':
                 # Limpiar estado al salir
                 blackjack_shared.clear_game_state()
-                async_manager.close()
+                red.close()
                 return 'salir'
     
     except KeyboardInterrupt:
         print("🛑 Pantalla interrumpida por el usuario")
         blackjack_shared.clear_game_state()
-        async_manager.close()
+        red.close()
         return 'salir'
     except Exception as e:
         print(f"❌ Error inesperado en blackjack_inicio: {e}")
         blackjack_shared.clear_game_state()
-        async_manager.close()
+        red.close()
         return 'salir'
     finally:
-        # Asegurar que el async manager se cierre
-        async_manager.close()
+        # Asegurar que se cancele lo pendiente de esta pantalla
+        abandonar_creacion()
+        red.close()
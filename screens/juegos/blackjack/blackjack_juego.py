@@ -1,10 +1,17 @@
-from cliente.utils.events import add_key_listener
+from cliente.utils.events import Keymap
+from cliente.utils.frame_loop import FrameLoop
 from cliente.utils.printers import print_text,print_button,print_card
+from cliente.utils.retained import enable_retained_mode
+from cliente.utils.text_block import TextBlock
+from cliente.utils.write_behind import WriteBehindQueue
 from asciimatics.screen import Screen
 import pyfiglet
-from cliente.screens.juegos.blackjack.cartas import sacar_carta
+from cliente.screens.juegos.blackjack.cartas import sprite_carta
+from cliente.screens.juegos.blackjack.mano import Mano
+from cliente.screens.juegos.blackjack.probabilidad import ComposicionZapato
+from cliente.screens.juegos.blackjack.zapato import descartar_zapato, mover_zapato, obtener_zapato
 from . import blackjack_shared
-from cliente.utils.async_wrapper import AsyncScreenManager
+from cliente.utils.async_wrapper import network_runtime
 
 # Importar el backend del BlackJack
 import sys
@@ -20,8 +27,8 @@ def blackjack_juego(screen):
     screen.clear()
     screen.mouse=True
     
-    # Usar AsyncScreenManager para manejar el event loop de forma segura
-    async_manager = AsyncScreenManager()
+    # Operaciones de red de esta pantalla sobre el loop de red compartido
+    red = network_runtime.scope('blackjack_juego')
     
     # Obtener la instancia del juego desde el estado compartido (YA DEBE EXISTIR)
     game_state = blackjack_shared.get_game_state()
@@ -29,17 +36,17 @@ def blackjack_juego(screen):
     # Verificar que game_state no sea None y que sea una tupla/lista
     if game_state is None:
         print("❌ Error: No hay estado de juego. Volviendo a inicio...")
-        async_manager.close()
+        red.close()
         return 'blackjack_inicio'
     
     if not isinstance(game_state, (tuple, list)):
         print("❌ Error: Estado de juego inválido (no es tupla). Volviendo a inicio...")
-        async_manager.close()
+        red.close()
         return 'blackjack_inicio'
     
     if len(game_state) < 2:
         print("❌ Error: Estado de juego incompleto. Volviendo a inicio...")
-        async_manager.close()
+        red.close()
         return 'blackjack_inicio'
     
     # Ahora sí desempaquetar de forma segura
@@ -53,7 +60,7 @@ def blackjack_juego(screen):
         # Verificar que las instancias no sean None
         if blackjack_instance is None or jugador_actual_usuario is None:
             print("❌ Error: Instancias de juego inválidas. Volviendo a inicio...")
-            async_manager.close()
+            red.close()
             return 'blackjack_inicio'
             
         print(f"🎮 Usando juego existente para usuario: {jugador_actual_usuario.get_nombre()}")
@@ -65,16 +72,16 @@ def blackjack_juego(screen):
     except (ValueError, TypeError, AttributeError) as e:
         print(f"❌ Error desempaquetando estado de juego: {e}")
         print("❌ Volviendo a inicio...")
-        async_manager.close()
+        red.close()
         return 'blackjack_inicio'
     
-    # Servicio para gestionar Firestore
-    servicio_sala = SalaDeJuegoServicio()
+    # Servicio para gestionar Firestore (compartido entre pantallas)
+    servicio_sala = network_runtime.client('salas', SalaDeJuegoServicio)
     
     def ejecutar_asyncio(coro):
-        """Ejecuta una corrutina de forma síncrona usando AsyncScreenManager"""
+        """Ejecuta una corrutina en el loop de red y espera su resultado"""
         try:
-            return async_manager.run_async(coro)
+            return red.run(coro)
         except Exception as e:
             print(f"Error en asyncio: {e}")
             return None
@@ -106,7 +113,7 @@ def blackjack_juego(screen):
         
         if not sala_id:
             print("❌ No se encontró sala activa. Volviendo a inicio...")
-            async_manager.close()
+            red.close()
             return 'blackjack_inicio'
         
         print(f"✅ Sala encontrada: {sala_id}")
@@ -114,27 +121,36 @@ def blackjack_juego(screen):
         # Actualizar el estado compartido con la sala_id encontrada
         blackjack_shared.set_game_state(blackjack_instance, jugador_actual_usuario, sala_id)
     
-    async def actualizar_estado_firestore():
-        """Actualiza el estado del juego en Firestore"""
+    async def escribir_estado_firestore(id_sala, datos_actualizacion):
+        """
+        Escribe el estado del juego en Firestore (desde el hilo de la cola).
+
+        No imprime ni captura errores: corre en segundo plano y la cola los
+        cuenta y guarda en stats()['errors'] y last_error.
+        """
+        await servicio_sala.actualizar_sala_de_juego(id_sala, datos_actualizacion)
+
+    # Las escrituras de estado se agrupan y se envían en segundo plano: los clics no esperan a la red
+    cola_estado = WriteBehindQueue(escribir_estado_firestore, interval=0.5, name='blackjack-estado',
+                                   runtime=network_runtime)
+
+    def actualizar_estado_firestore():
+        """Encola el estado actual del juego; al terminar la ronda se envía de inmediato"""
         if sala_id:
-            try:
-                datos_actualizacion = {
-                    'manos_jugadores': {f'jugador_{i+1}': manos_backend[i] for i in range(4)},
-                    'mano_crupier': mano_crupier_backend,
-                    'turno_actual': jugador_actual,
-                    'jugadores_plantados': plantados,
-                    'cartas_reveladas': cartas_reveladas,
-                    'juego_terminado': juego_terminado,
-                    'resultados': resultados if juego_terminado else []
-                }
-                
-                await servicio_sala.actualizar_sala_de_juego(sala_id, datos_actualizacion)
-                print(f"🔄 Estado actualizado en Firestore")
-                
-            except Exception as e:
-                print(f"❌ Error actualizando estado: {e}")
+            # Copias: el estado sigue cambiando mientras la escritura espera en la cola
+            cola_estado.submit(sala_id, {
+                'manos_jugadores': {f'jugador_{i+1}': list(jugadores[i]) for i in range(4)},
+                'mano_crupier': list(crupier),
+                'turno_actual': jugador_actual,
+                'jugadores_plantados': list(plantados),
+                'cartas_reveladas': cartas_reveladas,
+                'juego_terminado': juego_terminado,
+                'resultados': list(resultados) if juego_terminado else []
+            })
+            if juego_terminado:
+                cola_estado.flush()
 
-    async def finalizar_sala():
+    async def finalizar_sala(sala_id, resultados):
         """Finaliza el juego y elimina la sala de Firestore"""
         if sala_id:
             try:
@@ -189,42 +205,32 @@ def blackjack_juego(screen):
         except Exception as e:
             print(f"❌ Error creando nueva sala: {e}")
             return None
-    
-    # Definir funciones de respaldo ANTES de usarlas
-    def extraer_valor_fallback(carta_frontend):
-        """Función de respaldo para extraer valor de carta si blackjack_instance es None"""
-        import re
-        
-        # Buscar patrones de valores en el texto de la carta
-        match_10 = re.search(r'│10', carta_frontend)
-        if match_10:
-            return '10'
-        
-        match = re.search(r'│([A-K2-9])', carta_frontend)
-        if match:
-            valor = match.group(1)
-            # Verificar que sea un valor válido
-            cartas_validas = {"2":2,"3":3,"4":4,"5":5,"6":6,"7":7,"8":8,"9":9,"10":10,
-                             "J":10,"Q":10,"K":10,"A":11}
-            if valor in cartas_validas:
-                return valor
-        
-        # Si no se encuentra, retornar valor por defecto
-        import random
-        return random.choice(['2','3','4','5','6','7','8','9','10','J','Q','K','A'])
-
-    def calcular_puntos_fallback(mano):
-        """Función de respaldo para calcular puntos si blackjack_instance es None"""
-        cartas_valores = {"2":2,"3":3,"4":4,"5":5,"6":6,"7":7,"8":8,"9":9,"10":10,
-                         "J":10,"Q":10,"K":10,"A":11}
-        
-        puntos = sum(cartas_valores.get(carta, 0) for carta in mano)
-        # Si hay un As y los puntos son mayores a 21, resta 10 puntos
-        if 'A' in mano and puntos > 21:
-            puntos -= 10
-        return puntos
+
+    async def rotar_sala(id_sala, resultados_finales):
+        """Envía el último estado, finaliza la sala de la ronda y crea la de la siguiente"""
+        # La cola escribe en este mismo loop de red: esperarla desde otro hilo
+        await asyncio.to_thread(cola_estado.flush, True)
+        await finalizar_sala(id_sala, resultados_finales)
+        return await crear_nueva_sala()
+
+    async def cerrar_sala(id_sala, resultados_finales, rotacion_pendiente):
+        """Envía lo pendiente, cierra la cola y finaliza la sala al salir"""
+        if rotacion_pendiente is not None:
+            # El cambio de ronda ya finaliza la sala actual: falta finalizar la nueva (si se creó)
+            try:
+                id_sala = await asyncio.wrap_future(rotacion_pendiente)
+            except Exception:
+                id_sala = None
+            resultados_finales = []
+        await asyncio.to_thread(cola_estado.close)
+        await finalizar_sala(id_sala, resultados_finales)
+
+    # Operaciones de red que el bucle revisa sin bloquear: cambio de ronda y salida
+    rotacion = None
+    salida = None
     
     mesa = {
+        'key': 'mesa',
         'text': 'Mesa BlackJack',
         'x-center': 0,
         'y-center': -20,
@@ -234,9 +240,11 @@ def blackjack_juego(screen):
     }
 
     boton_pedirCarta ={
-        'text': '┌─────────────┐\n'
-                '│ PEDIR CARTA │\n'
-                '└─────────────┘',
+        'key': 'pedir_carta',
+        # Texto constante: se separa y se mide una sola vez
+        'text': TextBlock('┌─────────────┐\n'
+                          '│ PEDIR CARTA │\n'
+                          '└─────────────┘'),
         'x-center': -70,
         'y-center': 18,
         'color': Screen.COLOUR_BLACK,
@@ -244,9 +252,10 @@ def blackjack_juego(screen):
     }
 
     boton_plantarse ={
-        'text': '┌─────────────┐\n'
-                '│  PLANTARSE  │\n'
-                '└─────────────┘',
+        'key': 'plantarse',
+        'text': TextBlock('┌─────────────┐\n'
+                          '│  PLANTARSE  │\n'
+                          '└─────────────┘'),
         'x-center': -70,
         'y-center': 22,
         'color': Screen.COLOUR_BLACK,
@@ -254,9 +263,10 @@ def blackjack_juego(screen):
     }
 
     boton_revelar_cartas = {
-        'text': '┌─────────────┐\n'
-                '│REVELAR CARTA│\n'
-                '└─────────────┘',
+        'key': 'revelar_cartas',
+        'text': TextBlock('┌─────────────┐\n'
+                          '│REVELAR CARTA│\n'
+                          '└─────────────┘'),
         'x-center': -70,
         'y-center': 26,
         'color': Screen.COLOUR_BLACK,
@@ -285,36 +295,18 @@ def blackjack_juego(screen):
         for i in range(4)
     ]
     
-    # Inicializar manos sincronizando frontend y backend
-    manos_backend = []
-    jugadores = []
+    # Zapato de 6 mazos propio de la sala
+    zapato = obtener_zapato(sala_id)
+    zapato.nueva_ronda()
     
-    for i in range(4):
-        # Generar cartas del frontend primero
-        mano_frontend = [sacar_carta(), sacar_carta()]
-        jugadores.append(mano_frontend)
-        
-        # Extraer valores del frontend y crear mano backend correspondiente
-        mano_backend = []
-        for carta_frontend in mano_frontend:
-            # Verificar que blackjack_instance no sea None antes de usar sus métodos
-            if blackjack_instance is not None:
-                valor_backend = blackjack_instance.extraer_valor_carta(carta_frontend)
-            else:
-                # Fallback: extraer valor manualmente
-                valor_backend = extraer_valor_fallback(carta_frontend)
-            mano_backend.append(valor_backend)
-        manos_backend.append(mano_backend)
+    # Manos de números de carta con su puntaje al día; el arte solo se busca al dibujar
+    jugadores = [Mano([zapato.sacar(), zapato.sacar()]) for i in range(4)]
     
-    # Mano del crupier sincronizada
-    crupier = [sacar_carta(), sacar_carta()]  # Frontend
-    mano_crupier_backend = []  # Backend correspondiente
-    for carta_frontend in crupier:
-        if blackjack_instance is not None:
-            valor_backend = blackjack_instance.extraer_valor_carta(carta_frontend)
-        else:
-            valor_backend = extraer_valor_fallback(carta_frontend)
-        mano_crupier_backend.append(valor_backend)
+    # Mano del crupier
+    crupier = Mano([zapato.sacar(), zapato.sacar()])
+
+    # Cartas que todavía no se vieron, para las probabilidades del jugador activo
+    composicion = ComposicionZapato(zapato.mazos)
 
     plantados = [False] * 4
     cartas_reveladas = False
@@ -332,7 +324,7 @@ def blackjack_juego(screen):
     jugador_actual = 0
 
     # Actualizar estado inicial en Firestore
-    ejecutar_asyncio(actualizar_estado_firestore())
+    actualizar_estado_firestore()
 
     def avanzar_turno():
         nonlocal jugador_actual, juego_terminado, cartas_reveladas
@@ -347,34 +339,20 @@ def blackjack_juego(screen):
                 juego_terminado = True
         
         # Actualizar estado en Firestore
-        ejecutar_asyncio(actualizar_estado_firestore())
+        actualizar_estado_firestore()
 
     def pedir_carta_backend():
         """Pedir carta usando la lógica del backend"""
         if not plantados[jugador_actual] and not juego_terminado:
-            # Generar carta del frontend
-            nueva_carta_frontend = sacar_carta()
-            jugadores[jugador_actual].append(nueva_carta_frontend)
-            
-            # Extraer valor y agregarlo al backend
-            if blackjack_instance is not None:
-                valor_backend = blackjack_instance.extraer_valor_carta(nueva_carta_frontend)
-            else:
-                valor_backend = extraer_valor_fallback(nueva_carta_frontend)
-            manos_backend[jugador_actual].append(valor_backend)
-            
-            # Verificar puntos usando método del backend con valores reales
-            if blackjack_instance is not None:
-                puntos = blackjack_instance.calcular_puntos(manos_backend[jugador_actual])
-            else:
-                puntos = calcular_puntos_fallback(manos_backend[jugador_actual])
+            # Agregar la carta; la mano actualiza su puntaje
+            puntos = jugadores[jugador_actual].agregar(zapato.sacar())
                 
             if puntos >= 21:
                 plantados[jugador_actual] = True
                 avanzar_turno()
             else:
                 # Actualizar estado en Firestore
-                ejecutar_asyncio(actualizar_estado_firestore())
+                actualizar_estado_firestore()
 
     def plantarse_backend():
         """Plantarse usando la lógica del backend"""
@@ -394,51 +372,31 @@ def blackjack_juego(screen):
 
     def turno_crupier():
         """Lógica del turno del crupier"""
-        nonlocal mano_crupier_backend, crupier, resultados
+        nonlocal crupier, resultados
         
         # El crupier debe sacar cartas hasta tener 17 o más puntos
-        if blackjack_instance is not None:
-            puntos_crupier = blackjack_instance.calcular_puntos(mano_crupier_backend)
-        else:
-            puntos_crupier = calcular_puntos_fallback(mano_crupier_backend)
-            
-        while puntos_crupier < 17:
-            # Agregar nueva carta
-            nueva_carta_frontend = sacar_carta()
-            crupier.append(nueva_carta_frontend)
-            
-            if blackjack_instance is not None:
-                valor_backend = blackjack_instance.extraer_valor_carta(nueva_carta_frontend)
-            else:
-                valor_backend = extraer_valor_fallback(nueva_carta_frontend)
-            mano_crupier_backend.append(valor_backend)
-            
-            if blackjack_instance is not None:
-                puntos_crupier = blackjack_instance.calcular_puntos(mano_crupier_backend)
-            else:
-                puntos_crupier = calcular_puntos_fallback(mano_crupier_backend)
-        
+        while crupier.total < 17:
+            crupier.agregar(zapato.sacar())
+
+        # Descontar las cartas que cierran la ronda (la última pedida, la oculta y las
+        # del crupier) antes de que la nueva ronda reemplace las manos
+        composicion.observar(zapato, jugadores, crupier, True)
+
         # Determinar ganadores
         determinar_ganadores()
         
         # Actualizar estado final en Firestore
-        ejecutar_asyncio(actualizar_estado_firestore())
+        actualizar_estado_firestore()
 
     def determinar_ganadores():
         """Determina quién gana y quién pierde"""
         nonlocal resultados
         resultados = []
         
-        if blackjack_instance is not None:
-            puntos_crupier = blackjack_instance.calcular_puntos(mano_crupier_backend)
-        else:
-            puntos_crupier = calcular_puntos_fallback(mano_crupier_backend)
+        puntos_crupier = crupier.total
         
         for i in range(4):
-            if blackjack_instance is not None:
-                puntos_jugador = blackjack_instance.calcular_puntos(manos_backend[i])
-            else:
-                puntos_jugador = calcular_puntos_fallback(manos_backend[i])
+            puntos_jugador = jugadores[i].total
             
             if puntos_jugador > 21:
                 resultado = "PERDIÓ (Se pasó)"
@@ -462,54 +420,42 @@ def blackjack_juego(screen):
             })
 
     def nueva_ronda():
-        """Reinicia el juego para una nueva ronda"""
-        nonlocal jugadores, manos_backend, crupier, mano_crupier_backend, sala_id
+        """Pide una nueva ronda: la sala se cambia en segundo plano y el bucle la revisa"""
+        nonlocal rotacion
+        if rotacion is None and salida is None:
+            rotacion = red.submit(rotar_sala(sala_id, list(resultados)))
+        return None
+
+    def revisar_rotacion():
+        """Revisa sin bloquear si la sala de la nueva ronda está lista y, si lo está, reparte"""
+        nonlocal jugadores, crupier, sala_id, zapato, rotacion
         nonlocal plantados, cartas_reveladas, juego_terminado, resultados, jugador_actual
-        
-        # Finalizar sala actual
-        ejecutar_asyncio(finalizar_sala())
-        
-        # Crear nueva sala
-        nueva_sala_id = ejecutar_asyncio(crear_nueva_sala())
+        if not rotacion.done():
+            return
+        futuro, rotacion = rotacion, None
+        nueva_sala_id = None if futuro.cancelled() or futuro.exception() else futuro.result()
         
         if not nueva_sala_id:
             print("❌ Error creando nueva sala")
-            return 'blackjack_inicio'
+            return
         
         # Actualizar sala_id global
+        # La mesa sigue con el mismo zapato: solo se baraja al pasar la carta de corte
+        zapato = mover_zapato(sala_id, nueva_sala_id)
         sala_id = nueva_sala_id
+        zapato.nueva_ronda()
         
         # Actualizar estado compartido con nueva sala_id
         blackjack_shared.set_game_state(blackjack_instance, jugador_actual_usuario, sala_id)
         
         screen.clear()
+        renderer.invalidate()
         
         # Reinicializar todo
-        manos_backend = []
-        jugadores = []
-        
-        for i in range(4):
-            mano_frontend = [sacar_carta(), sacar_carta()]
-            jugadores.append(mano_frontend)
-            
-            mano_backend = []
-            for carta_frontend in mano_frontend:
-                if blackjack_instance is not None:
-                    valor_backend = blackjack_instance.extraer_valor_carta(carta_frontend)
-                else:
-                    valor_backend = extraer_valor_fallback(carta_frontend)
-                mano_backend.append(valor_backend)
-            manos_backend.append(mano_backend)
+        jugadores = [Mano([zapato.sacar(), zapato.sacar()]) for i in range(4)]
         
         # Nueva mano del crupier
-        crupier = [sacar_carta(), sacar_carta()]
-        mano_crupier_backend = []
-        for carta_frontend in crupier:
-            if blackjack_instance is not None:
-                valor_backend = blackjack_instance.extraer_valor_carta(carta_frontend)
-            else:
-                valor_backend = extraer_valor_fallback(carta_frontend)
-            mano_crupier_backend.append(valor_backend)
+        crupier = Mano([zapato.sacar(), zapato.sacar()])
 
         plantados = [False] * 4
         cartas_reveladas = False
@@ -518,26 +464,34 @@ def blackjack_juego(screen):
         jugador_actual = 0
         
         # Actualizar estado inicial en nueva sala
-        ejecutar_asyncio(actualizar_estado_firestore())
-        
-        return 'NUEVA_RONDA'
+        actualizar_estado_firestore()
 
     def salir_del_juego():
-        """Maneja la salida del juego"""
-        # Finalizar y eliminar sala de Firestore
-        print("🚪 Saliendo del juego...")
-        ejecutar_asyncio(finalizar_sala())
-        blackjack_shared.clear_game_state()
-        async_manager.close()
-        return 'salir'
+        """Maneja la salida del juego: la sala se finaliza en segundo plano y el bucle espera"""
+        nonlocal salida, rotacion
+        if salida is None:
+            print("🚪 Saliendo del juego...")
+            salida = red.submit(cerrar_sala(sala_id, list(resultados), rotacion))
+            rotacion = None
+        return None
+
+    # Modo retenido: solo se redibujan los widgets que cambian entre frames
+    renderer = enable_retained_mode(screen)
+    loop = FrameLoop(screen)
+    # Atajos: F siempre; N solo con el scope 'fin_de_ronda' activo
+    keymap = Keymap()
+    keymap.bind(ord('f'), salir_del_juego)
+    keymap.bind(ord('n'), nueva_ronda, scope='fin_de_ronda')
 
     try:
         while True:
+            renderer.end_frame(screen)
             screen.refresh()
             print_text(screen, mesa, True)
             
             # Mostrar ID de sala
             sala_info = {
+                'key': 'sala_info',
                 'text': f'Sala ID: {sala_id}',
                 'x-center': 0,
                 'y-center': -15,
@@ -548,9 +502,10 @@ def blackjack_juego(screen):
             # Mostrar todas las cartas del jugador alineadas horizontalmente
             for idx, mano in enumerate(jugadores):
                 x_base, y_base = posiciones[idx]
-                for j, carta_texto in enumerate(mano):
+                for j, numero_carta in enumerate(mano):
                     carta = {
-                        'text': carta_texto,
+                        'key': ('carta', idx, j),
+                        'text': sprite_carta(numero_carta),
                         'x-center': x_base + (j * 18),
                         'y-center': y_base,
                         'color': Screen.COLOUR_BLACK,
@@ -562,20 +517,23 @@ def blackjack_juego(screen):
 
                 # Mostrar estado del jugador
                 if idx == jugador_actual and not plantados[jugador_actual] and not juego_terminado:
+                    boton_jugadorActivo['key'] = ('estado', idx)
                     boton_jugadorActivo['x-center'] = x_base
                     boton_jugadorActivo['y-center'] = y_base - 8
                     print_button(screen, boton_jugadorActivo)
                 else:
+                    boton_jugadorEspera['key'] = ('estado', idx)
                     boton_jugadorEspera['x-center'] = x_base
                     boton_jugadorEspera['y-center'] = y_base - 8
                     print_button(screen, boton_jugadorEspera)
 
             # Mostrar cartas del crupier
-            for i, carta_texto in enumerate(crupier):
+            for i, numero_carta in enumerate(crupier):
                 if i == 0 or cartas_reveladas:
                     # Mostrar carta real
                     carta_config = {
-                        'text': carta_texto,
+                        'key': ('crupier', i),
+                        'text': sprite_carta(numero_carta),
                         'x-center': posicion_crupier[0] + (i * 18),
                         'y-center': posicion_crupier[1],
                         'color': Screen.COLOUR_BLACK,
@@ -586,6 +544,7 @@ def blackjack_juego(screen):
                 else:
                     # Carta oculta
                     carta_config = {
+                    'key': ('crupier', i),
                     'text':
                         '┌─────────────┐'
                 '        │ ?           │'
@@ -607,24 +566,32 @@ def blackjack_juego(screen):
 
             # Mostrar puntos del crupier si están reveladas
             if cartas_reveladas:
-                if blackjack_instance is not None:
-                    puntos_crupier = blackjack_instance.calcular_puntos(mano_crupier_backend)
-                else:
-                    puntos_crupier = calcular_puntos_fallback(mano_crupier_backend)
-                    
                 puntos_crupier_text = {
-                    'text': f'Crupier: {puntos_crupier} puntos',
+                    'key': 'puntos_crupier',
+                    'text': f'Crupier: {crupier.total} puntos',
                     'x-center': posicion_crupier[0],
                     'y-center': posicion_crupier[1] + 8,
                     'color': Screen.COLOUR_CYAN,
                 }
                 print_text(screen, puntos_crupier_text)
 
+            # Cambio de ronda o salida en curso
+            if salida is not None or rotacion is not None:
+                estado_red_text = {
+                    'key': 'estado_red',
+                    'text': '⏳ Cerrando la sala...' if salida is not None else '⏳ Preparando nueva ronda...',
+                    'x-center': 0,
+                    'y-center': 27,
+                    'color': Screen.COLOUR_YELLOW,
+                }
+                print_text(screen, estado_red_text)
+
             # Mostrar resultados si el juego terminó
             if juego_terminado and resultados:
                 for i, resultado in enumerate(resultados):
                     x_base, y_base = posiciones[i]
                     resultado_text = {
+                        'key': ('resultado', i),
                         'text': resultado['texto'],
                         'x-center': x_base + 20,
                         'y-center': y_base - 10,
@@ -634,6 +601,7 @@ def blackjack_juego(screen):
                 
                 # Mostrar instrucciones para nueva ronda
                 instruccion_nueva_ronda = {
+                    'key': 'instruccion_nueva_ronda',
                     'text': 'Presiona N para Nueva Ronda | F para Salir',
                     'x-center': 0,
                     'y-center': 25,
@@ -642,12 +610,34 @@ def blackjack_juego(screen):
                 }
                 print_text(screen, instruccion_nueva_ronda)
 
-            event = screen.get_event()
+            event = loop.next_event()
+
+            # Salida en curso: volver cuando la sala quede finalizada
+            if salida is not None:
+                if salida.done():
+                    blackjack_shared.clear_game_state()
+                    red.close()
+                    return 'salir'
+            elif rotacion is not None:
+                revisar_rotacion()
 
             # Botones según el estado del juego
-            if not juego_terminado:
+            if not juego_terminado and salida is None:
                 # Solo mostrar botones de juego si el jugador actual no está plantado
                 if not plantados[jugador_actual]:
+                    # Probabilidades de ganar pidiendo o plantándose (en caché mientras nadie saque carta)
+                    composicion.observar(zapato, jugadores, crupier, cartas_reveladas)
+                    probabilidades = composicion.probabilidades(jugadores[jugador_actual], crupier[0])
+                    probabilidades_text = {
+                        'key': 'probabilidades',
+                        'text': f'Ganar pidiendo:  {probabilidades.pedir.gana:4.0%}\n'
+                                f'Ganar plantado:  {probabilidades.plantarse.gana:4.0%}',
+                        'x-center': -70,
+                        'y-center': 14,
+                        'color': Screen.COLOUR_WHITE,
+                    }
+                    print_text(screen, probabilidades_text)
+
                     print_button(
                         screen,
                         boton_pedirCarta,
@@ -672,25 +662,26 @@ def blackjack_juego(screen):
                     )
             
             # Key listeners
-            # Salir con tecla F
-            salir = add_key_listener(ord('f'), event, salir_del_juego)
-            if salir == 'salir':
-                return 'salir'
-            
             # Nueva ronda con tecla N (solo cuando el juego haya terminado)
             if juego_terminado:
-                nueva_ronda_key = add_key_listener(ord('n'), event, nueva_ronda)
-                if nueva_ronda_key == 'NUEVA_RONDA':
-                    pass  # La función nueva_ronda() ya reinicia todo
+                keymap.push_scope('fin_de_ronda')
+            else:
+                keymap.pop_scope('fin_de_ronda')
+
+            # Salir con F o nueva ronda con N (el bucle revisa ambas operaciones)
+            keymap.dispatch(event)
     
     except KeyboardInterrupt:
         print("🛑 Juego interrumpido por el usuario")
-        async_manager.close()
+        red.close()
         return 'salir'
     except Exception as e:
         print(f"❌ Error inesperado en el juego: {e}")
-        async_manager.close()
+        red.close()
         return 'salir'
     finally:
-        # Asegurar que el async manager se cierre al salir
-        async_manager.close()
\ No newline at end of file
+        # Asegurar que la cola de escritura se cierre y se cancele lo pendiente al salir
+        # (con límite: sin red, salir no puede quedar bloqueado)
+        cola_estado.close(timeout=1.0)
+        descartar_zapato(sala_id)
+        red.close()
\ No newline at end of file
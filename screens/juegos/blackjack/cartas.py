@@ -10,29 +10,71 @@ palos = {
 
 valores = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
 
-# Diccionario para almacenar todas las cartas y lista tipo mazo
-cartas = {}
-mazo = []
-
-# Generar las 52 cartas
-for palo, (simbolo, nombre_palo) in palos.items():
-    for valor in valores:
-        nombre_variable = valor
-        valor_izq = valor.ljust(2) if len(valor) == 1 else valor
-        valor_der = valor.rjust(2) if len(valor) == 1 else valor
-        carta = (
-                '┌─────────────┐'
-        f'        │{valor_izq}           │'
-        '        │             │'
-        '        │             │'
-        f'        │      {simbolo}      │'
-        '        │             │'
-        '        │             │'
-        f'        │           {valor_der}│'
-        '        └─────────────┘' 
-        )
-        cartas[nombre_variable] = carta
-        mazo.append(carta)
+# Cada carta es un int de 0 a 51: palo * 13 + rango (rango 0 = 'A', ..., 12 = 'K').
+# El arte ASCII solo se busca en SPRITES al dibujar.
+PALOS = tuple(palos)
+NUM_CARTAS = len(PALOS) * len(valores)
+
+
+def _sprite(valor, simbolo):
+    """Arte ASCII de una carta."""
+    valor_izq = valor.ljust(2) if len(valor) == 1 else valor
+    valor_der = valor.rjust(2) if len(valor) == 1 else valor
+    return (
+            '┌─────────────┐'
+    f'        │{valor_izq}           │'
+    '        │             │'
+    '        │             │'
+    f'        │      {simbolo}      │'
+    '        │             │'
+    '        │             │'
+    f'        │           {valor_der}│'
+    '        └─────────────┘' 
+    )
+
+
+# Tablas indexadas por el número de carta
+SPRITES = tuple(_sprite(valor, simbolo) for simbolo, _ in palos.values() for valor in valores)
+VALORES_CARTA = tuple(valor for _ in PALOS for valor in valores)
+PUNTOS_CARTA = tuple(
+    11 if valor == 'A' else 10 if valor in ('10', 'J', 'Q', 'K') else int(valor)
+    for valor in VALORES_CARTA
+)
+# Rango de cada carta según sus puntos duros (el As vale 1): 0 = As, 1 a 8 = 2 a 9, 9 = cartas de 10.
+# Lo usan Mano, el simulador y las probabilidades para contar el zapato por rango.
+RANGO_CARTA = tuple((1 if puntos == 11 else puntos) - 1 for puntos in PUNTOS_CARTA)
+NUM_RANGOS = 10
+CARTAS_POR_RANGO = tuple(RANGO_CARTA.count(rango) for rango in range(NUM_RANGOS))
+
+
+def crear_carta(valor, palo):
+    """Retorna el número de carta de un valor ('A', '2', ..., 'K') y un palo ('corazones', ...)."""
+    return PALOS.index(palo) * len(valores) + valores.index(valor)
+
+
+def valor_carta(carta):
+    """Valor de una carta como lo usa el backend ('A', '2', ..., '10', 'J', 'Q', 'K')."""
+    return VALORES_CARTA[carta]
+
+
+def palo_carta(carta):
+    """Palo de una carta ('corazones', 'diamantes', 'treboles' o 'picas')."""
+    return PALOS[carta // len(valores)]
+
+
+def puntos_carta(carta):
+    """Puntos de una carta (el As vale 11)."""
+    return PUNTOS_CARTA[carta]
+
+
+def sprite_carta(carta):
+    """Arte ASCII de una carta, para dibujarla."""
+    return SPRITES[carta]
+
+
+# Diccionario de arte por valor (se conserva por compatibilidad) y mazo de números de carta
+cartas = {valor: SPRITES[i] for i, valor in enumerate(VALORES_CARTA)}
+mazo = list(range(NUM_CARTAS))
 
 # Barajar el mazo
 random.shuffle(mazo)
@@ -45,7 +87,8 @@ def mostrar_cartas_en_linea(cartas_ascii):
 
 # Función para sacar una carta del mazo (como en un mazo real)
 def sacar_carta():
-    if mazo:
-        return mazo.pop()
-    else:
-        return "No quedan cartas en el mazo."
\ No newline at end of file
+    """Saca una carta (su número) del mazo; si se acabó, se baraja un mazo nuevo."""
+    if not mazo:
+        mazo.extend(range(NUM_CARTAS))
+        random.shuffle(mazo)
+    return mazo.pop()
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Mano de BlackJack con puntaje incremental
+"""
+from .cartas import RANGO_CARTA
+
+# Puntos "duros" de cada carta: el As cuenta 1 y se sube a 11 solo si no se pasa
+_PUNTOS_DUROS = tuple(rango + 1 for rango in RANGO_CARTA)
+_AS = 1
+
+
+def total_mano(duro, ases):
+    """
+    Total de una mano a partir de su total duro (todos los Ases valen 1).
+
+    Un As se cuenta como 11 solo si el total no pasa de 21; con varios Ases,
+    como mucho uno vale 11. Es la única definición de la regla: la usan Mano,
+    el simulador y las probabilidades. Solo usa operaciones aritméticas, así
+    que también acepta arrays de numpy.
+
+    Args:
+        duro: Total duro.
+        ases: Cantidad de Ases (o si hay alguno).
+    """
+    return duro + 10 * ((ases > 0) & (duro <= 11))
+
+
+class Mano:
+    """
+    Mano de cartas (números de carta, ver cartas.py) con su puntaje al día.
+
+    Al agregar cada carta se actualizan el total duro (todos los Ases valen 1)
+    y la cantidad de Ases, así que 'total', 'se_paso' y 'es_blackjack' no
+    recorren la mano. Un As se cuenta como 11 solo si el total no pasa de 21;
+    con varios Ases, como mucho uno vale 11.
+
+    Se recorre e indexa como una lista de números de carta.
+
+    Ejemplo de uso:
+        mano = Mano([zapato.sacar(), zapato.sacar()])
+        mano.agregar(zapato.sacar())
+        if mano.se_paso: ...
+    """
+
+    __slots__ = ('cartas', '_duro', '_ases')
+
+    def __init__(self, cartas=()):
+        """
+        Args:
+            cartas (iterable): Números de carta iniciales.
+        """
+        self.cartas = []
+        self._duro = 0
+        self._ases = 0
+        for carta in cartas:
+            self.agregar(carta)
+
+    def agregar(self, carta: int) -> int:
+        """
+        Agrega una carta y retorna el nuevo total.
+
+        Args:
+            carta (int): Número de carta.
+        """
+        self.cartas.append(carta)
+        puntos = _PUNTOS_DUROS[carta]
+        self._duro += puntos
+        if puntos == _AS:
+            self._ases += 1
+        return self.total
+
+    @property
+    def total(self) -> int:
+        """Puntos de la mano contando un As como 11 si no se pasa de 21."""
+        return total_mano(self._duro, self._ases)
+
+    @property
+    def blanda(self) -> bool:
+        """Si la mano tiene un As contado como 11."""
+        return self._ases > 0 and self._duro <= 11
+
+    @property
+    def se_paso(self) -> bool:
+        """Si la mano pasa de 21."""
+        return self._duro > 21
+
+    @property
+    def es_blackjack(self) -> bool:
+        """Si la mano es un BlackJack natural (21 con dos cartas)."""
+        return len(self.cartas) == 2 and self.total == 21
+
+    def __len__(self) -> int:
+        return len(self.cartas)
+
+    def __iter__(self):
+        return iter(self.cartas)
+
+    def __getitem__(self, indice):
+        return self.cartas[indice]
+
+    def __repr__(self) -> str:
+        return f"Mano({self.cartas!r}, total={self.total})"
@@ -0,0 +1,190 @@
+"""
+Probabilidades de ganar pidiendo carta o plantándose en el BlackJack
+"""
+from collections import namedtuple
+
+from cliente.utils.cache import LRUCache
+from .cartas import CARTAS_POR_RANGO, RANGO_CARTA
+from .mano import total_mano
+
+# Resultado de una opción para el jugador (probabilidades que suman 1)
+Resultado = namedtuple('Resultado', ['gana', 'empata', 'pierde'])
+Probabilidades = namedtuple('Probabilidades', ['pedir', 'plantarse'])
+
+# Distribución final del crupier: índices 0 a 4 para 17 a 21 y 5 si se pasa
+_SE_PASA = 5
+
+# Distribuciones del crupier y probabilidades del jugador por (carta visible, composición, mano)
+_tablas = LRUCache(max_entries=512)
+
+
+def _distribucion_crupier(rango, probabilidades):
+    """
+    Distribución del total final del crupier a partir de su carta visible.
+
+    La carta oculta y las siguientes se sacan con las probabilidades de la
+    composición actual; el efecto de las pocas cartas que saca el crupier sobre
+    esa composición es despreciable en un zapato de varios mazos.
+    """
+    memo = {}
+
+    def final(duro, ases):
+        total = total_mano(duro, ases)
+        if total >= 17:
+            distribucion = [0.0] * 6
+            distribucion[_SE_PASA if total > 21 else total - 17] = 1.0
+            return distribucion
+        clave = (duro, ases)
+        distribucion = memo.get(clave)
+        if distribucion is None:
+            distribucion = [0.0] * 6
+            for siguiente, probabilidad in enumerate(probabilidades):
+                if probabilidad:
+                    for i, valor in enumerate(final(duro + siguiente + 1, ases or siguiente == 0)):
+                        distribucion[i] += probabilidad * valor
+            memo[clave] = distribucion
+        return distribucion
+
+    return tuple(final(rango + 1, rango == 0))
+
+
+def _plantarse(total, distribucion):
+    """Resultado de plantarse con 'total' contra la distribución del crupier."""
+    if total > 21:
+        return Resultado(0.0, 0.0, 1.0)
+    gana = distribucion[_SE_PASA] + sum(distribucion[:max(0, min(total - 17, 5))])
+    empata = distribucion[total - 17] if total >= 17 else 0.0
+    return Resultado(gana, empata, max(0.0, 1.0 - gana - empata))
+
+
+def _calcular(rango_crupier, conteos, duro, ases):
+    """Probabilidades de pedir (jugando lo mejor posible después) y de plantarse."""
+    restantes = sum(conteos)
+    if not restantes:
+        conteos, restantes = CARTAS_POR_RANGO, sum(CARTAS_POR_RANGO)
+    probabilidades = tuple(conteo / restantes for conteo in conteos)
+    distribucion = _tablas.get_or_create(('crupier', rango_crupier, conteos),
+                                         lambda: _distribucion_crupier(rango_crupier, probabilidades))
+    memo = {}
+
+    def pedir(duro, ases):
+        clave = (duro, ases)
+        resultado = memo.get(clave)
+        if resultado is None:
+            gana = empata = pierde = 0.0
+            for siguiente, probabilidad in enumerate(probabilidades):
+                if not probabilidad:
+                    continue
+                nuevo_duro, nuevos_ases = duro + siguiente + 1, ases or siguiente == 0
+                total = total_mano(nuevo_duro, nuevos_ases)
+                if total >= 21:
+                    # Con 21 o más el jugador se planta solo
+                    opcion = _plantarse(total, distribucion)
+                else:
+                    opcion = mejor(nuevo_duro, nuevos_ases)
+                gana += probabilidad * opcion.gana
+                empata += probabilidad * opcion.empata
+                pierde += probabilidad * opcion.pierde
+            resultado = memo[clave] = Resultado(gana, empata, pierde)
+        return resultado
+
+    def mejor(duro, ases):
+        """La opción con mayor ganancia esperada (pago 1 a 1)."""
+        plantarse = _plantarse(total_mano(duro, ases), distribucion)
+        otra = pedir(duro, ases)
+        return otra if otra.gana - otra.pierde > plantarse.gana - plantarse.pierde else plantarse
+
+    return Probabilidades(pedir(duro, ases), _plantarse(total_mano(duro, ases), distribucion))
+
+
+class ComposicionZapato:
+    """
+    Cartas que el jugador todavía no vio en el zapato, por rango.
+
+    Parte de los 'mazos' completos y descuenta cada carta visible una sola vez:
+    'observar' solo recorre las cartas nuevas de cada mano desde la llamada
+    anterior, así que se puede llamar en cada frame. La carta oculta del
+    crupier no se descuenta hasta que se revela. Cuando el zapato se baraja
+    (o es otro zapato, por ejemplo en una sala nueva) la composición se reinicia.
+
+    Ejemplo de uso:
+        composicion = ComposicionZapato(zapato.mazos)
+        composicion.observar(zapato, jugadores, crupier, cartas_reveladas)
+        probabilidades = composicion.probabilidades(jugadores[jugador_actual], crupier[0])
+        probabilidades.pedir.gana, probabilidades.plantarse.gana
+    """
+
+    __slots__ = ('mazos', 'conteos', '_zapato', '_barajadas', '_contadas')
+
+    def __init__(self, mazos: int = 6):
+        """
+        Args:
+            mazos (int): Mazos de 52 cartas del zapato.
+        """
+        self.mazos = mazos
+        self.reiniciar()
+
+    def reiniciar(self, zapato=None) -> None:
+        """Vuelve al zapato completo (recién barajado)."""
+        self.conteos = [conteo * self.mazos for conteo in CARTAS_POR_RANGO]
+        self._zapato = zapato
+        self._barajadas = zapato.barajadas if zapato is not None else None
+        # Por lugar de la mesa: (mano, cartas ya descontadas)
+        self._contadas = {}
+
+    def quitar(self, carta: int) -> None:
+        """Descuenta una carta vista (número de carta)."""
+        rango = RANGO_CARTA[carta]
+        if self.conteos[rango]:
+            self.conteos[rango] -= 1
+
+    def observar(self, zapato, manos, crupier, cartas_reveladas: bool = False) -> None:
+        """
+        Descuenta las cartas visibles que aparecieron desde la llamada anterior.
+
+        Args:
+            zapato (Zapato): Zapato del que salen las cartas.
+            manos (list[Mano]): Manos de los jugadores.
+            crupier (Mano): Mano del crupier.
+            cartas_reveladas (bool): Si la carta oculta del crupier ya se ve.
+        """
+        if zapato is not self._zapato or zapato.barajadas != self._barajadas:
+            self.reiniciar(zapato)
+        for lugar, mano in enumerate(manos):
+            self._observar_mano(lugar, mano, len(mano))
+        self._observar_mano('crupier', crupier, len(crupier) if cartas_reveladas else min(len(crupier), 1))
+
+    def _observar_mano(self, lugar, mano, visibles) -> None:
+        anterior, contadas = self._contadas.get(lugar, (None, 0))
+        if anterior is not mano:
+            contadas = 0
+        for carta in mano.cartas[contadas:visibles]:
+            self.quitar(carta)
+        self._contadas[lugar] = (mano, max(contadas, visibles))
+
+    def probabilidades(self, mano, carta_crupier: int) -> Probabilidades:
+        """
+        Probabilidades de la mano contra la carta visible del crupier.
+
+        El resultado se guarda en caché por composición, carta y mano: mientras
+        nadie saque una carta, llamarla en cada frame no recalcula nada.
+
+        Args:
+            mano (Mano): Mano del jugador que decide.
+            carta_crupier (int): Número de la carta visible del crupier.
+
+        Returns:
+            Probabilidades: 'pedir' (pidiendo una carta y jugando lo mejor posible
+            después) y 'plantarse', cada una con gana, empata y pierde.
+        """
+        rango_crupier = RANGO_CARTA[carta_crupier]
+        conteos = tuple(self.conteos)
+        duro = sum(RANGO_CARTA[carta] + 1 for carta in mano)
+        ases = any(RANGO_CARTA[carta] == 0 for carta in mano)
+        return _tablas.get_or_create(('jugador', rango_crupier, conteos, duro, ases),
+                                     lambda: _calcular(rango_crupier, conteos, duro, ases))
+
+    @property
+    def restantes(self) -> int:
+        """Cartas que el jugador todavía no vio."""
+        return sum(self.conteos)
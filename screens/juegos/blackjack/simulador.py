@@ -0,0 +1,150 @@
+"""
+Simulador vectorizado de rondas de BlackJack
+
+Juega millones de rondas con las mismas reglas de blackjack_juego, sin la
+interfaz: 4 jugadores, reparto de dos cartas a cada jugador y al crupier, los
+jugadores piden en orden y se plantan solos al llegar a 21 o más, el crupier pide con menos de
+17 y los resultados se deciden como en 'determinar_ganadores' (pago 1 a 1).
+Cada ronda simulada sale de un zapato completo: en el juego el zapato sigue
+entre rondas, pero con varios mazos el efecto sobre las probabilidades es mínimo.
+
+Las rondas se juegan por lotes con numpy: cada paso saca una carta para todas
+las manos activas del lote a la vez, así que no hay un bucle de Python por
+carta ni por ronda. numpy es opcional: solo lo necesita este módulo.
+
+    python -m cliente.screens.juegos.blackjack.simulador --rondas 1000000 --plantarse-en 17
+"""
+import argparse
+import json
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional para el resto del cliente
+    np = None
+
+from .cartas import CARTAS_POR_RANGO
+from .mano import total_mano
+
+JUGADORES = 4
+
+
+def _sacar(conteos, filas, rng):
+    """
+    Saca una carta del zapato de cada fila indicada (sin reposición).
+
+    Args:
+        conteos: Matriz (rondas, 10) con las cartas que quedan de cada puntaje.
+        filas: Índices de las rondas que sacan carta.
+        rng: Generador de numpy.
+
+    Returns:
+        Puntos duros de cada carta sacada (1 a 10).
+    """
+    acumulado = conteos[filas].cumsum(axis=1)
+    sorteo = (rng.random(len(filas)) * acumulado[:, -1]).astype(np.int64)
+    indice = (acumulado <= sorteo[:, None]).sum(axis=1)
+    conteos[filas, indice] -= 1
+    return indice + 1
+
+
+def _jugar_lote(rondas, plantarse_en, mazos, rng):
+    """Juega un lote de rondas y retorna los totales (rondas, 4) de los jugadores y del crupier."""
+    conteos = np.tile(np.array(CARTAS_POR_RANGO, dtype=np.int32) * mazos, (rondas, 1))
+    todas = np.arange(rondas)
+    duro = np.zeros((rondas, JUGADORES + 1), dtype=np.int32)
+    ases = np.zeros((rondas, JUGADORES + 1), dtype=bool)
+
+    # Reparto inicial: dos cartas a cada jugador y luego al crupier (columna 4)
+    for asiento in range(JUGADORES + 1):
+        for _ in range(2):
+            cartas = _sacar(conteos, todas, rng)
+            duro[:, asiento] += cartas
+            ases[:, asiento] |= cartas == 1
+
+    # Turno de cada jugador, en orden: pide mientras su total sea menor que 'plantarse_en'
+    # (y menor que 21, porque con 21 o más se planta solo)
+    limite_jugador = min(plantarse_en, 21)
+    for asiento in range(JUGADORES + 1):
+        limite = 17 if asiento == JUGADORES else limite_jugador
+        while True:
+            filas = np.flatnonzero(total_mano(duro[:, asiento], ases[:, asiento]) < limite)
+            if len(filas) == 0:
+                break
+            cartas = _sacar(conteos, filas, rng)
+            duro[filas, asiento] += cartas
+            ases[filas, asiento] |= cartas == 1
+
+    totales = total_mano(duro, ases)
+    return totales[:, :JUGADORES], totales[:, JUGADORES]
+
+
+def simular(rondas: int = 1_000_000, plantarse_en: int = 17, mazos: int = 6,
+            semilla=None, lote: int = 250_000) -> dict:
+    """
+    Simula rondas completas y resume los resultados de los jugadores.
+
+    Args:
+        rondas (int): Número de rondas (cada una con 4 manos).
+        plantarse_en (int): Los jugadores piden mientras su total sea menor que este valor.
+        mazos (int): Mazos del zapato de cada ronda.
+        semilla: Semilla del generador (None para una aleatoria).
+        lote (int): Rondas que se juegan a la vez (limita la memoria).
+
+    Returns:
+        dict: Tasas de victoria, empate y derrota por mano, ventaja de la casa
+        (pago 1 a 1), tasas de manos pasadas del jugador y del crupier, y rendimiento.
+    """
+    if np is None:
+        raise ImportError("El simulador de BlackJack necesita numpy (pip install numpy).")
+    rng = np.random.default_rng(semilla)
+    gana = empata = pierde = jugador_se_paso = crupier_se_paso = 0
+    inicio = time.perf_counter()
+    restantes = rondas
+    while restantes > 0:
+        cantidad = min(lote, restantes)
+        restantes -= cantidad
+        jugadores, crupier = _jugar_lote(cantidad, plantarse_en, mazos, rng)
+        crupier = crupier[:, None]
+        # Mismo orden de reglas que determinar_ganadores
+        paso = jugadores > 21
+        gano = ~paso & ((crupier > 21) | (jugadores > crupier))
+        empato = ~paso & (crupier <= 21) & (jugadores == crupier)
+        gana += int(gano.sum())
+        empata += int(empato.sum())
+        pierde += int(jugadores.size - gano.sum() - empato.sum())
+        jugador_se_paso += int(paso.sum())
+        crupier_se_paso += int((crupier > 21).sum())
+    segundos = time.perf_counter() - inicio
+    manos = rondas * JUGADORES
+    return {
+        'rondas': rondas,
+        'manos': manos,
+        'plantarse_en': plantarse_en,
+        'mazos': mazos,
+        'gana': gana / manos if manos else 0.0,
+        'empata': empata / manos if manos else 0.0,
+        'pierde': pierde / manos if manos else 0.0,
+        'ventaja_casa': (pierde - gana) / manos if manos else 0.0,
+        'jugador_se_paso': jugador_se_paso / manos if manos else 0.0,
+        'crupier_se_paso': crupier_se_paso / rondas if rondas else 0.0,
+        'segundos': segundos,
+        'rondas_por_segundo': rondas / segundos if segundos > 0 else 0.0
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cliente.screens.juegos.blackjack.simulador',
+                                     description='Simulación de rondas de BlackJack sin interfaz')
+    parser.add_argument('--rondas', type=int, default=1_000_000, help='Rondas a simular')
+    parser.add_argument('--plantarse-en', type=int, default=17, help='Total con el que se plantan los jugadores')
+    parser.add_argument('--mazos', type=int, default=6, help='Mazos del zapato')
+    parser.add_argument('--semilla', type=int, default=None, help='Semilla del generador')
+    parser.add_argument('--lote', type=int, default=250_000, help='Rondas por lote')
+    args = parser.parse_args(argv)
+    resultado = simular(args.rondas, args.plantarse_en, args.mazos, args.semilla, args.lote)
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Zapato de varios mazos para el BlackJack
+"""
+import random
+from array import array
+
+from .cartas import NUM_CARTAS
+
+
+class Zapato:
+    """
+    Zapato (shoe) de 'mazos' mazos de 52 cartas con carta de corte.
+
+    Las cartas son números de carta (ver cartas.py) guardados en un array
+    preasignado; sacar una carta solo avanza un índice. Cuando se pasa la
+    carta de corte (la fracción 'penetracion' del zapato), se termina la ronda
+    en curso y 'nueva_ronda()' vuelve a barajar. Si el zapato llega a vaciarse
+    en medio de una ronda, se baraja en ese momento.
+
+    Cada sala tiene su propio zapato (ver obtener_zapato) y con 'semilla' el
+    orden de las cartas es reproducible.
+
+    Ejemplo de uso:
+        zapato = Zapato(mazos=6, penetracion=0.75, semilla=42)
+        zapato.nueva_ronda()
+        carta = zapato.sacar()
+        muestras = zapato.sacar_varias(1000)  # Para simulaciones
+    """
+
+    __slots__ = ('mazos', 'penetracion', 'barajadas', '_cartas', '_posicion', '_corte', '_rng')
+
+    def __init__(self, mazos: int = 6, penetracion: float = 0.75, semilla=None):
+        """
+        Inicializa y baraja el zapato.
+
+        Args:
+            mazos (int): Número de mazos de 52 cartas.
+            penetracion (float): Fracción del zapato que se reparte antes de volver a barajar (0 a 1).
+            semilla: Semilla del generador aleatorio (None para una aleatoria).
+        """
+        if mazos < 1:
+            raise ValueError("El zapato necesita al menos un mazo.")
+        if not 0 < penetracion <= 1:
+            raise ValueError("La penetración debe estar entre 0 y 1.")
+        self.mazos = mazos
+        self.penetracion = penetracion
+        self.barajadas = 0
+        self._cartas = array('B', range(NUM_CARTAS)) * mazos
+        self._corte = max(1, int(len(self._cartas) * penetracion))
+        self._rng = random.Random(semilla)
+        self._posicion = 0
+        self.barajar()
+
+    def barajar(self) -> None:
+        """Junta todas las cartas y baraja el zapato."""
+        self._rng.shuffle(self._cartas)
+        self._posicion = 0
+        self.barajadas += 1
+
+    def sacar(self) -> int:
+        """Saca la siguiente carta (su número)."""
+        posicion = self._posicion
+        if posicion >= len(self._cartas):
+            self.barajar()
+            posicion = 0
+        self._posicion = posicion + 1
+        return self._cartas[posicion]
+
+    def sacar_varias(self, cantidad: int) -> array:
+        """
+        Saca varias cartas de una vez, barajando cuando el zapato se vacía.
+
+        Pensado para simulaciones: copia tramos del array en lugar de sacar
+        las cartas una por una.
+
+        Returns:
+            array: Números de carta en el orden en que salieron.
+        """
+        resultado = array('B')
+        while cantidad > 0:
+            if self._posicion >= len(self._cartas):
+                self.barajar()
+            fin = min(self._posicion + cantidad, len(self._cartas))
+            resultado.extend(self._cartas[self._posicion:fin])
+            cantidad -= fin - self._posicion
+            self._posicion = fin
+        return resultado
+
+    @property
+    def paso_corte(self) -> bool:
+        """Si ya se repartió la carta de corte."""
+        return self._posicion >= self._corte
+
+    def nueva_ronda(self) -> bool:
+        """
+        Prepara el zapato para una ronda: baraja si ya salió la carta de corte.
+
+        Returns:
+            bool: True si se barajó.
+        """
+        if self.paso_corte:
+            self.barajar()
+            return True
+        return False
+
+    @property
+    def restantes(self) -> int:
+        """Cartas que quedan en el zapato."""
+        return len(self._cartas) - self._posicion
+
+    def __len__(self) -> int:
+        return len(self._cartas)
+
+
+# Un zapato independiente por sala
+_zapatos = {}
+
+
+def obtener_zapato(sala_id, **opciones) -> Zapato:
+    """
+    Retorna el zapato de una sala, creándolo la primera vez.
+
+    Args:
+        sala_id: Id de la sala.
+        **opciones: Parámetros de Zapato para crearlo (mazos, penetracion, semilla).
+    """
+    zapato = _zapatos.get(sala_id)
+    if zapato is None:
+        zapato = _zapatos[sala_id] = Zapato(**opciones)
+    return zapato
+
+
+def mover_zapato(sala_id, nueva_sala_id) -> Zapato:
+    """
+    Pasa el zapato de una sala a la sala que la reemplaza (la ronda siguiente
+    de la misma mesa), sin barajarlo. Si la sala no tenía zapato, se crea uno.
+
+    Args:
+        sala_id: Id de la sala que termina.
+        nueva_sala_id: Id de la sala nueva.
+    """
+    zapato = _zapatos.pop(sala_id, None)
+    if zapato is None:
+        return obtener_zapato(nueva_sala_id)
+    _zapatos[nueva_sala_id] = zapato
+    return zapato
+
+
+def descartar_zapato(sala_id) -> None:
+    """Elimina el zapato de una sala (al finalizarla)."""
+    _zapatos.pop(sala_id, None)
@@ -1,3 +1,7 @@
+import random
+
+from ....utils.text_block import TextBlock
+
 dado_default = '''              
               
               
@@ -68,4 +72,125 @@ def get_dado(numero):
     if 0 <= numero <= 6:
         return dados[numero]
     else:
-        raise ValueError("Número de dado debe estar entre 0 y 6.")
\ No newline at end of file
+        raise ValueError("Número de dado debe estar entre 0 y 6.")
+
+
+class AtlasDados:
+    """
+    Atlas de las caras del dado (0 a 6) ya separadas en líneas y medidas.
+
+    Cada cara es un TextBlock que las celdas del tablero reciben tal cual, sin
+    volver a separar ni medir el texto en cada frame. Las variantes de color
+    (resaltada y seleccionada) se generan la primera vez que se piden y quedan
+    guardadas, así que los colores de selección de columna ('color1' y
+    'color2' en knucklebones_juego) solo cuestan una construcción cada uno.
+
+    Ejemplo de uso:
+        celda['text'] = atlas_dados.cara(5)
+        celda['text'] = atlas_dados.cara(5, Screen.COLOUR_GREEN, seleccionado=True)
+        frames = atlas_dados.tirada(5)  # Animación: un TextBlock por frame
+    """
+
+    def __init__(self, caras=dados):
+        """
+        Args:
+            caras (list): Textos de las caras, indexados por número (0 = vacío).
+        """
+        self._caras = tuple(TextBlock(cara) for cara in caras)
+        # Columnas de los puntos (los huecos del dado) en cada línea de cada cara
+        self._puntos = tuple(
+            tuple(self._tramos_puntos(linea) for linea in cara.lines) for cara in self._caras
+        )
+        # (número, color, seleccionado) -> TextBlock con tramos de color
+        self._variantes = {}
+
+    @staticmethod
+    def _tramos_puntos(linea: str) -> tuple:
+        """Retorna los tramos (inicio, fin) de espacios dentro de una línea con relleno."""
+        if not linea.strip():
+            return ()
+        tramos = []
+        inicio = None
+        for x, caracter in enumerate(linea + '░'):
+            if caracter == ' ' and inicio is None:
+                inicio = x
+            elif caracter != ' ' and inicio is not None:
+                tramos.append((inicio, x))
+                inicio = None
+        return tuple(tramos)
+
+    def cara(self, numero: int, color: int = None, seleccionado: bool = False) -> TextBlock:
+        """
+        Retorna la cara de un número.
+
+        Args:
+            numero (int): Número del dado (0 a 6; 0 es la celda vacía).
+            color (int | None): Color de la variante resaltada. None retorna la cara
+                base, que se dibuja con el color de la celda.
+            seleccionado (bool): Si es True, además rellena los puntos con 'color' de fondo.
+
+        Returns:
+            TextBlock: Cara lista para usar como 'text' de una celda.
+        """
+        if not 0 <= numero < len(self._caras):
+            raise ValueError("Número de dado debe estar entre 0 y 6.")
+        if color is None:
+            return self._caras[numero]
+        clave = (numero, color, seleccionado)
+        variante = self._variantes.get(clave)
+        if variante is None:
+            base = self._caras[numero]
+            runs = []
+            for linea, puntos in zip(base.lines, self._puntos[numero]):
+                tramos = []
+                posicion = 0
+                if seleccionado:
+                    # Los puntos llevan el color de fondo; el relleno entre ellos, solo el de texto
+                    for inicio, fin in puntos:
+                        if inicio > posicion:
+                            tramos.append((posicion, inicio, color, None))
+                        tramos.append((inicio, fin, color, color))
+                        posicion = fin
+                if posicion < len(linea):
+                    tramos.append((posicion, len(linea), color, None))
+                runs.append(tramos)
+            variante = base.with_runs(runs)
+            self._variantes[clave] = variante
+        return variante
+
+    def precargar(self, colores) -> None:
+        """Genera por adelantado las variantes de todas las caras para los colores dados."""
+        for color in set(colores):
+            for numero in range(len(self._caras)):
+                self.cara(numero, color)
+                self.cara(numero, color, seleccionado=True)
+
+    def tirada(self, numero: int, pasos: int = 8, color: int = None, semilla=None) -> tuple:
+        """
+        Retorna los frames de una animación de tirada que termina en 'numero'.
+
+        Los frames son caras del atlas (no se crea texto nuevo), así que la
+        animación cuesta lo mismo que dibujar un dado quieto.
+
+        Args:
+            numero (int): Cara final (1 a 6).
+            pasos (int): Número total de frames, incluido el último.
+            color (int | None): Color de las caras (ver 'cara').
+            semilla: Semilla opcional para repetir la misma animación.
+
+        Returns:
+            tuple: TextBlocks, uno por frame.
+        """
+        aleatorio = random.Random(semilla)
+        frames = []
+        anterior = numero
+        for _ in range(max(pasos, 1) - 1):
+            # Nunca repetir la cara anterior, para que se note el giro
+            anterior = aleatorio.choice([n for n in range(1, 7) if n != anterior])
+            frames.append(self.cara(anterior, color))
+        frames.append(self.cara(numero, color))
+        return tuple(frames)
+
+
+# Atlas global de las caras del dado
+atlas_dados = AtlasDados()
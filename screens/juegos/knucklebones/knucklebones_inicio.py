@@ -5,6 +5,7 @@ from servidor.src.model.salaDeJuego.juego import KnuckleBones
 from servidor.src.model.usuario import Usuario
 
 from ....utils.events import add_key_listener
+from ....utils.frame_loop import FrameLoop
 from ....utils.printers import print_button, print_text
 
 async def knucklebones_inicio(screen):
@@ -34,6 +35,7 @@ async def knucklebones_inicio(screen):
     }
     
     screen.clear()
+    loop = FrameLoop(screen)
     auth = UserSessionManager()
     
     try:
@@ -47,7 +49,7 @@ async def knucklebones_inicio(screen):
                 print_text(screen, error_text, True)
                 screen.refresh()
                 
-                event = screen.get_event()
+                event = loop.next_event()
                 if event and hasattr(event, 'key') and event.key:
                     return False
         
@@ -60,7 +62,7 @@ async def knucklebones_inicio(screen):
             print_text(screen, error_text, True)
             screen.refresh()
             
-            event = screen.get_event()
+            event = loop.next_event()
             if event and hasattr(event, 'key') and event.key:
                 return False
     
@@ -69,7 +71,7 @@ async def knucklebones_inicio(screen):
         print_text(screen, text, True)
         screen.refresh()
         
-        event = screen.get_event()
+        event = loop.next_event()
         button_inicio = print_button(
             screen,
             boton_text,
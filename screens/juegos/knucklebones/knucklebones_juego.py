@@ -1,11 +1,13 @@
-import copy
 from servidor.src.utils.pretty_printer import PrettyPrinter
 from servidor.src.model.usuario import UsuarioServicio
 
 from servidor.src.utils.firestore import add_realtime_listener
-from .dados import get_dado
-from ....utils.events import add_key_listener, get_remaining_cooldown
+from .dados import atlas_dados
+from ....utils.events import Keymap, get_remaining_cooldown
+from ....utils.frame_loop import FrameLoop
 from ....utils.printers import print_card, print_text
+from ....utils.realtime import DocumentMirror
+from ....utils.retained import enable_retained_mode
 from asciimatics.screen import Screen
 import pyfiglet
 from asciimatics.event import MouseEvent
@@ -24,6 +26,7 @@ def knucklebones_juego(screen, id_sala=None, jugador=None, salaDeJuego=None):
     color1 = [Screen.COLOUR_DEFAULT] * 9
     color2 = [Screen.COLOUR_DEFAULT] * 9
     print_vs_data ={
+        'key': 'vs',
         'text': 'V.S', 
         'x-center': 0, 
         'y-center': 0, 
@@ -43,25 +46,85 @@ def knucklebones_juego(screen, id_sala=None, jugador=None, salaDeJuego=None):
         'color': Screen.COLOUR_MAGENTA,
     }
     
+
+    def crear_tablero(key, x_center, colores):
+        """Crea una sola vez el tablero de un jugador con sus 9 celdas y sus filas clickeables."""
+        tablero = dict(print_card_data)
+        tablero['key'] = key
+        tablero['x-center'] = x_center
+        tablero['y-center'] = 0
+        tablero['click'] = {
+            str(i): {'event': None, 'click': lambda i=i: str(i)} for i in range(3)
+        }
+        tablero['content'] = {
+            str(i): {
+                'text': atlas_dados.cara(0),
+                'padding-top': 1,
+                'padding-left': 2,
+                'color': colores[i],
+            } for i in range(9)
+        }
+        # Dado mostrado en cada celda, para detectar cambios
+        tablero['valores'] = [0] * 9
+        return tablero
+
+    def actualizar_dados(tablero, mesa):
+        """Actualiza en el tablero solo las celdas cuyo dado cambió."""
+        content = tablero['content']
+        valores = tablero['valores']
+        for i in range(9):
+            valor = mesa[i] if i < len(mesa) else 0
+            if valores[i] != valor:
+                valores[i] = valor
+                content[str(i)]['text'] = atlas_dados.cara(valor)
+
+    def actualizar_tablero(tablero, colores, event_mouse):
+        """Actualiza los colores de las celdas y el evento de las filas clickeables."""
+        content = tablero['content']
+        for i in range(9):
+            celda = content[str(i)]
+            if celda['color'] != colores[i]:
+                celda['color'] = colores[i]
+        for fila in tablero['click'].values():
+            fila['event'] = event_mouse
+
+    tablero_1 = crear_tablero('tablero_1', -40, color1)
+    tablero_2 = crear_tablero('tablero_2', 40, color2)
+
     data = None
     index_jugador = 0
+    # Copia local de la sala: el listener aplica los cambios y el bucle solo
+    # rehace lo que depende de los campos que cambiaron
+    sala = DocumentMirror()
+
+    def actualizar_jugadores(jugadores):
+        nonlocal index_jugador
+        index_jugador = next((i for i, uid in enumerate(jugadores or ()) if uid == jugador.get_id()), 0)
+
+    sala.on_change('jugadores', actualizar_jugadores)
+    sala.on_change('mesa_jugador_0', lambda mesa: actualizar_dados(tablero_1, mesa or ()))
+    sala.on_change('mesa_jugador_1', lambda mesa: actualizar_dados(tablero_2, mesa or ()))
     
     usuario_servicio = UsuarioServicio()
     def mi_callback(doc_data, changes, read_time):
-        """Callback que se ejecuta cuando hay cambios"""
-        nonlocal data, index_jugador
-        if doc_data:
-            data = doc_data
-            index_jugador = next((i for i, uid in enumerate(doc_data.get('jugadores', [])) if uid == jugador.get_id()), 0)
-        else:
+        """Callback que se ejecuta cuando hay cambios (en el hilo del listener)"""
+        if not doc_data:
             print("📡 Documento eliminado o no existe")
-            data = None
+            doc_data = None
+        # Aplicar los cambios y despertar el bucle de render para mostrarlos de inmediato
+        sala.apply(doc_data, changes, read_time)
     
     
     def mi_error_callback(error):
         """Callback para manejar errores"""
         print(f"❌ Error en listener: {error}")
     
+    # Modo retenido: los tableros solo redibujan las celdas que cambian
+    renderer = enable_retained_mode(screen)
+    loop = FrameLoop(screen)
+    keymap = Keymap()
+    keymap.bind(ord('f'), lambda: 'salir')
+
     unsubscribe = add_realtime_listener(
         'salas_de_juego_activas', 
         id_sala,
@@ -75,15 +138,17 @@ def knucklebones_juego(screen, id_sala=None, jugador=None, salaDeJuego=None):
         
         # Mostrar información de cooldown para debug (opcional)
         cooldown_info = []
-        for i in range(3):
-            element_id = f"grid_column_{i}_"  # Prefijo del ID
-            remaining = get_remaining_cooldown(element_id + "0_0")  # Aproximación para debug
-            if remaining > 0:
-                cooldown_info.append(f"Col {i}: {remaining:.1f}s")
+        for tablero in ('tablero_1', 'tablero_2'):
+            for i in range(3):
+                # Identidad de la fila clickeable i del tablero (ver print_card)
+                remaining = get_remaining_cooldown((tablero, 'grid_row', i))
+                if remaining > 0:
+                    cooldown_info.append(f"{tablero} fila {i}: {remaining:.1f}s")
         
         if cooldown_info:
             cooldown_text = " | ".join(cooldown_info)
             print_text(screen, {
+                'key': 'cooldown',
                 'text': f"Cooldown: {cooldown_text}",
                 'x-center': 0,
                 'y-center': -15,
@@ -91,81 +156,25 @@ def knucklebones_juego(screen, id_sala=None, jugador=None, salaDeJuego=None):
             })
         
         # Obtener eventos
-        event = screen.get_event()
+        event = loop.next_event()
         # Guardar el último MouseEvent válido
         if isinstance(event, MouseEvent):
             last_mouse_event = event
         event_mouse = last_mouse_event
         
-        # Configuración de la primera carta (jugador 1)
-        print_card_data_1 = copy.deepcopy(print_card_data)
-        print_card_data_1['x-center'] = -40
-        print_card_data_1['y-center'] = 0
-        print_card_data_1['click'] = {
-            '0': {'event': event_mouse, 'click': lambda: '0'},
-            '1': {'event': event_mouse, 'click': lambda: '1'},
-            '2': {'event': event_mouse, 'click': lambda: '2'},
-        }
-        print_card_data_1['content'] = {
-            str(i): {
-                'text': get_dado((i % 3) + 1),
-                'padding-top': 1,
-                'padding-left': 2,
-                'color': color1[i],
-            } for i in range(9)
-        }
-        if data is not None:
-            # Si hay datos de la sala, usar los dados del jugador 2
-            print_card_data_1['content'] = {
-                str(i): {
-                    'text': get_dado(data['mesa_jugador_0'][i]),
-                    'padding-top': 1,
-                    'padding-left': 2,
-                    'color': color1[i],
-                } for i in range(len(data['mesa_jugador_0']))
-            }
-        else:
-            print_card_data_1['content'] = {
-                str(i): {
-                    'text': get_dado(0),
-                    'padding-top': 1,
-                    'padding-left': 2,
-                    'color': color1[i],
-                } for i in range(9)
-            }
-        
-        # Configuración de la segunda carta (jugador 2)
-        print_card_data_2 = copy.deepcopy(print_card_data)
-        print_card_data_2['x-center'] = 40
-        print_card_data_2['y-center'] = 0
-        print_card_data_2['click'] = {
-            '0': {'event': event_mouse, 'click': lambda: '0'},
-            '1': {'event': event_mouse, 'click': lambda: '1'},
-            '2': {'event': event_mouse, 'click': lambda: '2'},
-        }
-        if data is not None:
-            # Si hay datos de la sala, usar los dados del jugador 2
-            print_card_data_2['content'] = {
-                str(i): {
-                    'text': get_dado(data['mesa_jugador_1'][i]),
-                    'padding-top': 1,
-                    'padding-left': 2,
-                    'color': color2[i],
-                } for i in range(len(data['mesa_jugador_1']))
-            }
-        else:
-            print_card_data_2['content'] = {
-                str(i): {
-                    'text': get_dado(0),
-                    'padding-top': 1,
-                    'padding-left': 2,
-                    'color': color2[i],
-                } for i in range(9)
-            }        # Dibujar las cartas
-        card_1 = print_card(screen, print_card_data_1, event_mouse)
-        card_2 = print_card(screen, print_card_data_2, event_mouse)
+        # Tomar el último estado completo de la sala; los tableros solo se
+        # actualizan si cambió su campo (ver los handlers de 'sala')
+        sala.poll()
+        data = sala.data
+        actualizar_tablero(tablero_1, color1, event_mouse)
+        actualizar_tablero(tablero_2, color2, event_mouse)
+
+        # Dibujar las cartas
+        card_1 = print_card(screen, tablero_1, event_mouse)
+        card_2 = print_card(screen, tablero_2, event_mouse)
         
         jugador_print = print_text(screen, {
+            'key': 'jugador',
             'text': (data['jugadores'][0] if 
                     data is not None and len(data['jugadores']) > index_jugador else ''),
             'x': card_1['x_position'] + 2,
@@ -173,6 +182,7 @@ def knucklebones_juego(screen, id_sala=None, jugador=None, salaDeJuego=None):
             'color': Screen.COLOUR_CYAN        })
         
         jugador_activo = print_text(screen, {
+            'key': 'turno',
             'text': data['turnoActivo'] if data is not None else '',
             'x-center': 0,
             'y-center': card_2['y_position'],
@@ -199,7 +209,7 @@ def knucklebones_juego(screen, id_sala=None, jugador=None, salaDeJuego=None):
         #         color2[idx + 3] = Screen.COLOUR_GREEN if color2[idx + 3] == Screen.COLOUR_DEFAULT else Screen.COLOUR_DEFAULT
         #         color2[idx + 6] = Screen.COLOUR_GREEN if color2[idx + 6] == Screen.COLOUR_DEFAULT else Screen.COLOUR_DEFAULT
           # Verificar si el usuario quiere salir
-        salir = add_key_listener(ord('f'), event, lambda: 'salir')
+        salir = keymap.dispatch(event)
         if salir == 'salir':
             # Detener el listener antes de salir
             if unsubscribe:
@@ -207,4 +217,5 @@ def knucklebones_juego(screen, id_sala=None, jugador=None, salaDeJuego=None):
             return 'salir'
         
         # Actualizar la pantalla después de dibujar todo el contenido
+        renderer.end_frame(screen)
         screen.refresh()
\ No newline at end of file
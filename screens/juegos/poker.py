@@ -1,13 +1,17 @@
-from ...utils.events import add_key_listener
+from ...utils.events import Keymap
+from ...utils.frame_loop import FrameLoop
 from ...utils.printers import print_text
 
 
 def poker(screen):
     screen.clear()
+    loop = FrameLoop(screen)
+    keymap = Keymap()
+    keymap.bind(ord('f'), lambda: 'salir')
     while True:
         print_text(screen, {'text': 'Poker Game', 'x-center': 0, 'y-center': 0})
         screen.refresh()
-        event = screen.get_event()
-        salir = add_key_listener(ord('f'), event, lambda: 'salir')
+        event = loop.next_event()
+        salir = keymap.dispatch(event)
         if salir == 'salir':
             return 'salir'
\ No newline at end of file
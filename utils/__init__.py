@@ -3,15 +3,40 @@ Utilidades del cliente para el Casino Virtual
 """
 
 # Importar todas las utilidades
-from .events import add_key_listener
-from .helpers import create_card, font_tester, font_tester_recomded
+from .ascii_art import font_pool, render_figlet, get_render_cache_stats, clear_render_cache
+from .async_wrapper import NetworkRuntime, network_runtime
+from .cache import LRUCache
+from .events import add_key_listener, get_hit_registry, Keymap, CooldownStore
+from .frame_buffer import FrameBuffer
+from .frame_loop import FrameLoop, wake_frame_loop
+from .helpers import create_card, create_card_sprite, get_card_sprite_stats, font_tester, font_tester_recomded
 from .printers import print_button, print_text, print_card, print_input, print_form
+from .profiler import render_profiler
+from .realtime import SnapshotChannel, DocumentMirror
+from .text_block import TextBlock
 from .user_session import UserSessionManager
+from .virtual_screen import VirtualScreen
+from .write_behind import WriteBehindQueue
 
 # Exportar todo
 __all__ = [
+    "font_pool",
+    "render_figlet",
+    "get_render_cache_stats",
+    "clear_render_cache",
+    "NetworkRuntime",
+    "network_runtime",
+    "LRUCache",
     "add_key_listener",
+    "get_hit_registry",
+    "Keymap",
+    "CooldownStore",
+    "FrameBuffer",
+    "FrameLoop",
+    "wake_frame_loop",
     "create_card",
+    "create_card_sprite",
+    "get_card_sprite_stats",
     "font_tester",
     "font_tester_recomded", 
     "print_button",
@@ -19,5 +44,11 @@ __all__ = [
     "print_card",
     "print_input",
     "print_form",
-    "UserSessionManager"
+    "render_profiler",
+    "SnapshotChannel",
+    "DocumentMirror",
+    "TextBlock",
+    "UserSessionManager",
+    "VirtualScreen",
+    "WriteBehindQueue"
 ]
\ No newline at end of file
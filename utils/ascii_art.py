@@ -0,0 +1,133 @@
+"""
+Renderizado de arte ASCII con pyfiglet y caché de resultados
+"""
+import threading
+
+from pyfiglet import Figlet, FigletFont
+
+from .cache import LRUCache
+
+# Fuentes usadas por las pantallas del cliente
+SCREEN_FONTS = ('big_money-ne', 'elite', 'slant')
+
+
+class FontPool:
+    """
+    Pool de fuentes de pyfiglet compartido por todo el proceso.
+
+    Cada fuente se localiza y se parsea una sola vez; los renders posteriores
+    reutilizan el objeto FigletFont ya cargado. Las fuentes que no se pudieron
+    precargar quedan en 'failed' (nombre -> excepción).
+    """
+
+    def __init__(self):
+        self._fonts = {}
+        self._lock = threading.Lock()
+        self.failed = {}
+
+    def get(self, name: str) -> FigletFont:
+        """
+        Obtiene una fuente cargándola la primera vez que se pide.
+
+        Args:
+            name (str): Nombre de la fuente de pyfiglet.
+
+        Returns:
+            FigletFont: Fuente ya parseada.
+        """
+        font = self._fonts.get(name)
+        if font is None:
+            with self._lock:
+                font = self._fonts.get(name)
+                if font is None:
+                    font = FigletFont(font=name)
+                    self._fonts[name] = font
+        return font
+
+    def warm_up(self, fonts=SCREEN_FONTS, background: bool = False):
+        """
+        Precarga un conjunto de fuentes para evitar tirones en el primer render.
+
+        No imprime nada (puede correr con la pantalla activa): los errores quedan
+        en 'failed' y el primer render con esa fuente vuelve a intentar cargarla.
+
+        Args:
+            fonts (iterable): Nombres de las fuentes a cargar.
+            background (bool): Si es True, carga las fuentes en un hilo daemon.
+
+        Returns:
+            threading.Thread | None: El hilo de carga si 'background' es True.
+        """
+        fonts = tuple(fonts)
+
+        def load():
+            for name in fonts:
+                try:
+                    self.get(name)
+                    self.failed.pop(name, None)
+                except Exception as e:
+                    self.failed[name] = e
+
+        if not background:
+            load()
+            return None
+        thread = threading.Thread(target=load, name='font-pool-warm-up', daemon=True)
+        thread.start()
+        return thread
+
+    def __contains__(self, name) -> bool:
+        return name in self._fonts
+
+
+# Instancia global del pool de fuentes
+font_pool = FontPool()
+
+
+class _PooledFiglet(Figlet):
+    """Figlet que toma sus fuentes del pool en lugar de parsear el archivo cada vez."""
+
+    def setFont(self, **kwargs):
+        if 'font' in kwargs:
+            self.font = kwargs['font']
+        self.Font = font_pool.get(self.font)
+
+
+def _lines_size(lines) -> int:
+    """Tamaño aproximado de un render: número total de caracteres."""
+    return sum(len(line) for line in lines)
+
+
+# Caché global de renders: (texto, fuente, ancho máximo, justificación) -> líneas
+_render_cache = LRUCache(max_entries=128, max_size=256 * 1024, sizeof=_lines_size)
+
+
+def render_figlet(text: str, font: str = 'slant', width: int = 100, justify: str = 'left') -> tuple:
+    """
+    Renderiza un texto como arte ASCII reutilizando renders anteriores.
+
+    Args:
+        text (str): Texto a renderizar.
+        font (str): Fuente de pyfiglet.
+        width (int): Ancho máximo del render.
+        justify (str): Justificación ('left', 'center', 'right').
+
+    Returns:
+        tuple: Líneas del arte ASCII ya separadas.
+    """
+    key = (text, font, width, justify)
+    lines = _render_cache.get(key)
+    if lines is None:
+        figlet = _PooledFiglet(font=font, width=width, justify=justify)
+        lines = tuple(figlet.renderText(text).split('\n'))
+        _render_cache.put(key, lines)
+    return lines
+
+
+def get_render_cache_stats() -> dict:
+    """Retorna los contadores de aciertos, fallos y expulsiones de la caché de renders."""
+    return _render_cache.stats()
+
+
+def clear_render_cache() -> None:
+    """Vacía la caché de renders de arte ASCII."""
+    _render_cache.clear()
@@ -3,8 +3,11 @@ Utilidades para manejar funciones asíncronas con asciimatics
 """
 import asyncio
 import functools
+import threading
 from typing import Callable, Any
 
+from .frame_loop import wake_frame_loop
+
 
 def async_screen_wrapper(async_func: Callable) -> Callable:
     """
@@ -86,34 +89,199 @@ def run_async_in_screen(async_func: Callable, *args, **kwargs) -> Any:
     return loop.run_until_complete(async_func(*args, **kwargs))
 
 
+class NetworkRuntime:
+    """
+    Event loop persistente en un hilo dedicado para toda la red del cliente.
+
+    Todas las pantallas comparten el mismo loop: las corrutinas se envían con
+    'submit' y retornan un concurrent.futures.Future que el bucle de render
+    consulta con 'done()' sin bloquear. Al terminar cada corrutina se despierta
+    el FrameLoop para que la pantalla muestre el resultado de inmediato.
+
+    Los clientes de red (servicios de Firestore, etc.) se guardan con 'client'
+    y se reutilizan entre pantallas, así no se vuelven a crear ni a conectar.
+
+    Ejemplo de uso:
+        red = network_runtime.scope('blackjack_inicio')
+        futuro = red.submit(servicio.crear_sala_de_juego_activa(datos))
+        while True:
+            event = loop.next_event()
+            if futuro.done():
+                sala_id = futuro.result()
+            ...
+        red.close()  # Cancela lo pendiente de la pantalla al salir
+    """
+
+    def __init__(self, name: str = 'network'):
+        """
+        Args:
+            name (str): Nombre del hilo de red.
+        """
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._clients = {}
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop de red; se crea (junto con su hilo) la primera vez que se usa."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                self._thread = threading.Thread(target=self._run, args=(self._loop, ready), name=self.name, daemon=True)
+                self._thread.start()
+                ready.wait()
+            return self._loop
+
+    @staticmethod
+    def _run(loop, ready) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    def submit(self, coro, wake: bool = True):
+        """
+        Programa una corrutina en el loop de red sin bloquear.
+
+        Args:
+            coro: Corrutina a ejecutar.
+            wake (bool): Si es True, despierta el FrameLoop cuando termina.
+
+        Returns:
+            concurrent.futures.Future: Resultado de la corrutina.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if wake:
+            future.add_done_callback(lambda _: wake_frame_loop())
+        return future
+
+    def run(self, coro, timeout: float = None):
+        """Ejecuta una corrutina en el loop de red y espera su resultado (bloquea al llamador)."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("run() no se puede llamar desde el hilo de red")
+        return self.submit(coro, wake=False).result(timeout)
+
+    def client(self, key, factory: Callable):
+        """
+        Retorna un cliente de red compartido, creándolo la primera vez.
+
+        Args:
+            key: Nombre del cliente (por ejemplo 'salas').
+            factory (callable): Crea el cliente si todavía no existe.
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = factory()
+            return client
+
+    def scope(self, name: str = None) -> 'NetworkScope':
+        """Crea un ámbito de red para una pantalla (ver NetworkScope)."""
+        return NetworkScope(self, name)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Cancela todo lo pendiente, detiene el loop y descarta los clientes."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            self._clients.clear()
+        if loop is None or loop.is_closed():
+            return
+
+        async def _cancel_all():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_all(), loop).result(timeout)
+        except Exception:
+            pass  # Las tareas que no terminen a tiempo se descartan con el loop
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+
+class NetworkScope:
+    """
+    Operaciones de red de una pantalla sobre el NetworkRuntime compartido.
+
+    Lleva la cuenta de los futuros que lanzó la pantalla para cancelarlos con
+    'close()' al salir, sin tocar el loop ni los clientes que usan las demás.
+    """
+
+    def __init__(self, runtime: NetworkRuntime, name: str = None):
+        self.runtime = runtime
+        self.name = name
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def submit(self, coro, wake: bool = True):
+        """Como NetworkRuntime.submit, pero el futuro se cancela al cerrar el ámbito."""
+        future = self.runtime.submit(coro, wake)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def run(self, coro, timeout: float = None):
+        """Ejecuta una corrutina en el loop de red y espera su resultado."""
+        future = self.submit(coro, wake=False)
+        return future.result(timeout)
+
+    def pending(self) -> int:
+        """Número de operaciones del ámbito que no han terminado."""
+        with self._lock:
+            return len(self._futures)
+
+    def close(self) -> None:
+        """Cancela las operaciones pendientes del ámbito."""
+        with self._lock:
+            futures = list(self._futures)
+            self._futures.clear()
+        for future in futures:
+            future.cancel()
+
+
+# Runtime de red global compartido por todas las pantallas
+network_runtime = NetworkRuntime()
+
+
 class AsyncScreenManager:
     """
     Gestor para manejar operaciones asíncronas en pantallas de asciimatics
+
+    Se mantiene por compatibilidad: ya no crea un event loop propio, sino que
+    ejecuta las corrutinas en el NetworkRuntime compartido. 'close()' solo
+    cancela lo que lanzó este gestor.
     """
     
     def __init__(self):
-        self._loop = None
+        self._scope = None
     
     def ensure_loop(self):
-        """Asegura que existe un loop de eventos"""
-        if self._loop is None or self._loop.is_closed():
-            try:
-                self._loop = asyncio.get_running_loop()
-            except RuntimeError:
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
-        return self._loop
+        """Retorna el loop de red compartido"""
+        return network_runtime.loop
     
     def run_async(self, coro):
         """Ejecuta una corrutina y retorna el resultado"""
-        loop = self.ensure_loop()
-        return loop.run_until_complete(coro)
+        if self._scope is None:
+            self._scope = network_runtime.scope()
+        return self._scope.run(coro)
     
     def close(self):
-        """Cierra el loop de eventos"""
-        if self._loop and not self._loop.is_closed():
-            self._loop.close()
-            self._loop = None
+        """Cancela las operaciones pendientes del gestor"""
+        if self._scope is not None:
+            self._scope.close()
+            self._scope = None
 
 
 # Instancia global del gestor async
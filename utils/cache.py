@@ -0,0 +1,94 @@
+"""
+Caché LRU acotada para reutilizar resultados de renderizado entre frames
+"""
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Caché LRU acotada por número de entradas y, opcionalmente, por tamaño total.
+
+    El tamaño de cada valor se calcula con la función 'sizeof' (por defecto cada
+    entrada cuenta como 1). Cuando se supera cualquiera de los dos límites se
+    expulsan las entradas menos usadas recientemente.
+    """
+
+    def __init__(self, max_entries: int = 256, max_size: int | None = None, sizeof=None):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_entries (int): Número máximo de entradas almacenadas.
+            max_size (int | None): Tamaño total máximo (según 'sizeof'). None para no limitar.
+            sizeof (callable | None): Función que recibe un valor y retorna su tamaño.
+        """
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._sizeof = sizeof if sizeof is not None else (lambda value: 1)
+        self._data = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Obtiene un valor y lo marca como usado recientemente."""
+        try:
+            value, _ = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        """Guarda un valor expulsando las entradas más antiguas si es necesario."""
+        size = self._sizeof(value)
+        if key in self._data:
+            self._size -= self._data.pop(key)[1]
+        if self.max_size is not None and size > self.max_size:
+            # Un valor más grande que toda la caché nunca se guarda
+            return
+        self._data[key] = (value, size)
+        self._size += size
+        while len(self._data) > self.max_entries or (
+            self.max_size is not None and self._size > self.max_size
+        ):
+            _, (_, old_size) = self._data.popitem(last=False)
+            self._size -= old_size
+            self.evictions += 1
+
+    def get_or_create(self, key, factory):
+        """Retorna el valor de 'key' o lo crea con 'factory()' si no existe."""
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Vacía la caché sin reiniciar los contadores."""
+        self._data.clear()
+        self._size = 0
+
+    def stats(self) -> dict:
+        """
+        Retorna las estadísticas de uso de la caché.
+
+        Returns:
+            dict: 'hits', 'misses', 'evictions', 'entries' y 'size'.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._data),
+            'size': self._size
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
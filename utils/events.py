@@ -1,11 +1,243 @@
 from asciimatics.event import MouseEvent, KeyboardEvent
 from asciimatics.screen import Screen
+from collections import OrderedDict
 import time
 
 from .printers import print_text
 
-# Diccionario global para almacenar los últimos tiempos de click por elemento
-_last_click_times = {}
+
+class CooldownStore:
+    """
+    Almacén acotado de cooldowns de click.
+
+    Guarda, por identidad de widget, el instante (reloj monotónico) hasta el que
+    el widget está bloqueado. Las entradas vencidas se eliminan solas y el
+    número total de entradas nunca supera 'max_entries', así que los widgets que
+    desaparecen de pantalla no se acumulan.
+    """
+
+    def __init__(self, max_entries: int = 512, clock=time.monotonic):
+        """
+        Inicializa el almacén.
+
+        Args:
+            max_entries (int): Número máximo de cooldowns guardados a la vez.
+            clock (callable): Reloj monotónico en segundos.
+        """
+        self.max_entries = max_entries
+        self._clock = clock
+        # identidad del widget -> instante en que vence el cooldown
+        self._deadlines = OrderedDict()
+
+    def block(self, key, seconds: float) -> None:
+        """Bloquea un widget durante 'seconds' segundos a partir de ahora."""
+        now = self._clock()
+        self._deadlines.pop(key, None)
+        self._deadlines[key] = now + seconds
+        self._evict(now)
+
+    def remaining(self, key) -> float:
+        """Segundos que le quedan al cooldown de un widget (0 si no tiene)."""
+        deadline = self._deadlines.get(key)
+        if deadline is None:
+            return 0
+        remaining = deadline - self._clock()
+        if remaining <= 0:
+            del self._deadlines[key]
+            return 0
+        return remaining
+
+    def try_acquire(self, key, seconds: float) -> bool:
+        """
+        Si el widget no está en cooldown, lo bloquea y retorna True.
+
+        Args:
+            key: Identidad del widget.
+            seconds (float): Duración del nuevo cooldown.
+        """
+        if self.remaining(key) > 0:
+            return False
+        self.block(key, seconds)
+        return True
+
+    def _evict(self, now: float) -> None:
+        """Elimina las entradas vencidas más antiguas y las que exceden el límite."""
+        while self._deadlines:
+            key, deadline = next(iter(self._deadlines.items()))
+            if deadline > now and len(self._deadlines) <= self.max_entries:
+                break
+            del self._deadlines[key]
+
+    def clear(self) -> None:
+        """Elimina todos los cooldowns."""
+        self._deadlines.clear()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key) -> bool:
+        return self.remaining(key) > 0
+
+
+# Cooldowns de click de todos los widgets
+_click_cooldowns = CooldownStore()
+
+
+class HitTestIndex:
+    """
+    Índice espacial de rectángulos clickeables sobre una rejilla uniforme.
+
+    Cada rectángulo se guarda en las celdas de la rejilla que toca, así que
+    encontrar el rectángulo bajo un punto solo revisa los de una celda.
+    Queda encima el de la capa ('z') más alta; en la misma capa, el registrado
+    último.
+    """
+
+    def __init__(self, cell_width: int = 16, cell_height: int = 4):
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self._buckets = {}
+        self._rects = {}
+
+    def add(self, key, x: int, y: int, width: int, height: int, z: int = 0) -> None:
+        """Registra el rectángulo de un widget en la capa 'z'."""
+        self._rects[key] = (x, y, width, height, z)
+        if width <= 0 or height <= 0:
+            return
+        rect = (key, x, y, width, height, z)
+        for cx in range(x // self.cell_width, (x + width - 1) // self.cell_width + 1):
+            for cy in range(y // self.cell_height, (y + height - 1) // self.cell_height + 1):
+                self._buckets.setdefault((cx, cy), []).append(rect)
+
+    def topmost(self, x: int, y: int):
+        """Retorna (clave, z) del widget que queda encima en (x, y), o None."""
+        best = None
+        bucket = self._buckets.get((x // self.cell_width, y // self.cell_height))
+        if bucket:
+            for key, rx, ry, width, height, z in reversed(bucket):
+                if (best is None or z > best[1]) and rx <= x < rx + width and ry <= y < ry + height:
+                    best = (key, z)
+        return best
+
+    def rect(self, key):
+        """Retorna (x, y, ancho, alto, z) de un widget registrado, o None."""
+        return self._rects.get(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._rects
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+
+class HitTestRegistry:
+    """
+    Registro por frame de las áreas clickeables.
+
+    Los widgets registran su rectángulo mientras se dibujan, en la capa actual:
+    un contenedor llama a 'push_layer()' antes de dibujar sus hijos, así los
+    hijos quedan encima aunque el contenedor registre su área después.
+
+    Cada MouseEvent se despacha una sola vez: se busca el widget superior en el
+    índice del frame anterior (el layout completo ya es conocido) y cada widget
+    solo compara su clave con ese resultado. Los widgets que no estaban en el
+    frame anterior (o que se movieron) prueban su rectángulo y solo reciben el
+    click si ningún widget de una capa igual o superior ya lo recibió, de modo
+    que el resultado es el mismo desde el primer frame.
+
+    Un frame nuevo empieza al llamar a 'new_frame()' o, automáticamente, cuando
+    un widget se registra por segunda vez.
+    """
+
+    def __init__(self):
+        self._current = HitTestIndex()
+        self._previous = HitTestIndex()
+        self._target_cache = None
+        # (evento, capa) del último widget que recibió un click
+        self._claim = None
+        self.layer = 0
+
+    def new_frame(self) -> None:
+        """Cierra el frame actual; su índice pasa a usarse para resolver los clicks."""
+        if len(self._current):
+            self._previous = self._current
+            self._current = HitTestIndex()
+        self._target_cache = None
+        self._claim = None
+
+    def push_layer(self) -> None:
+        """Sube una capa: lo que se registre hasta 'pop_layer()' queda encima."""
+        self.layer += 1
+
+    def pop_layer(self) -> None:
+        """Vuelve a la capa anterior."""
+        self.layer = max(0, self.layer - 1)
+
+    def register(self, key, data: dict) -> None:
+        """Registra el rectángulo de un widget en el frame y la capa actuales."""
+        if key in self._current:
+            self.new_frame()
+        self._current.add(key, data['x_position'], data['y_position'], data['width'], data['height'], self.layer)
+
+    @staticmethod
+    def _event_key(event):
+        return (id(event), event.x, event.y)
+
+    def _resolve(self, event):
+        """(clave, z) del widget superior bajo el evento en el frame anterior, resuelto una vez por evento."""
+        cache_key = self._event_key(event)
+        if self._target_cache is None or self._target_cache[0] != cache_key:
+            self._target_cache = (cache_key, self._previous.topmost(event.x, event.y))
+        return self._target_cache[1]
+
+    def target(self, event):
+        """Retorna la clave del widget superior bajo el MouseEvent, o None."""
+        resolved = self._resolve(event)
+        return resolved[0] if resolved is not None else None
+
+    def hit(self, key, data: dict, event) -> bool:
+        """
+        Indica si el widget 'key' (ya registrado en este frame) recibe el click.
+
+        Args:
+            key: Clave del widget.
+            data (dict): Rectángulo del widget ('x_position', 'y_position', 'width', 'height').
+            event: MouseEvent a despachar.
+        """
+        resolved = self._resolve(event)
+        x, y, width, height = data['x_position'], data['y_position'], data['width'], data['height']
+        if self._previous.rect(key) == (x, y, width, height, self.layer):
+            # Widget conocido: decide el despacho del evento, sin volver a probar el rectángulo
+            accepted = resolved is not None and resolved[0] == key
+        else:
+            # Widget nuevo o que se movió: no puede quitarle el click a uno de una capa igual o superior
+            accepted = (
+                x <= event.x < x + width and y <= event.y < y + height
+                and (resolved is None or resolved[1] < self.layer)
+            )
+        if accepted:
+            claim = self._claim
+            if claim is not None and claim[0] == self._event_key(event) and claim[1] >= self.layer:
+                return False
+            self._claim = (self._event_key(event), self.layer)
+        return accepted
+
+    def clear(self) -> None:
+        """Olvida todas las áreas registradas."""
+        self._current = HitTestIndex()
+        self._previous = HitTestIndex()
+        self._target_cache = None
+        self._claim = None
+        self.layer = 0
+
+
+# Registro global de áreas clickeables
+_hit_registry = HitTestRegistry()
+
+
+def get_hit_registry() -> HitTestRegistry:
+    """Retorna el registro global de áreas clickeables."""
+    return _hit_registry
 
 def key_listener_test(screen, event):
     """
@@ -72,6 +304,114 @@ def add_key_listener(key_codes, event, callback):
         
     return None
 
+# Prioridad con la que los formularios registran sus teclas en un Keymap compartido
+FORM_KEY_PRIORITY = 10
+
+
+class Keymap:
+    """
+    Tabla central de atajos de teclado.
+
+    Cada código de tecla tiene una pila de manejadores. Al despachar un evento
+    solo se ejecuta uno: el de mayor prioridad; a igual prioridad, el del scope
+    activado más recientemente; y a igual scope, el registrado último. Así los
+    conflictos entre un formulario y su pantalla se resuelven siempre igual.
+
+    Los manejadores con scope None están siempre activos; el resto solo cuando
+    su scope fue activado con 'push_scope'.
+
+    Ejemplo de uso:
+        keymap = Keymap()
+        keymap.bind(ord('f'), lambda: 'salir')
+        while True:
+            event = loop.next_event()
+            if keymap.dispatch(event) == 'salir':
+                return 'salir'
+    """
+
+    def __init__(self):
+        # código de tecla -> lista de (prioridad, orden, scope, manejador)
+        self._handlers = {}
+        self._scopes = []
+        self._order = 0
+
+    def bind(self, key_codes, handler, scope=None, priority: int = 0) -> None:
+        """
+        Registra un manejador para una o varias teclas.
+
+        Args:
+            key_codes (int | list): Código(s) de la(s) tecla(s).
+            handler (callable): Función sin argumentos a ejecutar.
+            scope: Scope al que pertenece el manejador (None para global).
+            priority (int): Prioridad; gana la mayor.
+        """
+        if not isinstance(key_codes, (list, tuple)):
+            key_codes = [key_codes]
+        self._order += 1
+        for key_code in key_codes:
+            self._handlers.setdefault(key_code, []).append((priority, self._order, scope, handler))
+
+    def unbind(self, scope) -> None:
+        """Elimina todos los manejadores de un scope."""
+        for key_code in list(self._handlers):
+            handlers = [entry for entry in self._handlers[key_code] if entry[2] != scope]
+            if handlers:
+                self._handlers[key_code] = handlers
+            else:
+                del self._handlers[key_code]
+        self.pop_scope(scope)
+
+    def push_scope(self, scope) -> None:
+        """Activa un scope (o lo pasa al tope si ya estaba activo)."""
+        if self._scopes and self._scopes[-1] == scope:
+            return
+        if scope in self._scopes:
+            self._scopes.remove(scope)
+        self._scopes.append(scope)
+
+    def pop_scope(self, scope=None) -> None:
+        """Desactiva un scope; sin argumentos, el último activado."""
+        if scope is None:
+            if self._scopes:
+                self._scopes.pop()
+        elif scope in self._scopes:
+            self._scopes.remove(scope)
+
+    def is_bound(self, scope) -> bool:
+        """Indica si un scope tiene manejadores registrados."""
+        return any(entry[2] == scope for handlers in self._handlers.values() for entry in handlers)
+
+    def dispatch(self, event):
+        """
+        Ejecuta el manejador ganador para el evento.
+
+        Args:
+            event: Evento de entrada (puede ser None o de mouse).
+
+        Returns:
+            El valor retornado por el manejador, o None si ninguna tecla coincide.
+        """
+        key_code = getattr(event, 'key_code', None)
+        if key_code is None:
+            return None
+        handlers = self._handlers.get(key_code)
+        if not handlers:
+            return None
+        best = None
+        best_rank = None
+        for priority, order, scope, handler in handlers:
+            if scope is None:
+                depth = 0
+            elif scope in self._scopes:
+                depth = self._scopes.index(scope) + 1
+            else:
+                continue
+            rank = (priority, depth, order)
+            if best_rank is None or rank > best_rank:
+                best, best_rank = handler, rank
+        return best() if best is not None else None
+
+
 def add_mouse_listener(screen, data, event, callback, test=False, cooldown_seconds=0.3, element_id=None):
     """
     Agrega un listener de mouse con capacidad de cooldown para evitar clicks múltiples rápidos.
@@ -83,9 +423,12 @@ def add_mouse_listener(screen, data, event, callback, test=False, cooldown_secon
         callback: Función a ejecutar cuando se hace click
         test: Si mostrar marcadores de debug
         cooldown_seconds: Tiempo mínimo entre clicks (en segundos)
-        element_id: ID único del elemento para el cooldown (opcional)
+        element_id: Identidad del elemento para el cooldown (opcional, cualquier valor hashable)
     """
     # print(f"[DEBUG] add_mouse_listener llamada. Data: {data}")
+    # Registrar el área para resolver solapamientos entre widgets
+    hit_key = element_id if element_id is not None else (data['x_position'], data['y_position'], data['width'], data['height'])
+    _hit_registry.register(hit_key, data)
     if event is not None:
         if test:
             print_text(screen, {'text': f'8', 'x_position': data['x_position'], 'y_position': data['y_position'], 'color': Screen.COLOUR_RED})
@@ -98,19 +441,14 @@ def add_mouse_listener(screen, data, event, callback, test=False, cooldown_secon
             # print(f"[DEBUG] Área fila/columna: x={data['x_position']} y={data['y_position']} w={data['width']} h={data['height']}")
             if event.buttons != 0:
                 
-                if data['x_position'] <= event.x < data['x_position'] + data['width'] and data['y_position'] <= event.y < data['y_position'] + data['height']:
+                # Un solo despacho por evento decide qué widget (el de encima) recibe el click
+                if _hit_registry.hit(hit_key, data, event):
                     
                     # Verificar cooldown si se especifica un element_id
                     if element_id is not None:
-                        current_time = time.time()
-                        last_click_time = _last_click_times.get(element_id, 0)
-                        
-                        # Si no ha pasado suficiente tiempo desde el último click, ignorar
-                        if current_time - last_click_time < cooldown_seconds:
+                        # Si el elemento sigue en cooldown, ignorar; si no, iniciar uno nuevo
+                        if not _click_cooldowns.try_acquire(element_id, cooldown_seconds):
                             return None
-                        
-                        # Actualizar el tiempo del último click
-                        _last_click_times[element_id] = current_time
                     
                         # print("[DEBUG] ¡Click detectado en área!")
                     return callback()
@@ -128,8 +466,8 @@ def clear_click_cooldowns():
     """
     Limpia todos los cooldowns almacenados. Útil para resetear el estado entre pantallas.
     """
-    global _last_click_times
-    _last_click_times.clear()
+    _click_cooldowns.clear()
+    _hit_registry.clear()
 
 def set_custom_cooldown(element_id, cooldown_seconds=0.3):
     """
@@ -139,9 +477,7 @@ def set_custom_cooldown(element_id, cooldown_seconds=0.3):
         element_id: ID único del elemento
         cooldown_seconds: Tiempo de cooldown en segundos
     """
-    global _last_click_times
-    current_time = time.time()
-    _last_click_times[element_id] = current_time + cooldown_seconds
+    _click_cooldowns.block(element_id, cooldown_seconds)
 
 def get_remaining_cooldown(element_id):
     """
@@ -153,11 +489,4 @@ def get_remaining_cooldown(element_id):
     Returns:
         float: Tiempo restante en segundos, 0 si no hay cooldown activo
     """
-    global _last_click_times
-    if element_id not in _last_click_times:
-        return 0
-    
-    current_time = time.time()
-    last_click_time = _last_click_times[element_id]
-    remaining = last_click_time - current_time
-    return max(0, remaining)
\ No newline at end of file
+    return _click_cooldowns.remaining(element_id)
@@ -0,0 +1,150 @@
+"""
+Buffer de composición fuera de pantalla para agrupar las llamadas a print_at
+"""
+import sys
+from array import array
+
+# 'u' está obsoleto desde Python 3.13; 'w' guarda el mismo carácter Unicode
+_CHAR_TYPECODE = 'w' if sys.version_info >= (3, 13) else 'u'
+
+
+class FrameBuffer:
+    """
+    Envoltorio de una pantalla que compone el frame en memoria.
+
+    Los widgets dibujan con 'print_at' sobre planos separados (caracteres, color
+    de texto, fondo y atributos) guardados en arrays por fila. Al llamar a
+    'refresh()' (o a 'flush()') se compara cada fila con lo que ya tiene la
+    pantalla real y solo se envía el tramo que cambió, partido en los tramos
+    más largos posibles con el mismo color: las muchas llamadas pequeñas de
+    botones, dados y celdas se convierten en pocas llamadas largas, y un frame
+    sin cambios no envía nada.
+
+    El resto de atributos ('width', 'mouse', 'get_event', ...) se delegan en la
+    pantalla envuelta.
+
+    Ejemplo de uso:
+        screen = FrameBuffer(screen)
+        while True:
+            screen.refresh()  # Vuelca el buffer y refresca la terminal
+            event = screen.get_event()
+            print_card(screen, carta, event)
+    """
+
+    def __init__(self, screen):
+        object.__setattr__(self, 'screen', screen)
+        self._reset()
+
+    @staticmethod
+    def _planes(width: int, height: int) -> tuple:
+        """Crea los planos (caracteres, color, atributo, fondo) de una pantalla recién limpiada."""
+        # Mismos valores que deja Screen.clear(): texto blanco sobre fondo negro
+        blank = array(_CHAR_TYPECODE, ' ' * width)
+        white = array('h', [7]) * width
+        zeros = array('h', [0]) * width
+        return (
+            [array(_CHAR_TYPECODE, blank) for _ in range(height)],
+            [array('h', white) for _ in range(height)],
+            [array('h', zeros) for _ in range(height)],
+            [array('h', zeros) for _ in range(height)],
+        )
+
+    def _reset(self) -> None:
+        width, height = self.screen.width, self.screen.height
+        chars, fg, attrs, bgs = self._planes(width, height)
+        object.__setattr__(self, '_chars', chars)
+        object.__setattr__(self, '_fg', fg)
+        object.__setattr__(self, '_attr', attrs)
+        object.__setattr__(self, '_bg', bgs)
+        # Lo que ya tiene la pantalla real, para enviar solo las diferencias
+        object.__setattr__(self, '_front', self._planes(width, height))
+        object.__setattr__(self, '_size', (width, height))
+
+    def __getattr__(self, name):
+        return getattr(self.screen, name)
+
+    def __setattr__(self, name, value):
+        # Atributos como 'mouse' pertenecen a la pantalla real
+        setattr(self.screen, name, value)
+
+    def print_at(self, text, x: int, y: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False) -> None:
+        """Escribe un texto en el buffer con la misma firma que Screen.print_at."""
+        width, height = self._size
+        if not 0 <= y < height:
+            return
+        text = str(text)
+        start = max(0, -x)
+        end = min(len(text), width - x)
+        if start >= end:
+            return
+        chars, fg, attrs, bgs = self._chars[y], self._fg[y], self._attr[y], self._bg[y]
+        if transparent:
+            for offset in range(start, end):
+                if text[offset] != ' ':
+                    column = x + offset
+                    chars[column] = text[offset]
+                    fg[column] = colour
+                    attrs[column] = attr
+                    bgs[column] = bg
+        else:
+            x0, x1 = x + start, x + end
+            chars[x0:x1] = array(_CHAR_TYPECODE, text[start:end])
+            fg[x0:x1] = array('h', [colour]) * (x1 - x0)
+            attrs[x0:x1] = array('h', [attr]) * (x1 - x0)
+            bgs[x0:x1] = array('h', [bg]) * (x1 - x0)
+
+    def get_from(self, x: int, y: int):
+        """Retorna (código del carácter, color, atributo, fondo) de una celda del buffer."""
+        width, height = self._size
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        return ord(self._chars[y][x]), self._fg[y][x], self._attr[y][x], self._bg[y][x]
+
+    def flush(self) -> int:
+        """
+        Envía a la pantalla real las celdas que cambiaron desde el último volcado.
+
+        Las filas iguales a las de la pantalla real se descartan con una sola
+        comparación de arrays; en el resto solo se recorre el tramo que cambió.
+
+        Returns:
+            int: Número de llamadas a print_at realizadas.
+        """
+        calls = 0
+        print_at = self.screen.print_at
+        for y in range(self._size[1]):
+            chars, fg, attrs, bgs = self._chars[y], self._fg[y], self._attr[y], self._bg[y]
+            front = tuple(plane[y] for plane in self._front)
+            if chars == front[0] and fg == front[1] and attrs == front[2] and bgs == front[3]:
+                continue
+            # Primera y última celda distinta de la fila
+            changed = [
+                x for x in range(len(chars))
+                if chars[x] != front[0][x] or fg[x] != front[1][x] or attrs[x] != front[2][x] or bgs[x] != front[3][x]
+            ]
+            start, end = changed[0], changed[-1] + 1
+            run_start = start
+            run_style = (fg[start], attrs[start], bgs[start])
+            for x in range(start + 1, end):
+                style = (fg[x], attrs[x], bgs[x])
+                if style != run_style:
+                    print_at(chars[run_start:x].tounicode(), run_start, y, *run_style)
+                    calls += 1
+                    run_start, run_style = x, style
+            print_at(chars[run_start:end].tounicode(), run_start, y, *run_style)
+            calls += 1
+            front[0][start:end] = chars[start:end]
+            front[1][start:end] = fg[start:end]
+            front[2][start:end] = attrs[start:end]
+            front[3][start:end] = bgs[start:end]
+        return calls
+
+    def refresh(self) -> None:
+        """Vuelca el buffer y refresca la pantalla real."""
+        self.flush()
+        self.screen.refresh()
+
+    def clear(self) -> None:
+        """Limpia la pantalla real y el buffer."""
+        self.screen.clear()
+        self._reset()
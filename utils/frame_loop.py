@@ -0,0 +1,217 @@
+"""
+Bucle de frames dirigido por eventos para las pantallas del cliente
+
+En lugar de girar sobre 'screen.get_event()' sin pausa, el bucle se bloquea
+hasta que hay entrada en la terminal, alguien lo despierta desde otro hilo
+(por ejemplo un listener de red) o vence un temporizador.
+"""
+import os
+import select
+import sys
+import threading
+import time
+
+from asciimatics.event import MouseEvent
+
+from .events import get_hit_registry
+from .profiler import render_profiler
+
+
+class _WakeSignal:
+    """
+    Señal de despertar compartida por todo el proceso.
+
+    En sistemas POSIX usa un pipe para que 'select' pueda esperar a la vez la
+    terminal y la señal; en el resto usa un threading.Event.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._read_fd = None
+        self._write_fd = None
+        if os.name == 'posix':
+            self._read_fd, self._write_fd = os.pipe()
+            os.set_blocking(self._read_fd, False)
+            os.set_blocking(self._write_fd, False)
+
+    def set(self) -> None:
+        self._event.set()
+        if self._write_fd is not None:
+            try:
+                os.write(self._write_fd, b'\0')
+            except BlockingIOError:
+                pass  # El pipe ya tiene señales pendientes
+
+    def fileno(self):
+        """Descriptor que 'select' puede esperar, o None si no hay pipe."""
+        return self._read_fd
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        return self._event.wait(timeout)
+
+    def consume(self) -> bool:
+        """Limpia la señal y retorna True si estaba activa."""
+        was_set = self._event.is_set()
+        self._event.clear()
+        if self._read_fd is not None:
+            try:
+                while os.read(self._read_fd, 512):
+                    pass
+            except BlockingIOError:
+                pass
+        return was_set
+
+
+_wake_signal = None
+_wake_lock = threading.Lock()
+
+
+def _get_wake_signal() -> _WakeSignal:
+    global _wake_signal
+    if _wake_signal is None:
+        with _wake_lock:
+            if _wake_signal is None:
+                _wake_signal = _WakeSignal()
+    return _wake_signal
+
+
+def wake_frame_loop() -> None:
+    """
+    Despierta el bucle de frames activo. Es seguro llamarla desde cualquier hilo.
+    """
+    _get_wake_signal().set()
+
+
+def _stdin_fd():
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, ValueError, OSError):
+        return None
+    return fd if os.isatty(fd) else None
+
+
+class FrameLoop:
+    """
+    Conductor del bucle principal de una pantalla.
+
+    Reemplaza la llamada a 'screen.get_event()' dentro de los bucles 'while True'
+    de las pantallas. Cuando no hay nada que hacer, el hilo queda bloqueado en
+    lugar de consumir el 100% de un núcleo.
+
+    Ejemplo de uso:
+        loop = FrameLoop(screen, max_fps=30)
+        while True:
+            screen.refresh()
+            event = loop.next_event()
+            ...  # dibujar y procesar el evento
+    """
+
+    def __init__(self, screen, max_fps: int = 30, idle_timeout: float = 0.5, redraw_on_demand: bool = True):
+        """
+        Inicializa el bucle de frames. Se crea al entrar en una pantalla, así que
+        también olvida las áreas clickeables de la pantalla anterior.
+
+        Args:
+            screen: Pantalla de asciimatics.
+            max_fps (int): Número máximo de frames por segundo.
+            idle_timeout (float): Segundos máximos bloqueado sin eventos (temporizador).
+            redraw_on_demand (bool): Si es True, en reposo solo se despierta por entrada,
+                por 'wake()' o por el temporizador. Si es False, produce frames a 'max_fps'
+                de forma continua (útil para animaciones).
+        """
+        self.screen = screen
+        self.max_fps = max_fps
+        self.idle_timeout = idle_timeout
+        self.redraw_on_demand = redraw_on_demand
+        self._frame_interval = 1.0 / max_fps if max_fps else 0.0
+        self._last_frame = 0.0
+        self._redraw_requested = True
+        self._wake = _get_wake_signal()
+        # Las pantallas virtuales (sin terminal) nunca bloquean
+        self._headless = getattr(screen, 'headless', False)
+        self._stdin = None if self._headless else _stdin_fd()
+        # Pantalla nueva: las áreas clickeables de la anterior no deben resolver clicks
+        get_hit_registry().clear()
+
+    def wake(self) -> None:
+        """Despierta el bucle desde cualquier hilo (por ejemplo, al llegar datos de red)."""
+        self._wake.set()
+
+    def request_redraw(self) -> None:
+        """Pide que el próximo frame se dibuje sin esperar al temporizador."""
+        self._redraw_requested = True
+
+    def _wait(self, timeout: float) -> None:
+        """Bloquea hasta que haya entrada en la terminal, una señal o venza 'timeout'."""
+        if self._headless or timeout <= 0:
+            return
+        if self._stdin is not None and self._wake.fileno() is not None:
+            try:
+                select.select([self._stdin, self._wake.fileno()], [], [], timeout)
+                return
+            except (OSError, ValueError):
+                self._stdin = None
+        # Sin select sobre la terminal: esperar la señal con un sondeo a 'max_fps'
+        self._wake.wait(min(timeout, self._frame_interval or timeout))
+
+    def next_event(self):
+        """
+        Espera al siguiente evento respetando 'max_fps'.
+
+        Sin eventos pendientes se bloquea hasta que llegue uno (o una señal, o
+        el temporizador). Con eventos pendientes también espera lo que falte del
+        intervalo del frame, así una ráfaga de teclas o clicks no produce frames
+        por encima de 'max_fps'. Una ráfaga de movimientos del mouse se reduce
+        al más reciente, así un click o una tecla nunca quedan detrás de
+        movimientos viejos.
+
+        Returns:
+            Evento de asciimatics o None si el frame se despertó por una señal o por tiempo.
+        """
+        event = self._get_event()
+        if event is None:
+            elapsed = time.monotonic() - self._last_frame
+            if self._redraw_requested or not self.redraw_on_demand:
+                timeout = self._frame_interval - elapsed
+            else:
+                timeout = self.idle_timeout
+            if timeout > 0 and not self._wake.is_set():
+                self._wait(timeout)
+                event = self._get_event()
+        elif not self._headless:
+            remaining = self._frame_interval - (time.monotonic() - self._last_frame)
+            if remaining > 0:
+                time.sleep(remaining)
+                if _is_mouse_motion(event):
+                    # Durante la espera pudieron llegar movimientos más nuevos
+                    event = self._get_event(event)
+
+        # Perfilador de render: la tecla F12 muestra u oculta su overlay
+        render_profiler.handle_event(event)
+        render_profiler.end_frame(self.screen)
+
+        # Las áreas clickeables se vuelven a registrar en cada frame
+        get_hit_registry().new_frame()
+        self._wake.consume()
+        self._redraw_requested = False
+        self._last_frame = time.monotonic()
+        return event
+
+    def _get_event(self, event=None):
+        """Siguiente evento de la terminal; los movimientos del mouse seguidos se reducen al último."""
+        if event is None:
+            event = self.screen.get_event()
+        while _is_mouse_motion(event):
+            following = self.screen.get_event()
+            if following is None:
+                break
+            event = following
+        return event
+
+
+def _is_mouse_motion(event) -> bool:
+    """Si el evento es un movimiento del mouse sin botones presionados."""
+    return isinstance(event, MouseEvent) and event.buttons == 0
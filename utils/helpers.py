@@ -1,3 +1,6 @@
+from .cache import LRUCache
+from .text_block import TextBlock
+
 def filler_text(text, filler, width, posicion='center') -> str:
     text_long = len(text)
     total_fill = int(width - text_long)
@@ -10,26 +13,8 @@ def filler_text(text, filler, width, posicion='center') -> str:
     elif posicion == 'right':
         return (filler * int(total_fill)) + text
 
-def create_card(data: dict) -> str:
-    width = data['width'] if 'width' in data else 21
-    height = data['height'] if 'height' in data else 13
-    text = data['text'] if 'text' in data else ''
-    ascii_y = data['ascii_y'] if 'ascii_y' in data else '│'
-    ascii_x = data['ascii_x'] if 'ascii_x' in data else '─'
-    corner = data['corner'] if 'corner' in data else ['╭', '╮', '╰', '╯']
-    
-    grid = data['grid'] if 'grid' in data else False
-    grid_ascii_x = data['grid_ascii_x'] if 'grid_ascii_x' in data else ascii_x
-    grid_ascii_y = data['grid_ascii_y'] if 'grid_ascii_y' in data else ascii_y
-    grid_intersections = data['grid_intersections'] if 'grid_intersections' in data else ['┼', '┬', '┴', '├', '┤']
-    grid_corners = data['grid_corners'] if 'grid_corners' in data else corner  # Bordes específicos para grid
-    grid_divider_x = data['grid_divider_x'] if 'grid_divider_x' in data else 2
-    grid_divider_y = data['grid_divider_y'] if 'grid_divider_y' in data else 2
-    grid_cell_width = (width) // grid_divider_x
-    grid_cell_height = (height) // grid_divider_y
-    height = height + grid_divider_y - 1 if grid else height
-
-    # Dividir el texto en líneas para ajustarlo al ancho de la carta
+def _wrap_card_text(text, width) -> list:
+    """Divide el texto en líneas para ajustarlo al ancho de la carta."""
     palabras = text.split(' ')
     text_line = []
     linea_actual = ''
@@ -42,85 +27,133 @@ def create_card(data: dict) -> str:
             text_line.append(linea_actual)
             linea_actual = palabra
     if linea_actual:
-        text_line.append(linea_actual)    # Centramos verticalmente el bloque de texto
-    lineas_texto = len(text_line)
-    lineas_vacias_arriba = (height - 2 - lineas_texto) // 2
-    lineas_vacias_abajo = height - 2 - lineas_texto - lineas_vacias_arriba
+        text_line.append(linea_actual)
+    return text_line
 
-    card_text = ''
-    # Línea superior
-    contador = 0
-    position_cell_divider_x = []
-    position_cell_divider_y = []
-    for i in range(1, grid_divider_x):
-        position_cell_divider_x.append((i * grid_cell_width)+ i-1)
-        
-    for i in range(1, grid_divider_y ):
-        position_cell_divider_y.append((i * grid_cell_height)+ i-1)
+def _build_card(width, height, text, ascii_y, ascii_x, corner, grid, grid_ascii_x, grid_ascii_y,
+                grid_intersections, grid_corners, grid_divider_x, grid_divider_y) -> dict:
+    """Construye las líneas de una carta (sin caché). Ver create_card_sprite."""
+    grid_cell_width = (width) // grid_divider_x
+    grid_cell_height = (height) // grid_divider_y
+    lines = []
 
     if grid:
-        text_grid = ''
-        for i in range(grid_divider_x):
-            if i == grid_divider_x -1:
-                text_grid += filler_text('', ascii_x, grid_cell_width, 'center')
-            else:
-                text_grid += filler_text('', ascii_x, grid_cell_width, 'center') + grid_intersections[1]
-        card_text += grid_corners[0] + text_grid + grid_corners[1] + '\n'
+        height = height + grid_divider_y - 1
+        position_cell_divider_y = [(i * grid_cell_height) + i - 1 for i in range(1, grid_divider_y)]
+        border = ascii_x * grid_cell_width
+        divider = grid_ascii_x * grid_cell_width
+        empty = ' ' * grid_cell_width
+        # Las filas son siempre las mismas: se construyen una vez y se reutilizan
+        divider_row = grid_intersections[3] + grid_intersections[0].join([divider] * grid_divider_x) + grid_intersections[4]
+        empty_row = ascii_y + grid_ascii_y.join([empty] * grid_divider_x) + ascii_y
+
+        lines.append(grid_corners[0] + grid_intersections[1].join([border] * grid_divider_x) + grid_corners[1])
+        contador = 0
         for i in range(height):
-            text_grid = ''
             # Solo accedemos si hay más divisiones
             if contador < len(position_cell_divider_y) and i == position_cell_divider_y[contador]:
-                for j in range(grid_divider_x):
-                    if j == grid_divider_x -1:
-                        text_grid += filler_text('', grid_ascii_x, grid_cell_width, 'center')
-                    else:
-                        text_grid += filler_text('', grid_ascii_x, grid_cell_width, 'center') + grid_intersections[0]
-                card_text += grid_intersections[3] + text_grid + grid_intersections[4] + '\n'
+                lines.append(divider_row)
                 contador += 1  # Incrementar el contador para la siguiente división
             else:
-                for j in range(grid_divider_x):
-                    if j == grid_divider_x -1:
-                        text_grid += filler_text('', ' ', grid_cell_width, 'center')
-                    else:
-                        text_grid += filler_text('', ' ', grid_cell_width, 'center') + grid_ascii_y
-                card_text += ascii_y + text_grid + ascii_y + '\n'
-                
-        text_grid = ''
-        for i in range(grid_divider_x):
-            if i == grid_divider_x -1:
-                text_grid += filler_text('', ascii_x, grid_cell_width, 'center')
-            else:
-                text_grid += filler_text('', ascii_x, grid_cell_width, 'center') + grid_intersections[2]
-        card_text += grid_corners[2] + text_grid + grid_corners[3]
-    else:
-        card_text += corner[0] + filler_text('', ascii_x, width - (len(corner[0]) + len(corner[1])) + (2 * len(ascii_y)), 'center') + corner[1] + '\n'
-        for _ in range(lineas_vacias_arriba):
-            card_text += ascii_y + filler_text('', ' ', width, 'center') + ascii_y + '\n'
-        for linea in text_line:
-            card_text += ascii_y + filler_text(linea.strip(), ' ', width, 'center') + ascii_y + '\n'
-            
-        for _ in range(lineas_vacias_abajo):
-            card_text += ascii_y + filler_text('', ' ', width, 'center') + ascii_y + '\n'
-            
-        card_text += corner[2] + filler_text('', ascii_x, width - (len(corner[2]) + len(corner[3])) + (2 * len(ascii_y)), 'center') + corner[3]
-
-    position_cell_divider_x = []
-    position_cell_divider_y = []
-    for i in range(1, grid_divider_x + 1):
-        position_cell_divider_x.append((i * grid_cell_width)+ i-1)
-        
-    for i in range(1, grid_divider_y + 1):
-        position_cell_divider_y.append((i * grid_cell_height)+ i-1)
-    if grid:
+                lines.append(empty_row)
+        lines.append(grid_corners[2] + grid_intersections[2].join([border] * grid_divider_x) + grid_corners[3])
+
+        lines = tuple(lines)
         return {
-            'text': card_text,
-            'data':{
+            'lines': lines,
+            'block': TextBlock(lines),
+            'data': {
                 'grid_divider_x': grid_divider_x,
                 'grid_divider_y': grid_divider_y,
                 'grid_cell_width': grid_cell_width,
                 'grid_cell_height': grid_cell_height,
-                'position_cell_divider_x': position_cell_divider_x,
-                'position_cell_divider_y': position_cell_divider_y
+                'position_cell_divider_x': tuple((i * grid_cell_width) + i - 1 for i in range(1, grid_divider_x + 1)),
+                'position_cell_divider_y': tuple((i * grid_cell_height) + i - 1 for i in range(1, grid_divider_y + 1))
+            }
+        }
+
+    if isinstance(text, TextBlock):
+        # Texto precompilado: se respetan sus líneas tal cual
+        text_line = list(text.lines)
+    else:
+        text_line = _wrap_card_text(text, width)
+    # Centramos verticalmente el bloque de texto
+    lineas_texto = len(text_line)
+    lineas_vacias_arriba = (height - 2 - lineas_texto) // 2
+    lineas_vacias_abajo = height - 2 - lineas_texto - lineas_vacias_arriba
+    empty_row = ascii_y + (' ' * width) + ascii_y
+
+    lines.append(corner[0] + ascii_x * (width - (len(corner[0]) + len(corner[1])) + (2 * len(ascii_y))) + corner[1])
+    lines.extend([empty_row] * max(lineas_vacias_arriba, 0))
+    for linea in text_line:
+        lines.append(ascii_y + filler_text(linea.strip(), ' ', width, 'center') + ascii_y)
+    lines.extend([empty_row] * max(lineas_vacias_abajo, 0))
+    lines.append(corner[2] + ascii_x * (width - (len(corner[2]) + len(corner[3])) + (2 * len(ascii_y))) + corner[3])
+    lines = tuple(lines)
+    return {'lines': lines, 'block': TextBlock(lines), 'data': None}
+
+def _sprite_size(sprite) -> int:
+    return sum(len(line) for line in sprite['lines'])
+
+# Caché de sprites de cartas compartida por todas las pantallas
+_card_sprites = LRUCache(max_entries=512, max_size=512 * 1024, sizeof=_sprite_size)
+
+def create_card_sprite(data: dict) -> dict:
+    """
+    Versión memoizada de create_card que retorna las líneas ya separadas.
+
+    La clave de la caché incluye todos los parámetros de geometría y caracteres.
+    En modo grid el texto no se dibuja, así que no forma parte de la clave.
+
+    Args:
+        data (dict): Mismas claves que create_card.
+
+    Returns:
+        dict: Sprite compartido (no se debe modificar) con:
+            - 'lines' (tuple): Líneas de la carta.
+            - 'block' (TextBlock): Las mismas líneas ya medidas, listas para print_text.
+            - 'data' (dict | None): Información del grid o None si no es grid.
+    """
+    ascii_y = data.get('ascii_y', '│')
+    ascii_x = data.get('ascii_x', '─')
+    corner = tuple(data.get('corner', ('╭', '╮', '╰', '╯')))
+    grid = data.get('grid', False)
+    key = (
+        data.get('width', 21),
+        data.get('height', 13),
+        '' if grid else data.get('text', ''),
+        ascii_y,
+        ascii_x,
+        corner,
+        grid,
+        data.get('grid_ascii_x', ascii_x),
+        data.get('grid_ascii_y', ascii_y),
+        tuple(data.get('grid_intersections', ('┼', '┬', '┴', '├', '┤'))),
+        tuple(data.get('grid_corners', corner)),  # Bordes específicos para grid
+        data.get('grid_divider_x', 2),
+        data.get('grid_divider_y', 2),
+    )
+    sprite = _card_sprites.get(key)
+    if sprite is None:
+        sprite = _build_card(*key)
+        _card_sprites.put(key, sprite)
+    return sprite
+
+def get_card_sprite_stats() -> dict:
+    """Retorna los contadores de la caché de sprites de cartas."""
+    return _card_sprites.stats()
+
+def create_card(data: dict) -> str:
+    sprite = create_card_sprite(data)
+    card_text = '\n'.join(sprite['lines'])
+    if sprite['data'] is not None:
+        data_grid = sprite['data']
+        return {
+            'text': card_text,
+            'data': {
+                **data_grid,
+                'position_cell_divider_x': list(data_grid['position_cell_divider_x']),
+                'position_cell_divider_y': list(data_grid['position_cell_divider_y'])
             }
         }
     else:
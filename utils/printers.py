@@ -1,9 +1,126 @@
 from asciimatics.screen import Screen
-from pyfiglet import Figlet
 
-from .helpers import create_card
+from .ascii_art import render_figlet
+from .cache import LRUCache
+from .helpers import create_card_sprite
+from .profiler import render_profiler
+from .retained import get_retained_renderer
+from .text_block import TextBlock
 
 
+def _widget_id(kind: str, key, x: int, y: int, index=None):
+    """
+    Identidad de un widget clickeable para los cooldowns y el hit-testing.
+
+    Si el widget tiene 'key' se usa esa clave (no cambia aunque el widget se
+    mueva); si no, su posición.
+    """
+    if key is not None:
+        return (key, kind) if index is None else (key, kind, index)
+    return (kind, x, y) if index is None else (kind, index, x, y)
+
+
+def _grid_geometry_key(grid_data, grid_ascii_x, grid_ascii_y, card):
+    return (
+        grid_data['grid_cell_width'],
+        grid_data['grid_cell_height'],
+        grid_data['position_cell_divider_x'],
+        grid_data['position_cell_divider_y'],
+        len(grid_ascii_x),
+        len(grid_ascii_y),
+        card['width'],
+        card['height'],
+        card['x_position'],
+        card['y_position'],
+    )
+
+
+def _build_grid_geometry(cell_width, cell_height, dividers_x, dividers_y, glyph_x, glyph_y,
+                         width, height, x_position, y_position) -> dict:
+    """Calcula la geometría de un grid (sin caché). Ver _get_grid_geometry."""
+    cells = []
+    for divider_x in dividers_x:
+        for divider_y in dividers_y:
+            x = x_position + divider_x
+            y = y_position + divider_y
+            cells.append({
+                'key': str(len(cells)),
+                'x': x,
+                'y': y,
+                'left': x - cell_width + 1,
+                'top': y - cell_height + 1,
+            })
+    columns = tuple(
+        {
+            'x_position': x_position + glyph_y + (cell_width + 1) * i,
+            'y_position': y_position + glyph_x,
+            'width': cell_width - glyph_x,
+            'height': height - (glyph_x * 2) - glyph_y
+        }
+        for i in range(len(dividers_x))
+    )
+    rows = tuple(
+        {
+            'x_position': x_position + glyph_x,
+            'y_position': y_position + (cell_height * i) + i + glyph_y,
+            'width': width - (glyph_y * 2) - 1,
+            'height': cell_height - glyph_x
+        }
+        for i in range(len(dividers_y))
+    )
+    return {'cells': tuple(cells), 'columns': columns, 'rows': rows}
+
+
+# Caché de geometrías de grid: las cartas grid que no se mueven reutilizan la suya
+_grid_geometries = LRUCache(max_entries=256)
+
+
+def _get_grid_geometry(grid_data: dict, grid_ascii_x: str, grid_ascii_y: str, card: dict) -> dict:
+    """
+    Retorna la geometría de un grid ya posicionado en pantalla.
+
+    Depende solo del tamaño de las celdas, las divisiones, el ancho de los
+    caracteres del grid y la posición de la carta, así que se calcula una vez y
+    se reutiliza en cada frame. No se debe modificar.
+
+    Returns:
+        dict: 'cells' (por celda: 'key', divisores 'x'/'y' y bordes 'left'/'top'),
+        'columns' y 'rows' (áreas de click de grid_click).
+    """
+    key = _grid_geometry_key(grid_data, grid_ascii_x, grid_ascii_y, card)
+    geometry = _grid_geometries.get(key)
+    if geometry is None:
+        geometry = _build_grid_geometry(*key)
+        _grid_geometries.put(key, geometry)
+    return geometry
+
+
+def _cell_anchor(cell: dict, position: str, cell_height: int, cell_first_width: int, padding) -> tuple:
+    """
+    Calcula dónde se dibuja el contenido de una celda según su 'position'.
+
+    Args:
+        cell (dict): Celda de la geometría del grid.
+        position (str): 'top_left_corner', 'top_right_corner', 'bottom_right_corner' o 'bottom_left_corner'.
+        cell_height (int): Líneas del contenido.
+        cell_first_width (int): Ancho de la primera línea del contenido.
+        padding (tuple): (arriba, izquierda, abajo, derecha).
+    """
+    padding_top, padding_left, padding_bottom, padding_right = padding
+    if position == 'top_right_corner':
+        return (cell['x'] - cell_height + 1 + padding_right - padding_left,
+                cell['top'] + padding_top - padding_bottom)
+    if position == 'bottom_right_corner':
+        return (cell['x'] - cell_first_width + 1 + padding_right - padding_left,
+                cell['y'] - cell_height + 1 + padding_bottom - padding_top)
+    if position == 'bottom_left_corner':
+        return (cell['left'] + padding_left - padding_right,
+                cell['y'] - cell_first_width + 1 + padding_bottom - padding_top)
+    return (cell['left'] + padding_left - padding_right,
+            cell['top'] + padding_top - padding_bottom)
+
+
+@render_profiler.profiled
 def print_text(screen, data: dict, asccii_art: bool = False) -> dict:
     """
     Dibuja texto en la pantalla usando Asciimatics con soporte para arte ASCII y posicionamiento personalizado avanzado.
@@ -16,7 +133,9 @@ def print_text(screen, data: dict, asccii_art: bool = False) -> dict:
         data (dict): Diccionario de configuración con las siguientes claves posibles:
             
             **Contenido (obligatorio):**
-            - 'text' (str): El texto a mostrar. Puede contener saltos de línea (\n) para texto multilínea.
+            - 'text' (str | TextBlock | list | tuple): El texto a mostrar. Puede contener saltos de línea (\n)
+              para texto multilínea, ser un TextBlock precompilado (ya medido y con tramos de color
+              opcionales) o una secuencia de líneas ya separadas.
             
             **Configuración de Arte ASCII (opcional):**
             - 'font' (str): Fuente para arte ASCII (por defecto 'slant'). 
@@ -43,6 +162,11 @@ def print_text(screen, data: dict, asccii_art: bool = False) -> dict:
             **Posicionamiento desde Bordes (opcional):**
             - 'x-right' (int): Distancia desde el borde derecho de la pantalla.
             - 'y-bottom' (int): Distancia desde el borde inferior de la pantalla.
+            
+            **Modo Retenido (opcional):**
+            - 'key' (hashable): Clave estable del widget. Si la pantalla tiene el modo retenido
+              activo (ver utils.retained.enable_retained_mode), solo se redibujan las celdas que
+              cambiaron respecto al frame anterior.
         
         asccii_art (bool): Si es True, renderiza el texto como arte ASCII usando pyfiglet.
             Cuando está activado, utiliza las opciones 'font', 'justify' y 'max-width' del diccionario data.
@@ -112,16 +236,28 @@ def print_text(screen, data: dict, asccii_art: bool = False) -> dict:
     y_position = 0
     text = []
     height = 0
+    block = None
     if asccii_art:
-        f = Figlet(font=font, width=max_width, justify=justify)
-        ascii_text = f.renderText(data['text'])
-        text = ascii_text.split('\n')
+        # Los renders se guardan en caché: los banners estáticos solo se generan una vez
+        text = render_figlet(data['text'], font, max_width, justify)
+        height = len(text)
+    elif isinstance(data['text'], TextBlock):
+        # Texto precompilado: ya viene separado y medido
+        block = data['text']
+        text = block.lines
+        height = block.height
+    elif isinstance(data['text'], (list, tuple)):
+        # Texto ya separado en líneas (por ejemplo, sprites de cartas en caché)
+        text = data['text']
         height = len(text)
     else:
         text = data['text'].split('\n')
         height = len(text)
       # Calcular el ancho máximo de todas las líneas
-    width = max(len(line) for line in text) if text else 0
+    if block is not None:
+        width = block.width
+    else:
+        width = max(len(line) for line in text) if text else 0
     if 'y_position' in data:
         y_position = data['y_position']
     else:
@@ -132,24 +268,37 @@ def print_text(screen, data: dict, asccii_art: bool = False) -> dict:
         elif 'y-bottom' in data:
             y_position = screen.height - height - data['y-bottom']
 
-    for idx, line in enumerate(text):
-        # Usar el ancho máximo para la posición x
-        if 'x_position' in data:
-            x_position = data['x_position']
+    # Usar el ancho máximo para la posición x (es la misma para todas las líneas)
+    if 'x_position' in data:
+        x_position = data['x_position']
+    else:
+        if 'x' in data:
+            x_position = data['x']
+        elif 'x-center' in data:
+            x_position = (screen.width - width) // 2 + data['x-center']
+        elif 'x-right' in data:
+            x_position = screen.width - width - data['x-right']
         else:
-            if 'x' in data:
-                x_position = data['x']
-            elif 'x-center' in data:
-                x_position = (screen.width - width) // 2 + data['x-center']
-            elif 'x-right' in data:
-                x_position = screen.width - width - data['x-right']
-            else:
-                x_position = 0  # Valor por defecto si no se especifica posición
+            x_position = 0  # Valor por defecto si no se especifica posición
 
-        if(bg is not None):
-            screen.print_at(line, x_position, y_position + idx, colour=color, bg=bg)
-        else:
-            screen.print_at(line, x_position, y_position + idx, colour=color)
+    # Modo retenido: si el widget tiene clave y la pantalla lo activó, solo se dibuja lo que cambió
+    renderer = get_retained_renderer(screen) if 'key' in data else None
+    if renderer is not None:
+        renderer.draw(screen, data['key'], text, x_position, y_position, color, bg, block)
+    elif block is not None and block.runs is not None:
+        # Líneas con tramos de color propios
+        for idx in range(height):
+            for offset, segment, seg_color, seg_bg in block.segments(idx, color, bg):
+                if seg_bg is not None:
+                    screen.print_at(segment, x_position + offset, y_position + idx, colour=seg_color, bg=seg_bg)
+                else:
+                    screen.print_at(segment, x_position + offset, y_position + idx, colour=seg_color)
+    else:
+        for idx, line in enumerate(text):
+            if(bg is not None):
+                screen.print_at(line, x_position, y_position + idx, colour=color, bg=bg)
+            else:
+                screen.print_at(line, x_position, y_position + idx, colour=color)
 
     # print(f"[DEBUG] print_text: x_position={x_position}, y_position={y_position}, width={width}, height={height}")
     return {
@@ -159,6 +308,7 @@ def print_text(screen, data: dict, asccii_art: bool = False) -> dict:
         "y_position": y_position
     }
     
+@render_profiler.profiled
 def print_button(screen, data: dict, event=None, click=None) -> dict:
     from .events import add_mouse_listener  # Importación local para evitar ciclo
 
@@ -205,7 +355,7 @@ def print_button(screen, data: dict, event=None, click=None) -> dict:
                 print("¡Botón presionado!")    """
     button= print_text(screen, data)
     # screen.refresh()
-    result = add_mouse_listener(screen, button, event, click, element_id=f"button_{button['x_position']}_{button['y_position']}") if click else None
+    result = add_mouse_listener(screen, button, event, click, element_id=_widget_id('button', data.get('key'), button['x_position'], button['y_position'])) if click else None
     return {
         "result": result,
         "width": button['width'],
@@ -214,8 +364,109 @@ def print_button(screen, data: dict, event=None, click=None) -> dict:
         "y_position": button['y_position']
     }
     
+def _print_grid_cells(screen, geometry, content, card_key, event, buttons_return) -> None:
+    """Dibuja el contenido de las celdas de un grid y guarda en 'buttons_return' lo que retorna cada celda."""
+    for posicion, cell_geometry in enumerate(geometry['cells']):
+        cell = content.get(cell_geometry['key'])
+        if cell is None:
+            continue
+        text_cell = cell['text']
+        # Medir el contenido una sola vez (los TextBlock ya vienen medidos)
+        if isinstance(text_cell, TextBlock):
+            cell_height, cell_first_width = text_cell.height, len(text_cell.lines[0])
+        else:
+            cell_lines = text_cell.split('\n')
+            cell_height, cell_first_width = len(cell_lines), len(cell_lines[0])
+        if 'padding' in cell:
+            padding = cell['padding']
+        else:
+            padding = (
+                cell.get('padding-top', 0),
+                cell.get('padding-left', 0),
+                cell.get('padding-bottom', 0),
+                cell.get('padding-right', 0),
+            )
+        x_position, y_position = _cell_anchor(
+            cell_geometry, cell.get('position', 'top_left_corner'), cell_height, cell_first_width, padding
+        )
+        color_cell = cell.get('color', screen.COLOUR_WHITE)
+        bg_cell = cell.get('bg', screen.COLOUR_DEFAULT)
+
+        # Determinar el tipo de elemento a renderizar
+        element_type = cell.get('type', 'text')  # 'text', 'button', 'input', 'card'
+
+        if element_type == 'button' or cell.get('button'):
+            # Renderizar botón
+            button_config = {
+                'text': text_cell,  # Usar el texto real del botón
+                'color': color_cell,
+                'bg': bg_cell,
+                'x_position': x_position,
+                'y_position': y_position,
+            }
+            if card_key is not None:
+                button_config['key'] = (card_key, posicion)
+            button_data = print_button(screen, button_config, event, cell.get('click', None))
+            
+            # Guardar información completa del botón incluyendo si fue clickeado
+            buttons_return[posicion] = {
+                'clicked': button_data['result'] is not None,
+                'result': button_data['result'],
+                'text': text_cell,  # Usar el texto real del botón
+                'width': button_data['width'],
+                'height': button_data['height'],
+                'x_position': button_data['x_position'],
+                'y_position': button_data['y_position']
+            }
+            
+        elif element_type == 'input':
+            # Renderizar input
+            input_config = cell.copy()
+            input_config.update({
+                'x_position': x_position,
+                'y_position': y_position,
+            })
+            if card_key is not None:
+                input_config['key'] = (card_key, posicion)
+            input_state = cell.get('input_state', {
+                'value': '',
+                'cursor_pos': 0,
+                'is_focused': False,
+                'changed': False,
+                'clicked': False
+            })
+            input_result = print_input(screen, input_config, event, input_state)
+            buttons_return[posicion] = input_result
+            
+        elif element_type == 'card':
+            # Renderizar carta anidada
+            card_config = cell.copy()
+            card_config.update({
+                'x_position': x_position,
+                'y_position': y_position,
+            })
+            if card_key is not None:
+                card_config['key'] = (card_key, posicion)
+            card_result = print_card(screen, card_config, event, cell.get('click', None))
+            buttons_return[posicion] = card_result
+            
+        else:
+            # Renderizar texto (comportamiento por defecto)
+            text_config = {
+                'text': text_cell,
+                'color': color_cell,
+                'bg': bg_cell,
+                'x_position': x_position,
+                'y_position': y_position,
+            }
+            if card_key is not None:
+                text_config['key'] = (card_key, posicion)
+            print_text(screen, text_config)
+
+
+@render_profiler.profiled
 def print_card(screen, data: dict, event=None, click=None) -> dict:
-    from .events import add_mouse_listener  # Importación local para evitar ciclo
+    from .events import add_mouse_listener, get_hit_registry  # Importación local para evitar ciclo
     """
     Dibuja una carta visual personalizada en la pantalla usando Asciimatics y permite detectar si ha sido presionada mediante un clic del mouse.
 
@@ -245,7 +496,7 @@ def print_card(screen, data: dict, event=None, click=None) -> dict:
 
     Notas:
         - Es necesario activar el modo mouse: antes de usar cartas con clic, asegúrate de tener 'screen.mouse = True'.
-        - El área de clic de la carta cubre todo el bloque generado por la función create_card.
+        - El área de clic de la carta cubre todo el bloque generado por la función create_card_sprite.
         - El evento debe ser un objeto MouseEvent y debe tener 'event.buttons != 0' para que se considere un clic.
         - El área de detección se calcula usando el ancho y la altura de la carta renderizada.
         - Si el usuario hace clic dentro de esa área, se ejecuta la función click y su resultado se devuelve en 'result'.
@@ -297,219 +548,47 @@ def print_card(screen, data: dict, event=None, click=None) -> dict:
     }
     
     
-    # Crear la carta con los datos proporcionados
-    card_create = create_card(data_card_ascii)
-    data_card_printer['text'] = card_create['text'] if grid else card_create
-    for pos_key in ['x', 'y', 'x-center', 'y-center', 'x-right', 'y-bottom', 'x_position', 'y_position']:
+    # Crear la carta con los datos proporcionados (sprite en caché compartido)
+    card_sprite = create_card_sprite(data_card_ascii)
+    data_card_printer['text'] = card_sprite['block']
+    for pos_key in ['x', 'y', 'x-center', 'y-center', 'x-right', 'y-bottom', 'x_position', 'y_position', 'key']:
         if pos_key in data:
             data_card_printer[pos_key] = data[pos_key]
     card = print_text(screen, data_card_printer)
+    # Clave base para el modo retenido del contenido de las celdas
+    card_key = data.get('key')
     
-    grid_num_cells = None
-    grid_cell = []
     if grid:
-        data_position = card_create['data']
-        grid_num_cells = grid_divider_x * grid_divider_y
-        if 'content' in data:
-            content = data['content']
-            for i in range(grid_num_cells):
-                if str(i) in content:
-                    padding_top = 0
-                    padding_left = 0
-                    padding_bottom = 0
-                    padding_right = 0
-                    padding=[]
-                    if 'padding' in content[str(i)]:
-                        padding = content[str(i)]
-                        padding_top, padding_left, padding_bottom, padding_right = padding
-                    else:
-                        padding_top = content[str(i)].get('padding-top', 0)
-                        padding_left = content[str(i)].get('padding-left', 0)
-                        padding_bottom = content[str(i)].get('padding-bottom', 0)
-                        padding_right = content[str(i)].get('padding-right', 0)
+        # Geometría del grid (anclas de celdas y áreas de click) calculada una sola vez
+        geometry = _get_grid_geometry(card_sprite['data'], grid_ascii_x, grid_ascii_y, card)
+        content = data.get('content', {})
+        # Las celdas quedan una capa encima de las áreas de click de la carta (filas, columnas)
+        hit_registry = get_hit_registry()
+        hit_registry.push_layer()
+        try:
+            _print_grid_cells(screen, geometry, content, card_key, event, buttons_return)
+        finally:
+            hit_registry.pop_layer()
 
-                    data_aux={
-                        'text': content[str(i)]['text'], 
-                        'color': content[str(i)].get('color', screen.COLOUR_WHITE), 
-                        'bg': content[str(i)].get('bg', screen.COLOUR_DEFAULT), 
-                        'position': content[str(i)].get('position', 'top_left_corner'),
-                        'padding': padding,
-                        'padding-top': padding_top,
-                        'padding-left': padding_left,                        'padding-bottom': padding_bottom,
-                        'padding-right': padding_right,
-                        }
-                    if 'button' in content[str(i)] and content[str(i)]['button']:
-                        data_aux['button'] = content[str(i)]['button']
-                    if 'event' in content[str(i)]:
-                        data_aux['event'] = content[str(i)]['event']
-                    if 'click' in content[str(i)]:
-                        data_aux['click'] = content[str(i)]['click']
-                    grid_cell.append(data_aux)
-                else:
-                    grid_cell.append([])
-        
-        posicion = 0
 
-        for i in range(len(data_position['position_cell_divider_x'])):
-            for j in range(len(data_position['position_cell_divider_y'])):
-                text_cell = ''
-                x=card['x_position'] + data_position['position_cell_divider_x'][i]
-                y=card['y_position'] + data_position['position_cell_divider_y'][j]
-                if posicion < grid_num_cells and grid_cell[posicion] != []:
-                    text_cell = grid_cell[posicion]['text']
-                    p=[grid_cell[posicion]['padding-top'], grid_cell[posicion]['padding-left'], grid_cell[posicion]['padding-bottom'], grid_cell[posicion]['padding-right']]
-                    posicion_cell_x = [
-                        x - data_position['grid_cell_width']+1+p[1]-p[3],
-                        x - len(text_cell.split('\n'))+1+p[3]-p[1],
-                        x - len(text_cell.split('\n')[0])+1+p[3]-p[1],
-                    ]
-                    posicion_cell_y = [
-                        y - data_position['grid_cell_height']+1+p[0]-p[2],
-                        y - len(text_cell.split('\n'))+1+p[2]-p[0],
-                        y - len(text_cell.split('\n')[0])+1+p[2]-p[0],
-                    ]
-                else:
-                    text_cell = ' '
-                    posicion_cell_x = [
-                        x - data_position['grid_cell_width']+1,
-                        x - len(text_cell.split('\n'))+1,
-                        x - len(text_cell.split('\n')[0])+1,                    ]
-                    posicion_cell_y = [
-                        y - data_position['grid_cell_height']+1,
-                        y - len(text_cell.split('\n'))+1,
-                        y - len(text_cell.split('\n')[0])+1
-                    ]                # Definir posicion_cell para ambos casos
-                posicion_cell = {
-                    'top_left_corner': (posicion_cell_x[0], posicion_cell_y[0]),
-                    'top_right_corner': (posicion_cell_x[1], posicion_cell_y[0]),                
-                    'bottom_right_corner': (posicion_cell_x[2], posicion_cell_y[1]),
-                    'bottom_left_corner': (posicion_cell_x[0], posicion_cell_y[2])
-                }
-                if posicion < grid_num_cells and grid_cell[posicion] != []:
-                    # Determinar el tipo de elemento a renderizar
-                    element_type = grid_cell[posicion].get('type', 'text')  # 'text', 'button', 'input', 'card'
-                    
-                    if element_type == 'button' or 'button' in grid_cell[posicion]:
-                        # Renderizar botón
-                        button_data = print_button(screen, {
-                            'text': grid_cell[posicion]['text'],  # Usar el texto real del botón
-                            'color': grid_cell[posicion]['color'],
-                            'bg': grid_cell[posicion]['bg'],
-                            'x_position': posicion_cell[grid_cell[posicion]['position']][0],
-                            'y_position': posicion_cell[grid_cell[posicion]['position']][1],
-                        }, event, grid_cell[posicion].get('click', None))
-                        
-                        # Guardar información completa del botón incluyendo si fue clickeado
-                        buttons_return[posicion] = {
-                            'clicked': button_data['result'] is not None,
-                            'result': button_data['result'],
-                            'text': grid_cell[posicion]['text'],  # Usar el texto real del botón
-                            'width': button_data['width'],
-                            'height': button_data['height'],
-                            'x_position': button_data['x_position'],
-                            'y_position': button_data['y_position']
-                        }
-                        
-                    elif element_type == 'input':
-                        # Renderizar input
-                        input_config = grid_cell[posicion].copy()
-                        input_config.update({
-                            'x_position': posicion_cell[grid_cell[posicion]['position']][0],
-                            'y_position': posicion_cell[grid_cell[posicion]['position']][1],
-                        })
-                        input_state = grid_cell[posicion].get('input_state', {
-                            'value': '',
-                            'cursor_pos': 0,
-                            'is_focused': False,
-                            'changed': False,
-                            'clicked': False
-                        })
-                        input_result = print_input(screen, input_config, event, input_state)
-                        buttons_return[posicion] = input_result
-                        
-                    elif element_type == 'card':
-                        # Renderizar carta anidada
-                        card_config = grid_cell[posicion].copy()
-                        card_config.update({
-                            'x_position': posicion_cell[grid_cell[posicion]['position']][0],
-                            'y_position': posicion_cell[grid_cell[posicion]['position']][1],
-                        })
-                        card_result = print_card(screen, card_config, event, grid_cell[posicion].get('click', None))
-                        buttons_return[posicion] = card_result
-                        
-                    else:
-                        # Renderizar texto (comportamiento por defecto)
-                        print_text(screen, {
-                            'text': text_cell,
-                            'color': grid_cell[posicion]['color'],
-                            'bg': grid_cell[posicion]['bg'],
-                            'x_position': posicion_cell[grid_cell[posicion]['position']][0],
-                            'y_position': posicion_cell[grid_cell[posicion]['position']][1],
-                        })
-                posicion += 1
-    # screen.refresh()
-    result = None
-    if grid_click == 'column' and grid and 'click' in data:
+    # detectar clic en columnas o filas (áreas precalculadas en la geometría)
+    if (grid_click == 'column' and grid and 'click' in data) or (grid_click == 'row' and grid):
         result = []
-        for i in range(len(data_position['position_cell_divider_x'])):
-            # Calcular la posición de la columna
-            x = card['x_position'] + len(grid_ascii_y) + (data_position['grid_cell_width'] + 1) * i
-            y = card['y_position'] + len(grid_ascii_x)
-            
-            # Calcular el ancho y alto de la columna
-            width_column = data_position['grid_cell_width'] - len(grid_ascii_x)
-            height_column = card['height'] - (len(grid_ascii_x) * 2)- len(grid_ascii_y)
-            
-            row = {
-                'x_position': x,
-                'y_position': y,
-                'width': width_column,
-                'height': height_column
-            }
-            if 'click' in data and str(i) in data['click']:
-                click_column = data['click'][str(i)]
+        clicks = data.get('click', {})
+        for i, area in enumerate(geometry['columns' if grid_click == 'column' else 'rows']):
+            click_area = clicks.get(str(i))
+            if click_area is not None:
                 aux = add_mouse_listener(
                     screen,
-                    row,
-                    click_column['event'],
-                    click_column['click'],
-                    click_column.get('test', False),
-                    element_id=f"grid_column_{i}_{row['x_position']}_{row['y_position']}"
-                )
-                result.append(aux)
-
-    # detectar clic en filas
-    elif grid_click == 'row':
-        result = []
-        for i in range(len(data_position['position_cell_divider_y'])):
-            # Calcular la posición de la fila
-            x = card['x_position'] + len(grid_ascii_x)
-            y = card['y_position'] + (data_position['grid_cell_height'] * i) + i + len(grid_ascii_y)
-
-            # Calcular el ancho y alto de la fila
-            width_row = card['width'] - (len(grid_ascii_y) * 2) - 1
-            height_row = data_position['grid_cell_height'] - len(grid_ascii_x)
-
-            row = {
-                'x_position': x,
-                'y_position': y,
-                'width': width_row,
-                'height': height_row
-            }
-            
-            if 'click' in data and str(i) in data['click']:
-                click_row = data['click'][str(i)]
-                aux = add_mouse_listener(
-                    screen, 
-                    row,
-                    click_row['event'],
-                    click_row['click'],
-                    click_row.get('test', False),
-                    element_id=f"grid_row_{i}_{row['x_position']}_{row['y_position']}"
+                    area,
+                    click_area['event'],
+                    click_area['click'],
+                    click_area.get('test', False),
+                    element_id=_widget_id('grid_' + grid_click, card_key, area['x_position'], area['y_position'], i)
                 )
                 result.append(aux)
     else:
-        result = add_mouse_listener(screen, card, event, click, element_id=f"card_{card['x_position']}_{card['y_position']}") if click else None
+        result = add_mouse_listener(screen, card, event, click, element_id=_widget_id('card', card_key, card['x_position'], card['y_position'])) if click else None
     return {
         "result": result,
         "result_buttons": buttons_return,
@@ -519,6 +598,7 @@ def print_card(screen, data: dict, event=None, click=None) -> dict:
         "y_position": card['y_position']
     }
     
+@render_profiler.profiled
 def print_input(screen, data: dict, event=None, input_state=None) -> dict:
     """
     Renderiza un campo de entrada de texto independiente con manejo completo de eventos.
@@ -655,6 +735,11 @@ def print_input(screen, data: dict, event=None, input_state=None) -> dict:
         if pos_key in data:
             container_data[pos_key] = data[pos_key]
     
+    # Claves para el modo retenido (solo si el input tiene 'key')
+    input_key = data.get('key')
+    if input_key is not None:
+        container_data['key'] = (input_key, 'contenedor')
+    
     # Renderizar contenedor
     container = print_card(screen, container_data)
     
@@ -666,7 +751,7 @@ def print_input(screen, data: dict, event=None, input_state=None) -> dict:
         return True
     
     # Agregar mouse listener para el focus
-    add_mouse_listener(screen, container, event, handle_focus, element_id=f"input_{input_id}")
+    add_mouse_listener(screen, container, event, handle_focus, element_id=('input', input_id))
     
     # Solo procesar eventos de teclado si está enfocado
     if input_state['is_focused'] and event:
@@ -712,12 +797,15 @@ def print_input(screen, data: dict, event=None, input_state=None) -> dict:
             handle_character()
     
     # Renderizar label
-    print_text(screen, {
+    label_data = {
         'text': label,
         'x_position': container['x_position'] + 1,
         'y_position': container['y_position'] + 1,
         'color': current_color
-    })
+    }
+    if input_key is not None:
+        label_data['key'] = (input_key, 'label')
+    print_text(screen, label_data)
     
     # Preparar texto a mostrar
     display_value = input_state['value'] if input_state['value'] else placeholder
@@ -738,13 +826,16 @@ def print_input(screen, data: dict, event=None, input_state=None) -> dict:
     input_area_width = width - 2  # Restar bordes
     display_text = display_value.ljust(input_area_width)
     
-    print_text(screen, {
+    value_data = {
         'text': display_text,
         'x_position': container['x_position'] + 1,
         'y_position': container['y_position'] + 2,
         'color': Screen.COLOUR_WHITE,
         'bg': bg
-    })
+    }
+    if input_key is not None:
+        value_data['key'] = (input_key, 'valor')
+    print_text(screen, value_data)
     return {
         'input_state': input_state,
         'width': container['width'],
@@ -755,6 +846,7 @@ def print_input(screen, data: dict, event=None, input_state=None) -> dict:
         'changed': input_state['changed']   # Agregar información de cambios
     }
 
+@render_profiler.profiled
 def print_form(screen, form_config: dict, event=None) -> dict:
     """
     Función avanzada para crear formularios dinámicos con inputs, botones y navegación automática.
@@ -803,6 +895,9 @@ def print_form(screen, form_config: dict, event=None) -> dict:
             **Eventos personalizados:**
             - 'key_handlers' (dict, opcional): Manejadores personalizados de teclas
               Formato: {tecla_codigo: función}
+            - 'keymap' (Keymap, opcional): Keymap de la pantalla. El formulario registra
+              sus teclas en él con prioridad de formulario y no despacha el evento:
+              la pantalla debe llamar a 'keymap.dispatch(event)' una vez por frame.
         
         event: Evento actual del sistema
     
@@ -814,6 +909,7 @@ def print_form(screen, form_config: dict, event=None) -> dict:
                 - 'result' (dict o None): Resultado si el formulario se completó
                 - 'show_error' (bool): Si hay error visible
                 - 'error_message' (str): Mensaje de error actual
+                - 'keymap' (Keymap): Keymap donde están registradas las teclas del formulario
             - 'position' (dict): Información de posición y tamaño
                 - 'x' (int): Posición X del formulario
                 - 'y' (int): Posición Y del formulario
@@ -889,7 +985,7 @@ def print_form(screen, form_config: dict, event=None) -> dict:
             if action == 'submit':
                 user_data = result['form_state']['form_data']
                 print(f"Usuario: {user_data['usuario']}, Password: {user_data['password']}")    """
-    from .events import add_key_listener
+    from .events import Keymap
     from asciimatics.event import MouseEvent
     
     # Inicializar estado del formulario si no existe
@@ -1078,62 +1174,16 @@ def print_form(screen, form_config: dict, event=None) -> dict:
             # Un botón fue presionado, su función click ya fue ejecutada
             pass
     
-    # 7. Manejo de navegación con TAB
-    def handle_tab():
-        if form_state['navigation_order']:
-            current_index = form_state['navigation_order'].index(form_state['current_field'])
-            next_index = (current_index + 1) % len(form_state['navigation_order'])
-            form_state['current_field'] = form_state['navigation_order'][next_index]
-            form_state['show_error'] = False
-            
-            # Actualizar focus de inputs
-            for input_id in form_state['input_states']:
-                form_state['input_states'][input_id]['is_focused'] = (input_id == form_state['current_field'])
-
-    def handle_enter():
-        form_state['show_error'] = False
-        current = form_state['current_field']
-        
-        if current.startswith('btn_'):
-            # Es un botón, ejecutar su acción
-            if current == 'btn_0' or 'submit' in current:
-                return _handle_submit(form_state, form_config)
-            elif current == 'btn_1' or 'cancel' in current:
-                return _handle_cancel(form_state)
-        else:
-            # Es un input, ir al siguiente campo
-            if form_state['navigation_order']:
-                current_index = form_state['navigation_order'].index(current)
-                next_index = (current_index + 1) % len(form_state['navigation_order'])
-                form_state['current_field'] = form_state['navigation_order'][next_index]
-                
-                # Actualizar focus
-                for input_id in form_state['input_states']:
-                    form_state['input_states'][input_id]['is_focused'] = (input_id == form_state['current_field'])
-        return False
-
-    def handle_escape():
-        return _handle_cancel(form_state)
-
-    # 8. Aplicar manejadores de eventos
-    result = add_key_listener(-301, event, handle_tab)  # TAB
-    if result:
-        pass  # Continue normal flow
-        
-    result = add_key_listener([10, 13], event, handle_enter)  # ENTER
-    if result:
-        pass  # Continue normal flow
-        
-    result = add_key_listener(-1, event, handle_escape)  # ESCAPE
-    if result:
-        pass  # Continue normal flow
+    # 7. Teclas del formulario (TAB, ENTER, ESC y 'key_handlers'): se registran una sola vez
+    keymap = form_state.get('keymap')
+    if keymap is None:
+        keymap = form_config.get('keymap') or Keymap()
+        _bind_form_keys(keymap, ('form', form_id), form_state, form_config)
+        form_state['keymap'] = keymap
     
-    # 9. Manejadores personalizados de teclas
-    if 'key_handlers' in form_config:
-        for key_code, handler in form_config['key_handlers'].items():
-            result = add_key_listener(key_code, event, handler)
-            if result:
-                pass
+    # 8. Con un Keymap compartido es la pantalla quien despacha el evento (una sola vez)
+    if 'keymap' not in form_config:
+        keymap.dispatch(event)
     
     # Calcular posición y tamaño del formulario si no se definió por contenedor
     if not container_result:
@@ -1161,6 +1211,55 @@ def print_form(screen, form_config: dict, event=None) -> dict:
         'inputs_data': inputs_data
     }
 
+def _bind_form_keys(keymap, scope, form_state, form_config):
+    """
+    Registra las teclas de un formulario en un Keymap con prioridad de formulario.
+
+    Los 'key_handlers' personalizados se registran después de TAB, ENTER y ESC,
+    por lo que ante la misma tecla gana el personalizado.
+    """
+    from .events import FORM_KEY_PRIORITY
+
+    def focus_next():
+        if form_state['navigation_order']:
+            current_index = form_state['navigation_order'].index(form_state['current_field'])
+            next_index = (current_index + 1) % len(form_state['navigation_order'])
+            form_state['current_field'] = form_state['navigation_order'][next_index]
+            
+            # Actualizar focus de inputs
+            for input_id in form_state['input_states']:
+                form_state['input_states'][input_id]['is_focused'] = (input_id == form_state['current_field'])
+
+    def handle_tab():
+        form_state['show_error'] = False
+        focus_next()
+
+    def handle_enter():
+        form_state['show_error'] = False
+        current = form_state['current_field']
+        
+        if current.startswith('btn_'):
+            # Es un botón, ejecutar su acción
+            if current == 'btn_0' or 'submit' in current:
+                return _handle_submit(form_state, form_config)
+            elif current == 'btn_1' or 'cancel' in current:
+                return _handle_cancel(form_state)
+        else:
+            # Es un input, ir al siguiente campo
+            focus_next()
+        return False
+
+    def handle_escape():
+        return _handle_cancel(form_state)
+
+    keymap.bind(-301, handle_tab, scope=scope, priority=FORM_KEY_PRIORITY)  # TAB
+    keymap.bind([10, 13], handle_enter, scope=scope, priority=FORM_KEY_PRIORITY)  # ENTER
+    keymap.bind(-1, handle_escape, scope=scope, priority=FORM_KEY_PRIORITY)  # ESCAPE
+    for key_code, handler in form_config.get('key_handlers', {}).items():
+        keymap.bind(key_code, handler, scope=scope, priority=FORM_KEY_PRIORITY)
+    keymap.push_scope(scope)
+
+
 def _handle_submit(form_state, form_config):
     """Maneja el envío del formulario con validación"""
     validation_config = form_config.get('validation', {})
@@ -0,0 +1,156 @@
+"""
+Perfilador de render por widget con overlay en pantalla
+"""
+import functools
+import os
+import sys
+import time
+from collections import deque
+
+from asciimatics.event import KeyboardEvent
+from asciimatics.screen import Screen
+
+from .retained import get_retained_renderer
+
+
+class RenderProfiler:
+    """
+    Mide cuántas veces se llama cada función print_* y cuánto tiempo acumula,
+    agrupando por sitio de llamada (archivo y línea).
+
+    Mientras está desactivado, cada función envuelta solo paga una comprobación
+    de 'enabled'. Al activarlo (con la tecla 'hotkey' dentro de un FrameLoop o
+    con 'toggle()') se dibuja un overlay con los sitios más costosos y los FPS.
+
+    El tiempo de cada sitio es inclusivo: el de un print_card incluye los
+    print_text y print_button que dibuja dentro.
+    """
+
+    def __init__(self, hotkey: int = Screen.KEY_F12, top: int = 8):
+        """
+        Inicializa el perfilador.
+
+        Args:
+            hotkey (int): Código de la tecla que muestra u oculta el overlay.
+            top (int): Número de sitios que se muestran en el overlay.
+        """
+        self.enabled = False
+        self.hotkey = hotkey
+        self.top = top
+        # (función, archivo, línea) -> [llamadas, segundos acumulados]
+        self._stats = {}
+        self._frames = deque(maxlen=60)
+        self._overlay_size = None
+
+    def profiled(self, func):
+        """Decorador que registra las llamadas a una función print_*."""
+        name = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            caller = sys._getframe(1)
+            site = (name, caller.f_code.co_filename, caller.f_lineno)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                entry = self._stats.get(site)
+                if entry is None:
+                    self._stats[site] = [1, elapsed]
+                else:
+                    entry[0] += 1
+                    entry[1] += elapsed
+        return wrapper
+
+    def toggle(self) -> None:
+        """Activa o desactiva la medición y el overlay."""
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.reset()
+
+    def reset(self) -> None:
+        """Descarta las mediciones acumuladas."""
+        self._stats.clear()
+        self._frames.clear()
+
+    def handle_event(self, event) -> bool:
+        """Alterna el perfilador si el evento es la tecla configurada."""
+        if isinstance(event, KeyboardEvent) and event.key_code == self.hotkey:
+            self.toggle()
+            return True
+        return False
+
+    def fps(self) -> float:
+        """Frames por segundo de los últimos frames registrados."""
+        if len(self._frames) < 2:
+            return 0.0
+        elapsed = self._frames[-1] - self._frames[0]
+        return (len(self._frames) - 1) / elapsed if elapsed > 0 else 0.0
+
+    def report(self, limit: int | None = None) -> list:
+        """
+        Retorna los sitios de llamada ordenados por tiempo acumulado.
+
+        Args:
+            limit (int | None): Número máximo de sitios.
+
+        Returns:
+            list: Diccionarios con 'function', 'site', 'calls', 'total_ms' y 'avg_ms'.
+        """
+        rows = sorted(self._stats.items(), key=lambda item: item[1][1], reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+        return [
+            {
+                'function': name,
+                'site': f"{os.path.basename(filename)}:{line}",
+                'calls': calls,
+                'total_ms': total * 1000,
+                'avg_ms': total * 1000 / calls
+            }
+            for (name, filename, line), (calls, total) in rows
+        ]
+
+    def end_frame(self, screen) -> None:
+        """
+        Registra el fin de un frame y dibuja el overlay si está activo.
+
+        Args:
+            screen: Pantalla donde se dibuja el overlay.
+        """
+        if not self.enabled:
+            if self._overlay_size is not None:
+                self._erase_overlay(screen)
+            return
+        self._frames.append(time.perf_counter())
+        lines = [f" PERFIL  {self.fps():5.1f} FPS  (F12 para ocultar) "]
+        for row in self.report(self.top):
+            lines.append(
+                f" {row['function']:<12} {row['site']:<28} {row['calls']:>7}x "
+                f"{row['total_ms']:>9.1f}ms {row['avg_ms']:>7.3f}ms "
+            )
+        width = max(len(line) for line in lines)
+        if self._overlay_size is not None and (
+            self._overlay_size[0] > width or self._overlay_size[1] > len(lines)
+        ):
+            self._erase_overlay(screen)
+        for idx, line in enumerate(lines):
+            screen.print_at(line.ljust(width), 0, idx, colour=Screen.COLOUR_BLACK, bg=Screen.COLOUR_YELLOW)
+        self._overlay_size = (width, len(lines))
+
+    def _erase_overlay(self, screen) -> None:
+        width, height = self._overlay_size
+        for idx in range(height):
+            screen.print_at(' ' * width, 0, idx)
+        self._overlay_size = None
+        # En modo retenido, los widgets que estaban debajo no se redibujarían solos
+        renderer = get_retained_renderer(screen)
+        if renderer is not None:
+            renderer.invalidate_area(0, 0, width, height)
+
+
+# Perfilador global usado por las funciones print_*
+render_profiler = RenderProfiler()
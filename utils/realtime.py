@@ -0,0 +1,234 @@
+"""
+Canal de snapshots entre los listeners en tiempo real y el bucle de render
+"""
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+from .frame_loop import wake_frame_loop
+
+# Estado publicado por un listener: 'version' crece en cada publicación y 'data' es inmutable
+Snapshot = namedtuple('Snapshot', ['version', 'data'])
+
+
+def freeze(value):
+    """
+    Retorna una copia inmutable de un valor (diccionarios, listas y conjuntos anidados).
+
+    Los diccionarios pasan a ser MappingProxyType y las listas, tuplas, así que
+    se siguen leyendo igual ('data["jugadores"][0]', 'len(...)', 'in').
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+class SnapshotChannel:
+    """
+    Entrega el último estado recibido por un listener al bucle de render.
+
+    El listener (que corre en su propio hilo) arma un snapshot inmutable nuevo
+    y lo intercambia de forma atómica por el anterior; el bucle de render toma
+    siempre un snapshot completo, nunca un estado a medio actualizar. Cada
+    publicación incrementa la versión y despierta al FrameLoop, así la pantalla
+    solo tiene que rehacer su estado cuando la versión cambia.
+
+    Ejemplo de uso:
+        canal = SnapshotChannel()
+
+        def mi_callback(doc_data, changes, read_time):  # Hilo del listener
+            canal.publish(doc_data)
+
+        version = None
+        while True:
+            event = loop.next_event()
+            snapshot = canal.poll(version)
+            if snapshot is not None:  # Llegó una versión nueva
+                version = snapshot.version
+                ...  # actualizar el estado de la pantalla con snapshot.data
+    """
+
+    def __init__(self, initial=None, wake=wake_frame_loop):
+        """
+        Inicializa el canal.
+
+        Args:
+            initial: Datos de la versión 0, mientras no llegue nada del listener.
+            wake (callable | None): Función que despierta el bucle de render al publicar.
+        """
+        self._lock = threading.Lock()
+        self._snapshot = Snapshot(0, freeze(initial))
+        self._wake = wake
+
+    def publish(self, data) -> int:
+        """
+        Publica un estado nuevo. Es seguro llamarla desde cualquier hilo.
+
+        Args:
+            data: Datos recibidos; se copian a una estructura inmutable.
+
+        Returns:
+            int: Versión del snapshot publicado.
+        """
+        # El snapshot nuevo se arma fuera del lock; solo el intercambio es exclusivo
+        return self._swap(freeze(data))
+
+    def _swap(self, frozen) -> int:
+        """Intercambia el snapshot actual por uno con datos ya inmutables."""
+        with self._lock:
+            snapshot = Snapshot(self._snapshot.version + 1, frozen)
+            self._snapshot = snapshot
+        if self._wake is not None:
+            self._wake()
+        return snapshot.version
+
+    def latest(self) -> Snapshot:
+        """Retorna el último snapshot publicado."""
+        return self._snapshot
+
+    def poll(self, version):
+        """
+        Retorna el último snapshot si es distinto de 'version', o None si no hay nada nuevo.
+
+        Args:
+            version (int | None): Última versión que procesó el consumidor (None la primera vez).
+        """
+        snapshot = self._snapshot
+        return snapshot if snapshot.version != version else None
+
+    @property
+    def version(self) -> int:
+        """Versión del último snapshot publicado."""
+        return self._snapshot.version
+
+
+_MISSING = object()
+
+
+class DocumentMirror:
+    """
+    Copia local de un documento en tiempo real que aplica los cambios campo a campo.
+
+    'apply' tiene la firma de los callbacks de 'add_realtime_listener'
+    (doc_data, changes, read_time) y corre en el hilo del listener: compara
+    cada campo de primer nivel con la copia local, anota en qué versión cambió
+    y publica el estado por un SnapshotChannel. Firestore entrega los cambios
+    por documento, no por campo, así que los deltas se calculan comparando;
+    'read_time' sirve para descartar snapshots que lleguen desordenados.
+
+    En el hilo del render, 'poll()' toma el último estado, retorna los campos
+    que cambiaron desde el 'poll()' anterior (aunque hayan llegado varios
+    snapshots entre dos frames) y llama a los handlers registrados con
+    'on_change' para esos campos. Así una pantalla solo rehace el tablero o la
+    etiqueta que cambió.
+
+    Ejemplo de uso:
+        sala = DocumentMirror()
+        sala.on_change('mesa_jugador_0', lambda mesa: actualizar_dados(tablero_1, mesa or ()))
+        unsubscribe = add_realtime_listener('salas_de_juego_activas', id_sala, sala.apply, on_error)
+
+        while True:
+            event = loop.next_event()
+            cambios = sala.poll()  # frozenset con los campos que cambiaron
+            turno = sala.get('turnoActivo', '')
+    """
+
+    def __init__(self, wake=wake_frame_loop):
+        """
+        Inicializa el espejo vacío (documento inexistente).
+
+        Args:
+            wake (callable | None): Función que despierta el bucle de render cuando algo cambia.
+        """
+        # Estado publicado: (existe, campos, versión en la que cambió cada campo)
+        self._channel = SnapshotChannel((False, {}, {}), wake)
+        self._lock = threading.Lock()
+        self._read_time = None
+        # Estado visto por el hilo del render en el último 'poll()'
+        self._exists, self._fields, _ = self._channel.latest().data
+        self._seen_version = 0
+        self._handlers = {}
+
+    def apply(self, doc_data, changes=None, read_time=None) -> frozenset:
+        """
+        Aplica un snapshot del documento. Es seguro llamarla desde el hilo del listener.
+
+        Args:
+            doc_data (dict | None): Documento completo, o None si fue eliminado.
+            changes: Cambios reportados por el listener (se aceptan por compatibilidad).
+            read_time: Momento de lectura; los snapshots más viejos que el último se descartan.
+
+        Returns:
+            frozenset: Campos que cambiaron respecto de la copia local.
+        """
+        with self._lock:
+            if read_time is not None and self._read_time is not None and read_time < self._read_time:
+                return frozenset()
+            if read_time is not None:
+                self._read_time = read_time
+            previous_exists, previous_fields, previous_versions = self._channel.latest().data
+            fields = {key: freeze(value) for key, value in (doc_data or {}).items()}
+            changed = {key for key, value in fields.items() if previous_fields.get(key, _MISSING) != value}
+            changed.update(key for key in previous_fields if key not in fields)
+            exists = doc_data is not None
+            if not changed and exists == previous_exists:
+                return frozenset()
+            # Versión en la que cambió cada campo (incluidos los eliminados)
+            version = self._channel.version + 1
+            versions = dict(previous_versions)
+            for key in changed:
+                versions[key] = version
+            self._channel._swap((exists, MappingProxyType(fields), MappingProxyType(versions)))
+        return frozenset(changed)
+
+    def on_change(self, field: str, handler) -> None:
+        """
+        Registra una función que 'poll()' llama con el valor nuevo cuando cambia un campo.
+
+        Args:
+            field (str): Campo de primer nivel (por ejemplo 'turnoActivo').
+            handler (callable): Recibe el valor nuevo, o None si el campo se eliminó.
+        """
+        self._handlers.setdefault(field, []).append(handler)
+
+    def poll(self) -> frozenset:
+        """
+        Toma el último estado publicado desde el hilo del render.
+
+        Returns:
+            frozenset: Campos que cambiaron desde el 'poll()' anterior.
+        """
+        snapshot = self._channel.latest()
+        if snapshot.version == self._seen_version:
+            return frozenset()
+        exists, fields, versions = snapshot.data
+        changed = frozenset(key for key, version in versions.items() if version > self._seen_version)
+        self._exists, self._fields = exists, fields
+        self._seen_version = snapshot.version
+        for key in changed:
+            for handler in self._handlers.get(key, ()):
+                handler(fields.get(key))
+        return changed
+
+    @property
+    def exists(self) -> bool:
+        """Si el documento existía en el último 'poll()'."""
+        return self._exists
+
+    @property
+    def data(self):
+        """Campos del documento en el último 'poll()' (solo lectura), o None si no existe."""
+        return self._fields if self._exists else None
+
+    @property
+    def version(self) -> int:
+        """Versión vista en el último 'poll()'."""
+        return self._seen_version
+
+    def get(self, field: str, default=None):
+        """Valor de un campo en el último 'poll()'."""
+        return self._fields.get(field, default)
@@ -0,0 +1,175 @@
+"""
+Modo retenido para las funciones print_*: solo se redibujan las celdas que cambian
+"""
+import weakref
+
+
+class RetainedRenderer:
+    """
+    Renderizador en modo retenido.
+
+    Cada widget se identifica con una clave estable ('key' en el diccionario de
+    datos de print_text, print_button o print_card). Se guarda lo que se dibujó
+    en el frame anterior y, si el widget no cambió, no se llama a
+    'screen.print_at'. Si cambió, solo se envían los tramos de cada línea que
+    son distintos.
+    """
+
+    def __init__(self):
+        # clave -> (hash, firma) donde firma = (líneas, x, y, color, fondo, tramos)
+        self._widgets = {}
+        self._drawn = set()
+        self.skipped = 0
+        self.updated = 0
+
+    def draw(self, screen, key, lines, x: int, y: int, colour: int, bg=None, block=None) -> None:
+        """
+        Dibuja un widget comparándolo con su versión del frame anterior.
+
+        Args:
+            screen: Pantalla donde se dibuja.
+            key: Clave estable del widget.
+            lines (iterable): Líneas de texto del widget.
+            x (int): Posición X.
+            y (int): Posición Y.
+            colour (int): Color del texto.
+            bg (int | None): Color de fondo.
+            block (TextBlock | None): Bloque de origen, si tiene tramos de color propios.
+        """
+        runs = block.runs if block is not None else None
+        signature = (tuple(lines), x, y, colour, bg, runs)
+        signature_hash = hash(signature)
+        self._drawn.add(key)
+        previous = self._widgets.get(key)
+        if previous is not None and previous[0] == signature_hash and previous[1] == signature:
+            self.skipped += 1
+            return
+
+        self.updated += 1
+        self._widgets[key] = (signature_hash, signature)
+        if runs is None and previous is not None and previous[0] is not None and previous[1][1:] == signature[1:]:
+            # Misma posición y colores: solo se envían los tramos que cambiaron
+            self._draw_diff(screen, previous[1][0], signature[0], x, y, colour, bg)
+            return
+
+        if previous is not None:
+            self._erase(screen, previous[1])
+        if runs is not None:
+            for idx in range(block.height):
+                for offset, segment, seg_colour, seg_bg in block.segments(idx, colour, bg):
+                    self._print(screen, segment, x + offset, y + idx, seg_colour, seg_bg)
+            return
+        for idx, line in enumerate(signature[0]):
+            self._print(screen, line, x, y + idx, colour, bg)
+
+    def _draw_diff(self, screen, old_lines, new_lines, x, y, colour, bg) -> None:
+        """Envía a la pantalla solo las celdas distintas entre dos versiones."""
+        for idx in range(max(len(old_lines), len(new_lines))):
+            old = old_lines[idx] if idx < len(old_lines) else ''
+            new = new_lines[idx] if idx < len(new_lines) else ''
+            if old == new:
+                continue
+            # Prefijo común
+            start = 0
+            limit = min(len(old), len(new))
+            while start < limit and old[start] == new[start]:
+                start += 1
+            # Sufijo común (solo si las líneas miden lo mismo)
+            end = len(new)
+            if len(old) == len(new):
+                while end > start and old[end - 1] == new[end - 1]:
+                    end -= 1
+            segment = new[start:end]
+            if segment:
+                self._print(screen, segment, x + start, y + idx, colour, bg)
+            if len(old) > len(new):
+                # Borrar el sobrante de la línea anterior
+                screen.print_at(' ' * (len(old) - len(new)), x + len(new), y + idx)
+
+    def _erase(self, screen, signature) -> None:
+        """Borra las celdas que ocupaba un widget."""
+        lines, x, y = signature[0], signature[1], signature[2]
+        for idx, line in enumerate(lines):
+            if line:
+                screen.print_at(' ' * len(line), x, y + idx)
+
+    @staticmethod
+    def _print(screen, text, x, y, colour, bg) -> None:
+        if bg is not None:
+            screen.print_at(text, x, y, colour=colour, bg=bg)
+        else:
+            screen.print_at(text, x, y, colour=colour)
+
+    def end_frame(self, screen) -> None:
+        """
+        Cierra el frame actual: borra los widgets que no se dibujaron en él.
+
+        Args:
+            screen: Pantalla donde se dibujaron los widgets.
+        """
+        for key in [key for key in self._widgets if key not in self._drawn]:
+            self._erase(screen, self._widgets.pop(key)[1])
+        self._drawn.clear()
+
+    def invalidate(self) -> None:
+        """Olvida todo lo dibujado. Usar después de 'screen.clear()'."""
+        self._widgets.clear()
+        self._drawn.clear()
+
+    def invalidate_area(self, x: int, y: int, width: int, height: int) -> None:
+        """
+        Obliga a redibujar completos los widgets que tocan un área pisada desde
+        fuera del renderizador (por ejemplo, al borrar el overlay del perfilador).
+
+        Los widgets se siguen recordando, así que si dejan de dibujarse se borran
+        igual en 'end_frame'.
+        """
+        for key, (signature_hash, signature) in self._widgets.items():
+            lines, left, top = signature[0], signature[1], signature[2]
+            right = left + max((len(line) for line in lines), default=0)
+            if left < x + width and x < right and top < y + height and y < top + len(lines):
+                self._widgets[key] = (None, signature)
+
+    def stats(self) -> dict:
+        """Retorna cuántos dibujados se omitieron y cuántos se actualizaron."""
+        return {
+            'skipped': self.skipped,
+            'updated': self.updated,
+            'widgets': len(self._widgets)
+        }
+
+
+# Renderizador activo por pantalla
+_renderers = weakref.WeakKeyDictionary()
+
+
+def enable_retained_mode(screen) -> RetainedRenderer:
+    """
+    Activa el modo retenido en una pantalla.
+
+    Siempre crea un renderizador nuevo, por lo que debe llamarse después de
+    'screen.clear()' al entrar en una pantalla.
+
+    Args:
+        screen: Pantalla de asciimatics.
+
+    Returns:
+        RetainedRenderer: El renderizador asociado a la pantalla.
+    """
+    renderer = RetainedRenderer()
+    _renderers[screen] = renderer
+    return renderer
+
+
+def disable_retained_mode(screen) -> None:
+    """Desactiva el modo retenido en una pantalla."""
+    _renderers.pop(screen, None)
+
+
+def get_retained_renderer(screen):
+    """Retorna el renderizador retenido de la pantalla o None si no está activo."""
+    try:
+        return _renderers.get(screen)
+    except TypeError:
+        # Objetos que no admiten referencias débiles nunca tienen modo retenido
+        return None
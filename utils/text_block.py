@@ -0,0 +1,79 @@
+"""
+Bloques de texto precompilados para las funciones print_*
+"""
+
+
+class TextBlock:
+    """
+    Texto ya separado en líneas y medido.
+
+    Se construye una sola vez (por ejemplo, para botones o sprites constantes) y
+    se pasa como 'text' a print_text, print_button o print_card, que así no
+    tienen que volver a separar ni medir el contenido en cada frame.
+
+    Los 'runs' opcionales permiten colorear tramos de cada línea: es una
+    secuencia con un elemento por línea y cada elemento es una secuencia de
+    tramos (inicio, fin, color, fondo). El fondo puede ser None.
+
+    Ejemplo de uso:
+        boton = TextBlock('┌─────┐\\n│ OK  │\\n└─────┘')
+        print_button(screen, {'text': boton, 'x-center': 0, 'y-center': 0}, event, click)
+    """
+
+    __slots__ = ('lines', 'width', 'height', 'runs', '_hash')
+
+    def __init__(self, text, runs=None):
+        """
+        Args:
+            text (str | iterable): Texto con saltos de línea o secuencia de líneas.
+            runs (iterable | None): Tramos de color por línea (ver la documentación de la clase).
+        """
+        lines = tuple(text.split('\n')) if isinstance(text, str) else tuple(text)
+        self.lines = lines
+        self.height = len(lines)
+        self.width = max(map(len, lines)) if lines else 0
+        self.runs = tuple(tuple(tuple(run) for run in line_runs) for line_runs in runs) if runs else None
+        self._hash = hash((self.lines, self.runs))
+
+    def with_runs(self, runs) -> 'TextBlock':
+        """Retorna una copia del bloque con otros tramos de color."""
+        return TextBlock(self.lines, runs)
+
+    def segments(self, idx: int, colour: int, bg=None):
+        """
+        Divide una línea en tramos con su color.
+
+        Args:
+            idx (int): Índice de la línea.
+            colour (int): Color por defecto del texto.
+            bg (int | None): Fondo por defecto.
+
+        Returns:
+            list: Tuplas (desplazamiento, texto, color, fondo).
+        """
+        line = self.lines[idx]
+        line_runs = self.runs[idx] if self.runs is not None and idx < len(self.runs) else ()
+        if not line_runs:
+            return [(0, line, colour, bg)]
+        segments = []
+        position = 0
+        for start, end, run_colour, run_bg in sorted(line_runs):
+            if start > position:
+                segments.append((position, line[position:start], colour, bg))
+            segments.append((start, line[start:end], run_colour, run_bg if run_bg is not None else bg))
+            position = max(position, end)
+        if position < len(line):
+            segments.append((position, line[position:], colour, bg))
+        return segments
+
+    def __str__(self) -> str:
+        return '\n'.join(self.lines)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, TextBlock) and self.lines == other.lines and self.runs == other.runs
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"TextBlock(width={self.width}, height={self.height})"
@@ -0,0 +1,138 @@
+"""
+Pantalla virtual en memoria para medir y probar las funciones print_* sin terminal
+"""
+from collections import deque
+
+from asciimatics.screen import Screen
+
+
+class FrameLimitReached(RuntimeError):
+    """Se lanza cuando una pantalla virtual alcanza su número máximo de frames."""
+
+
+class VirtualScreen:
+    """
+    Pantalla de asciimatics simulada en memoria.
+
+    Implementa la parte de la interfaz de Screen que usan las utilidades y las
+    pantallas del cliente ('print_at', 'width', 'height', 'refresh', 'clear',
+    'get_event', 'get_from', 'mouse') y guarda el carácter y los colores de
+    cada celda. Los eventos de entrada se inyectan de antemano, por lo que una
+    pantalla completa (por ejemplo 'home') puede ejecutarse a miles de frames
+    por segundo.
+
+    Ejemplo de uso:
+        screen = VirtualScreen(120, 40, events=[KeyboardEvent(ord('f'))])
+        home(screen)
+        print('\\n'.join(screen.capture()['text']))
+    """
+
+    # Las pantallas virtuales no tienen terminal: FrameLoop nunca bloquea
+    headless = True
+
+    def __init__(self, width: int = 120, height: int = 40, events=None, max_frames: int | None = None):
+        """
+        Inicializa la pantalla virtual.
+
+        Args:
+            width (int): Ancho en columnas.
+            height (int): Alto en filas.
+            events (iterable | None): Eventos que retornará 'get_event' en orden.
+                Un None dentro de la secuencia simula un frame sin entrada.
+            max_frames (int | None): Si se indica, 'refresh' lanza FrameLimitReached
+                al superar ese número de frames (útil para pantallas sin salida).
+        """
+        self.width = width
+        self.height = height
+        self.mouse = False
+        self.max_frames = max_frames
+        self.frames = 0
+        self.print_calls = 0
+        self._events = deque(events or ())
+        self.clear()
+
+    @property
+    def dimensions(self) -> tuple:
+        """(alto, ancho), igual que en Screen."""
+        return self.height, self.width
+
+    def print_at(self, text, x: int, y: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False) -> None:
+        """Escribe un texto en la posición indicada, recortándolo a los bordes."""
+        self.print_calls += 1
+        if not 0 <= y < self.height:
+            return
+        text = str(text)
+        start = max(0, -x)
+        end = min(len(text), self.width - x)
+        if start >= end:
+            return
+        chars, fg, attrs, bgs = self._chars[y], self._fg[y], self._attr[y], self._bg[y]
+        if transparent:
+            for offset in range(start, end):
+                if text[offset] != ' ':
+                    column = x + offset
+                    chars[column] = text[offset]
+                    fg[column] = colour
+                    attrs[column] = attr
+                    bgs[column] = bg
+            return
+        x0, x1 = x + start, x + end
+        chars[x0:x1] = text[start:end]
+        fg[x0:x1] = [colour] * (x1 - x0)
+        attrs[x0:x1] = [attr] * (x1 - x0)
+        bgs[x0:x1] = [bg] * (x1 - x0)
+
+    def get_from(self, x: int, y: int):
+        """Retorna (código del carácter, color, atributo, fondo) de una celda o None."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return ord(self._chars[y][x]), self._fg[y][x], self._attr[y][x], self._bg[y][x]
+
+    def clear(self) -> None:
+        """Borra toda la pantalla."""
+        self._chars = [[' '] * self.width for _ in range(self.height)]
+        self._fg = [[Screen.COLOUR_WHITE] * self.width for _ in range(self.height)]
+        self._attr = [[0] * self.width for _ in range(self.height)]
+        self._bg = [[Screen.COLOUR_BLACK] * self.width for _ in range(self.height)]
+
+    def refresh(self) -> None:
+        """Cierra un frame."""
+        self.frames += 1
+        if self.max_frames is not None and self.frames > self.max_frames:
+            raise FrameLimitReached(f"Se alcanzó el límite de {self.max_frames} frames")
+
+    def get_event(self):
+        """Retorna el siguiente evento inyectado o None si no quedan."""
+        return self._events.popleft() if self._events else None
+
+    def feed_events(self, events) -> None:
+        """Agrega eventos al final de la cola de entrada."""
+        self._events.extend(events)
+
+    def has_resized(self) -> bool:
+        return False
+
+    def capture(self) -> dict:
+        """
+        Captura el contenido actual de la pantalla.
+
+        Returns:
+            dict: 'text' (lista de filas como texto), 'fg', 'bg' y 'attr'
+            (listas de filas con el valor de cada celda).
+        """
+        return {
+            'text': [''.join(row) for row in self._chars],
+            'fg': [list(row) for row in self._fg],
+            'bg': [list(row) for row in self._bg],
+            'attr': [list(row) for row in self._attr]
+        }
+
+    def __str__(self) -> str:
+        return '\n'.join(''.join(row).rstrip() for row in self._chars)
+
+
+# Mismas constantes de color y atributos que Screen
+for _name in dir(Screen):
+    if _name.startswith(('COLOUR_', 'A_', 'KEY_')):
+        setattr(VirtualScreen, _name, getattr(Screen, _name))
+del _name
@@ -0,0 +1,240 @@
+"""
+Cola de escritura diferida (write-behind) para el estado de las salas
+"""
+import asyncio
+import inspect
+import threading
+import time
+from collections import deque
+
+
+class WriteBehindQueue:
+    """
+    Agrupa las escrituras de estado y las envía en segundo plano.
+
+    'submit' solo guarda el último estado de cada clave (por ejemplo, el id de
+    la sala) y retorna de inmediato: los clics nunca esperan a la red. Un hilo
+    propio envía lo pendiente cuando vence 'interval' desde el primer cambio
+    sin enviar, o antes si se llama a 'flush()' (por ejemplo, al terminar la
+    ronda). Si en ese intervalo el estado cambió varias veces, solo se escribe
+    el último.
+
+    El 'writer' puede ser una función normal o una corrutina. Con 'runtime'
+    (por ejemplo, el NetworkRuntime global) las corrutinas corren en el loop de
+    red compartido; si no, en un event loop propio del hilo de la cola. Cada
+    escritura de una corrutina se corta a los 'write_timeout' segundos.
+
+    Una escritura que falla se vuelve a encolar hasta 'retries' veces, salvo
+    que ya haya un estado más nuevo de esa clave (que la reemplaza).
+
+    Ejemplo de uso:
+        async def escribir(sala_id, datos):
+            await servicio_sala.actualizar_sala_de_juego(sala_id, datos)
+
+        cola = WriteBehindQueue(escribir, interval=0.5)
+        cola.submit(sala_id, {'turno_actual': 1})  # No bloquea
+        cola.flush(wait=True)                      # Antes de eliminar la sala
+        cola.close()
+    """
+
+    def __init__(self, writer, interval: float = 0.5, name: str = 'write-behind', runtime=None,
+                 write_timeout: float = 10.0, retries: int = 2):
+        """
+        Inicializa la cola. El hilo se crea con el primer 'submit'.
+
+        Args:
+            writer (callable): Recibe (clave, datos); puede ser una corrutina.
+            interval (float): Segundos que se acumulan cambios antes de enviarlos.
+            name (str): Nombre del hilo de la cola.
+            runtime (NetworkRuntime | None): Runtime de red donde se ejecutan las corrutinas.
+            write_timeout (float | None): Segundos máximos de cada escritura (None: sin límite).
+            retries (int): Reintentos de una escritura fallida antes de descartarla.
+        """
+        self._writer = writer
+        self._runtime = runtime
+        self.interval = interval
+        self.name = name
+        self.write_timeout = write_timeout
+        self.retries = retries
+        self._pending = {}
+        # Clave -> reintentos ya usados por su último estado
+        self._attempts = {}
+        self._due = None
+        self._writing = False
+        self._closed = False
+        self._thread = None
+        self._condition = threading.Condition()
+        # Métricas
+        self._submitted = 0
+        self._coalesced = 0
+        self._writes = 0
+        self._errors = 0
+        self._retried = 0
+        self._dropped = 0
+        self._flushes = 0
+        self._latencies = deque(maxlen=100)
+        self.last_error = None
+
+    def submit(self, key, payload) -> None:
+        """
+        Guarda el último estado de una clave para enviarlo en segundo plano.
+
+        Args:
+            key: Clave del documento (por ejemplo, el id de la sala).
+            payload: Datos a escribir. No se deben modificar después de enviarlos.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("La cola de escritura está cerrada")
+            self._submitted += 1
+            if key in self._pending:
+                self._coalesced += 1
+            self._pending[key] = payload
+            self._attempts.pop(key, None)
+            if self._due is None:
+                self._due = time.monotonic() + self.interval
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, wait: bool = False, timeout: float = None) -> bool:
+        """
+        Envía lo pendiente sin esperar a que venza el intervalo.
+
+        Args:
+            wait (bool): Si es True, bloquea hasta que no quede nada pendiente ni en curso.
+            timeout (float | None): Segundos máximos de espera con 'wait'.
+
+        Returns:
+            bool: False si 'wait' venció antes de terminar.
+        """
+        with self._condition:
+            if self._pending:
+                self._due = time.monotonic()
+                self._condition.notify_all()
+            if not wait:
+                return True
+            return self._condition.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def discard(self, key) -> None:
+        """Descarta el estado pendiente de una clave (por ejemplo, de una sala eliminada)."""
+        with self._condition:
+            self._pending.pop(key, None)
+            self._attempts.pop(key, None)
+            if not self._pending:
+                self._due = None
+            self._condition.notify_all()
+
+    def close(self, timeout: float = None) -> None:
+        """
+        Envía lo pendiente y detiene el hilo de la cola.
+
+        Args:
+            timeout (float | None): Segundos máximos de espera; si vencen, el hilo
+                (daemon) termina lo pendiente por su cuenta.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        """
+        Retorna las métricas de la cola.
+
+        Returns:
+            dict: Estados recibidos, escrituras realizadas, estados descartados por
+            agrupación, errores, reintentos, estados perdidos tras agotar los
+            reintentos, envíos, pendientes y latencia de los envíos en
+            milisegundos (último, media y máximo de los últimos 100).
+        """
+        with self._condition:
+            latencies = list(self._latencies)
+            return {
+                'submitted': self._submitted,
+                'writes': self._writes,
+                'coalesced': self._coalesced,
+                'errors': self._errors,
+                'retried': self._retried,
+                'dropped': self._dropped,
+                'flushes': self._flushes,
+                'pending': len(self._pending),
+                'last_flush_ms': latencies[-1] if latencies else 0.0,
+                'mean_flush_ms': sum(latencies) / len(latencies) if latencies else 0.0,
+                'max_flush_ms': max(latencies) if latencies else 0.0
+            }
+
+    def _next_batch(self):
+        """Espera a que venza el intervalo (o a un flush) y retorna lo pendiente, o None al cerrar."""
+        with self._condition:
+            while True:
+                if self._pending:
+                    remaining = self._due - time.monotonic()
+                    if self._closed or remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                elif self._closed:
+                    return None
+                else:
+                    self._condition.wait()
+            batch, self._pending, self._due = self._pending, {}, None
+            self._writing = True
+            return batch
+
+    def _run(self) -> None:
+        loop = None if self._runtime is not None else asyncio.new_event_loop()
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+                start = time.perf_counter()
+                writes = errors = 0
+                failed = {}
+                for key, payload in batch.items():
+                    try:
+                        result = self._writer(key, payload)
+                        if inspect.isawaitable(result):
+                            result = asyncio.wait_for(result, self.write_timeout)
+                            if loop is None:
+                                self._runtime.run(result, self.write_timeout)
+                            else:
+                                loop.run_until_complete(result)
+                        writes += 1
+                    except Exception as e:
+                        errors += 1
+                        self.last_error = e
+                        failed[key] = payload
+                elapsed = (time.perf_counter() - start) * 1000
+                with self._condition:
+                    self._writes += writes
+                    self._errors += errors
+                    for key in batch:
+                        if key not in failed:
+                            self._attempts.pop(key, None)
+                    self._requeue(failed)
+                    self._flushes += 1
+                    self._latencies.append(elapsed)
+                    self._writing = False
+                    self._condition.notify_all()
+        finally:
+            if loop is not None:
+                loop.close()
+
+    def _requeue(self, failed) -> None:
+        """Vuelve a encolar las escrituras fallidas sin un estado más nuevo (con el lock tomado)."""
+        for key, payload in failed.items():
+            if key in self._pending:
+                continue  # El estado nuevo reemplaza al que falló
+            attempts = self._attempts.get(key, 0)
+            if attempts >= self.retries:
+                self._attempts.pop(key, None)
+                self._dropped += 1
+                continue
+            self._attempts[key] = attempts + 1
+            self._retried += 1
+            self._pending[key] = payload
+            if self._due is None:
+                self._due = time.monotonic() + self.interval